@@ -18,9 +18,13 @@ import random
 import heapq
 from typing import Dict, List, Tuple, Optional
 import time
-import pygame
 import numpy as np
 
+# Sorting steps are shared with the PySide6 app; they run in delta mode so
+# every step carries only the cells it changed instead of a full copy
+from algorithms.sorting import (insertion_steps, bubble_steps, selection_steps,
+                                merge_steps, quick_steps, apply_delta)
+
 # ----------- Utilities & Data Structures -----------
 
 class NodeBST:
@@ -197,106 +201,6 @@ def dfs_steps(graph: GraphType, start: str, goal: str):
     yield ("notfound", None)
 
 
-# ----------- Sorting steps (insertion, bubble, selection, merge, quick) ----------
-def insertion_steps(arr: List[int]):
-    a = list(arr)
-    n = len(a)
-    for i in range(1, n):
-        key = a[i]
-        j = i - 1
-        yield ("key", i, list(a))
-        while j >= 0 and a[j] > key:
-            yield ("compare", j, j + 1, list(a))
-            a[j + 1] = a[j]
-            yield ("shift", j + 1, list(a))
-            j -= 1
-        a[j + 1] = key
-        yield ("insert", j + 1, list(a))
-    yield ("done", list(a))
-
-def bubble_steps(arr: List[int]):
-    a = list(arr)
-    n = len(a)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            yield ("compare", j, j+1, list(a))
-            if a[j] > a[j+1]:
-                a[j], a[j+1] = a[j+1], a[j]
-                yield ("swap", j, j+1, list(a))
-    yield ("done", list(a))
-
-def selection_steps(arr: List[int]):
-    a = list(arr)
-    n = len(a)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            yield ("compare", min_idx, j, list(a))
-            if a[j] < a[min_idx]:
-                min_idx = j
-        if min_idx != i:
-            a[i], a[min_idx] = a[min_idx], a[i]
-            yield ("swap", i, min_idx, list(a))
-    yield ("done", list(a))
-
-def merge_steps(arr: List[int]):
-    a = list(arr)
-    n = len(a)
-    curr_size = 1
-    while curr_size < n:
-        left_start = 0
-        while left_start < n - 1:
-            mid = min(left_start + curr_size - 1, n - 1)
-            right_end = min(left_start + 2 * curr_size - 1, n - 1)
-            yield ("merge", left_start, mid, right_end, list(a))
-            temp = [0] * (right_end - left_start + 1)
-            i = left_start
-            j = mid + 1
-            k = 0
-            while i <= mid and j <= right_end:
-                yield ("compare", i, j, list(a))
-                if a[i] <= a[j]:
-                    temp[k] = a[i]
-                    i += 1
-                else:
-                    temp[k] = a[j]
-                    j += 1
-                k += 1
-            while i <= mid:
-                temp[k] = a[i]
-                i += 1
-                k += 1
-            while j <= right_end:
-                temp[k] = a[j]
-                j += 1
-                k += 1
-            for m in range(len(temp)):
-                a[left_start + m] = temp[m]
-            yield ("merged", left_start, right_end, list(a))
-            left_start += 2 * curr_size
-        curr_size *= 2
-    yield ("done", list(a))
-
-def quick_steps(arr: List[int]):
-    a = list(arr)
-    def qs(a, l, r):
-        if l >= r:
-            return
-        pivot = a[r]
-        i = l
-        for j in range(l, r):
-            yield ("compare", j, r, list(a))
-            if a[j] < pivot:
-                a[i], a[j] = a[j], a[i]
-                yield ("swap", i, j, list(a))
-                i += 1
-        a[i], a[r] = a[r], a[i]
-        yield ("swap", i, r, list(a))
-        yield from qs(a, l, i-1)
-        yield from qs(a, i+1, r)
-    yield from qs(a, 0, len(a)-1)
-    yield ("done", a)
-
 # ----------- Expression conversions (infix <-> postfix/prefix) ----------
 def infix_to_postfix_steps(expr: str) -> Tuple[str, List[str]]:
     prec = {'+':1, '-':1, '*':2, '/':2, '^':3}
@@ -1055,6 +959,14 @@ def _post(self, node, arr):
         # state
         self._sort_gen = None
         self._sort_arr = []
+        self._sort_job = None
+
+    def _cancel_sort(self):
+        """Stop a running full animation and drop any stepped sort"""
+        if self._sort_job is not None:
+            self.root.after_cancel(self._sort_job)
+            self._sort_job = None
+        self._sort_gen = None
 
     def sort_step(self):
         s = self.sort_entry.get().strip()
@@ -1063,17 +975,19 @@ def _post(self, node, arr):
             return
         arr = [int(x.strip()) for x in s.split(",") if x.strip()]
         if self._sort_gen is None:
+            # _sort_arr is about to be replaced; a full run must not keep using it
+            self._cancel_sort()
             algo = self.sort_algo.get()
             if algo == "Insertion":
-                self._sort_gen = insertion_steps(arr)
+                self._sort_gen = insertion_steps(arr, delta=True)
             elif algo == "Bubble":
-                self._sort_gen = bubble_steps(arr)
+                self._sort_gen = bubble_steps(arr, delta=True)
             elif algo == "Selection":
-                self._sort_gen = selection_steps(arr)
+                self._sort_gen = selection_steps(arr, delta=True)
             elif algo == "Merge":
-                self._sort_gen = merge_steps(arr)
+                self._sort_gen = merge_steps(arr, delta=True)
             else:
-                self._sort_gen = quick_steps(arr)
+                self._sort_gen = quick_steps(arr, delta=True)
             self._sort_arr = list(arr)
             self._draw_sort_array(self._sort_arr, [])
         try:
@@ -1090,28 +1004,30 @@ def _post(self, node, arr):
         arr = [int(x.strip()) for x in s.split(",") if x.strip()]
         algo = self.sort_algo.get()
         if algo == "Insertion":
-            gen = insertion_steps(arr)
+            gen = insertion_steps(arr, delta=True)
         elif algo == "Bubble":
-            gen = bubble_steps(arr)
+            gen = bubble_steps(arr, delta=True)
         elif algo == "Selection":
-            gen = selection_steps(arr)
+            gen = selection_steps(arr, delta=True)
         elif algo == "Merge":
-            gen = merge_steps(arr)
+            gen = merge_steps(arr, delta=True)
         else:
-            gen = quick_steps(arr)
+            gen = quick_steps(arr, delta=True)
+        self._cancel_sort()
+        self._sort_arr = list(arr)
         # run to completion with animation
         def run_next(g):
             try:
                 step = next(g)
                 self._handle_sort_step(step)
-                self.root.after(220, lambda: run_next(g))
+                self._sort_job = self.root.after(220, lambda: run_next(g))
             except StopIteration:
-                pass
+                self._sort_job = None
         run_next(gen)
 
     def _handle_sort_step(self, step):
         typ = step[0]
-        arr = step[-1]
+        arr = apply_delta(self._sort_arr, step[-1])
         highlights = []
         if typ == "compare":
             highlights = [step[1], step[2]]
@@ -6,9 +6,24 @@ from .sorting import (
     bubble_steps,
     selection_steps,
     merge_steps,
-    quick_steps
+    quick_steps,
+    heap_steps,
+    shell_steps,
+    tim_steps,
+    counting_steps,
+    counting_span_limit,
+    radix_lsd_steps,
+    radix_msd_steps,
+    bucket_steps,
+    apply_delta,
+    replay_steps,
+    SORTING_ALGORITHMS
 )
-from .searching import bfs_steps, dfs_steps
+from .trace import StepTrace, record_trace
+from .timeline import Timeline
+from .precompute import TraceService, precompute_traces
+from .searching import (bfs_steps, dfs_steps, ucs_steps, astar_steps, bst_descent_steps,
+                        bst_bfs_steps, bst_dfs_steps, bst_iddfs_steps, BST_SEARCHES)
 from .traversals import get_traversal_code
 from .expressions import (
     infix_to_postfix_steps,
@@ -19,7 +34,12 @@ from .expressions import (
 
 __all__ = [
     'insertion_steps', 'bubble_steps', 'selection_steps', 'merge_steps', 'quick_steps',
-    'bfs_steps', 'dfs_steps',
+    'heap_steps', 'shell_steps', 'tim_steps', 'counting_steps', 'radix_lsd_steps',
+    'radix_msd_steps', 'bucket_steps', 'counting_span_limit',
+    'apply_delta', 'replay_steps', 'SORTING_ALGORITHMS',
+    'StepTrace', 'record_trace', 'Timeline', 'TraceService', 'precompute_traces',
+    'bfs_steps', 'dfs_steps', 'ucs_steps', 'astar_steps',
+    'bst_descent_steps', 'bst_bfs_steps', 'bst_dfs_steps', 'bst_iddfs_steps', 'BST_SEARCHES',
     'get_traversal_code',
     'infix_to_postfix_steps', 'infix_to_prefix_steps', 'eval_postfix_steps', 'tokenize_expr'
 ]
@@ -0,0 +1,126 @@
+"""
+Operation counting for the step generators
+Wraps any sorting or searching step generator and tallies comparisons,
+swaps, writes, enqueues and visits, plus the time spent producing each
+step type, so consumers do not have to parse step tuples themselves
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+import math
+import time
+
+
+class OpCounters:
+    """Running operation counts for one generator run"""
+
+    def __init__(self):
+        self.steps = 0
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.enqueues = 0
+        self.visits = 0
+        # Seconds spent inside the generator, by step type
+        self.phase_time: Dict[str, float] = {}
+
+    def record(self, step: Tuple[Any, ...], elapsed: float = 0.0):
+        """Count one step"""
+        typ = step[0]
+        self.steps += 1
+        if typ == "compare":
+            self.comparisons += 1
+        elif typ == "swap":
+            self.swaps += 1
+            self.writes += 2
+        elif typ in ("shift", "insert", "place"):
+            self.writes += 1
+        elif typ == "merged":
+            self.writes += step[2] - step[1] + 1
+        elif typ in ("enqueue", "push"):
+            self.enqueues += 1
+        elif typ == "visit":
+            self.visits += 1
+        if elapsed:
+            self.phase_time[typ] = self.phase_time.get(typ, 0.0) + elapsed
+
+    @property
+    def elapsed(self) -> float:
+        """Total seconds spent inside the generator"""
+        return sum(self.phase_time.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counters as a plain dict"""
+        return {
+            "steps": self.steps,
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "writes": self.writes,
+            "enqueues": self.enqueues,
+            "visits": self.visits,
+            "phase_time": dict(self.phase_time),
+        }
+
+    def summary(self) -> str:
+        """One-line summary of the sorting counters"""
+        return (f"Steps: {self.steps}  Comparisons: {self.comparisons}  "
+                f"Swaps: {self.swaps}  Writes: {self.writes}")
+
+
+class Instrumented:
+    """Iterator wrapper that forwards steps and counts them in `counters`"""
+
+    def __init__(self, steps: Iterable[Tuple[Any, ...]], timed: bool = True):
+        self._it = iter(steps)
+        self.timed = timed
+        self.counters = OpCounters()
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return self
+
+    def __next__(self) -> Tuple[Any, ...]:
+        if self.timed:
+            t0 = time.perf_counter()
+            step = next(self._it)
+            self.counters.record(step, time.perf_counter() - t0)
+        else:
+            step = next(self._it)
+            self.counters.record(step)
+        return step
+
+
+def instrument(steps: Iterable[Tuple[Any, ...]], timed: bool = True) -> Instrumented:
+    """
+    Wrap a step generator with operation counters
+
+    Args:
+        steps: Generator from algorithms.sorting or algorithms.searching
+        timed: Also time each step (adds two clock reads per step)
+
+    Returns:
+        Iterator yielding the same steps; read `.counters` at any time
+    """
+    return Instrumented(steps, timed)
+
+
+# Theoretical growth of the comparison/write count for each sorting algorithm
+COMPLEXITY: Dict[str, Tuple[str, Callable[[int], float]]] = {}
+_N2 = ("n^2", lambda n: n * n)
+_NLOGN = ("n log n", lambda n: n * math.log2(n) if n > 1 else 1)
+_N = ("n", lambda n: n)
+for _name in ("Insertion", "Bubble", "Selection"):
+    COMPLEXITY[_name] = _N2
+for _name in ("Merge", "Quick", "Heap", "Tim"):
+    COMPLEXITY[_name] = _NLOGN
+for _name in ("Shell", "Shell (Knuth)", "Shell (Sedgewick)"):
+    COMPLEXITY[_name] = ("n^1.5", lambda n: n ** 1.5)
+for _name in ("Counting", "Radix (LSD)", "Radix (MSD)", "Bucket"):
+    COMPLEXITY[_name] = _N
+
+
+def complexity_ratio(name: str, n: int, counters: OpCounters) -> float:
+    """
+    Ratio of measured operations (comparisons + writes) to the theoretical
+    bound for the algorithm; roughly constant across n when the algorithm
+    behaves as expected
+    """
+    _, bound = COMPLEXITY[name]
+    return (counters.comparisons + counters.writes) / max(bound(n), 1)
@@ -0,0 +1,117 @@
+"""
+Parallel trace precomputation
+Records the traces of several sorting algorithms on the same input in worker
+processes, so comparing algorithms uses every core instead of running the
+generators one after another on the GUI thread. Traces travel back as the
+compressed bytes of ``StepTrace.to_bytes``.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+import multiprocessing
+
+from .sorting import SORTING_ALGORITHMS
+from .trace import StepTrace, record_trace
+
+
+def trace_bytes(name: str, arr: Sequence[int]) -> bytes:
+    """
+    Record one algorithm's trace and serialize it (runs in a worker process)
+
+    Args:
+        name: Key of SORTING_ALGORITHMS
+        arr: Input array
+
+    Returns:
+        The trace as compressed .npz bytes
+    """
+    return record_trace(SORTING_ALGORITHMS[name], arr).to_bytes()
+
+
+def export_trace_file(name: str, arr: Sequence[int], path: str) -> Dict[str, int]:
+    """
+    Record one algorithm's trace and write it to a file (runs in a worker process)
+
+    Args:
+        name: Key of SORTING_ALGORITHMS
+        arr: Input array
+        path: Output file; .npz saves the archive, anything else writes CSV
+
+    Returns:
+        Op counts of the trace plus its length under "steps"
+    """
+    trace = record_trace(SORTING_ALGORITHMS[name], arr)
+    if path.endswith(".npz"):
+        trace.save(path)
+    else:
+        trace.to_csv(path)
+    return {"steps": len(trace), **trace.counts()}
+
+
+class TraceService:
+    """
+    Process pool that records sorting traces in the background
+
+    The pool is created on first use and reused across requests. Workers are
+    spawned rather than forked so they never inherit GUI state.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, names: Iterable[str], arr: Sequence[int]) -> Dict[str, Future]:
+        """
+        Start recording traces for several algorithms on the same input
+
+        Returns:
+            Dict of algorithm name -> Future resolving to the trace bytes
+        """
+        arr = list(arr)
+        pool = self._ensure_pool()
+        return {name: pool.submit(trace_bytes, name, arr) for name in names}
+
+    def submit_export(self, name: str, arr: Sequence[int], path: str) -> Future:
+        """
+        Start recording one algorithm's trace and writing it to `path`
+
+        Returns:
+            Future resolving to the counts returned by export_trace_file
+        """
+        return self._ensure_pool().submit(export_trace_file, name, list(arr), path)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def precompute(self, names: Iterable[str], arr: Sequence[int]) -> Dict[str, StepTrace]:
+        """Record traces for several algorithms and wait for all of them"""
+        futures = self.submit(names, arr)
+        return {name: StepTrace.from_bytes(f.result()) for name, f in futures.items()}
+
+    def shutdown(self, cancel: bool = True):
+        """Stop the worker processes, dropping queued requests if `cancel`"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=cancel)
+            self._pool = None
+
+
+def precompute_traces(names: List[str], arr: Sequence[int],
+                      max_workers: Optional[int] = None) -> Dict[str, StepTrace]:
+    """
+    Record traces for several algorithms in parallel
+
+    Args:
+        names: Keys of SORTING_ALGORITHMS
+        arr: Input array shared by all algorithms
+        max_workers: Worker process count (defaults to the CPU count)
+
+    Returns:
+        Dict of algorithm name -> StepTrace
+    """
+    service = TraceService(max_workers)
+    try:
+        return service.precompute(names, arr)
+    finally:
+        service.shutdown()
@@ -0,0 +1,167 @@
+"""
+Background step production
+Runs a step generator on a worker thread and hands its steps to the GUI
+through a bounded ring buffer, so expensive generator work never blocks
+the event loop. The producer waits while the buffer is full (backpressure)
+and stops promptly when cancelled.
+"""
+from typing import Any, Iterable, List, Optional, Tuple
+import threading
+import time
+
+from .instrument import OpCounters
+
+# Steps produced between voluntary GIL releases
+YIELD_EVERY = 16
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO shared by one producer and one consumer thread"""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(int(capacity), 1)
+        self._items: List[Any] = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, item: Any) -> bool:
+        """
+        Append an item, waiting while the buffer is full
+
+        Returns:
+            False if the buffer was closed instead
+        """
+        with self._cond:
+            while self._size == self.capacity and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return False
+            self._items[(self._head + self._size) % self.capacity] = item
+            self._size += 1
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = 0.0) -> Tuple[bool, Any]:
+        """
+        Remove the oldest item
+
+        Args:
+            timeout: Seconds to wait for an item (0 = don't wait, None = forever)
+
+        Returns:
+            (True, item), or (False, None) if nothing arrived in time
+        """
+        with self._cond:
+            if timeout != 0.0:
+                self._cond.wait_for(lambda: self._size or self._closed, timeout)
+            if not self._size:
+                return False, None
+            item = self._items[self._head]
+            self._items[self._head] = None
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            self._cond.notify_all()
+            return True, item
+
+    def close(self):
+        """Wake all waiters; further puts are refused but gets still drain"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class StepProducer:
+    """
+    Step generator running on a worker thread
+
+    The consumer polls ``take()`` from its timer; steps are counted in
+    ``counters`` as they are consumed, with the time the generator spent
+    producing each one.
+    """
+
+    def __init__(self, steps: Iterable[Tuple[Any, ...]], capacity: int = 4096,
+                 timed: bool = True):
+        self._steps = steps
+        self.timed = timed
+        self.buffer = RingBuffer(capacity)
+        self.counters = OpCounters()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "StepProducer":
+        """Start the worker thread"""
+        self._thread.start()
+        return self
+
+    def _run(self):
+        """Worker loop: pull from the generator until done or cancelled"""
+        try:
+            it = iter(self._steps)
+            produced = 0
+            while not self._cancelled.is_set():
+                t0 = time.perf_counter() if self.timed else 0.0
+                try:
+                    step = next(it)
+                except StopIteration:
+                    break
+                elapsed = time.perf_counter() - t0 if self.timed else 0.0
+                if not self.buffer.put((step, elapsed)):
+                    break
+                produced += 1
+                if produced % YIELD_EVERY == 0:
+                    # Hand the GIL back so the GUI thread is not stalled for a
+                    # whole switch interval each time it calls into Qt
+                    time.sleep(0)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._done.set()
+            # Wakes a consumer blocked in take(); buffered steps stay readable
+            self.buffer.close()
+
+    def take(self, timeout: Optional[float] = 0.0) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the next step, or None if none is ready
+
+        Args:
+            timeout: Seconds to wait for a step (0 = don't wait, None = until
+                one arrives or the generator ends)
+
+        Raises:
+            The generator's exception, once its earlier steps are consumed
+        """
+        if self._cancelled.is_set():
+            return None
+        ok, item = self.buffer.get(timeout)
+        if not ok:
+            if self._error is not None and not self._cancelled.is_set():
+                error, self._error = self._error, None
+                raise error
+            return None
+        step, elapsed = item
+        self.counters.record(step, elapsed)
+        return step
+
+    @property
+    def ready(self) -> bool:
+        """True if take() would return a step right now or the run is over"""
+        return len(self.buffer) > 0 or self._done.is_set()
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the generator has finished and every step was taken"""
+        return self._done.is_set() and (self._cancelled.is_set() or not len(self.buffer))
+
+    def cancel(self, wait: bool = False):
+        """Stop the worker; pending steps are discarded"""
+        self._cancelled.set()
+        self.buffer.close()
+        if wait and self._thread.is_alive():
+            self._thread.join()
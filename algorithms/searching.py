@@ -1,9 +1,11 @@
 """
 Graph and tree searching algorithms with step-by-step visualization
 """
-from typing import Generator, Tuple, Any, Set
+from typing import Generator, Tuple, Any, Set, Dict, List, Optional
 from collections import deque
-from core.graph import GraphType
+from core.bst import NodeBST
+from core.graph import GraphType, HeuristicsType
+from core.queue_stack import PriorityQueue
 
 
 def bfs_steps(graph: GraphType, start: str, goal: str) -> Generator[Tuple[str, ...], None, None]:
@@ -76,3 +78,175 @@ def dfs_steps(graph: GraphType, start: str, goal: str) -> Generator[Tuple[str, .
                 yield ("push", nbr, list(stack), visited)
     
     yield ("notfound", None)
+
+
+def ucs_steps(graph: GraphType, start: str, goal: str) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Uniform-Cost Search (Dijkstra) with step-by-step visualization
+    Yields: (step_type, node, frontier, visited)
+    """
+    yield from _best_first_steps(graph, start, goal, {})
+
+
+def astar_steps(graph: GraphType, start: str, goal: str,
+                heuristics: Optional[HeuristicsType] = None) -> Generator[Tuple[str, ...], None, None]:
+    """
+    A* Search with step-by-step visualization
+    Nodes missing from `heuristics` get an estimate of 0.
+    Yields: (step_type, node, frontier, visited)
+    """
+    yield from _best_first_steps(graph, start, goal, heuristics or {})
+
+
+def _best_first_steps(graph: GraphType, start: str, goal: str,
+                      heuristics: HeuristicsType) -> Generator[Tuple[str, ...], None, None]:
+    """Expand nodes by path cost plus heuristic, using a decrease-key heap"""
+    frontier = PriorityQueue()
+    frontier.push(start, heuristics.get(start, 0))
+    cost: Dict[str, float] = {start: 0}
+    parent = {start: None}
+    visited: Set[str] = set()
+    
+    while frontier:
+        node, _ = frontier.pop()
+        visited.add(node)
+        yield ("visit", node, [n for n, _ in frontier.items], visited)
+        
+        if node == goal:
+            # Reconstruct path
+            path = []
+            cur = node
+            while cur is not None:
+                path.append(cur)
+                cur = parent[cur]
+            path.reverse()
+            yield ("found", path)
+            return
+        
+        for (nbr, weight) in graph.get(node, []):
+            if nbr in visited:
+                continue
+            new_cost = cost[node] + weight
+            if new_cost < cost.get(nbr, float("inf")):
+                cost[nbr] = new_cost
+                parent[nbr] = node
+                frontier.push_or_decrease(nbr, new_cost + heuristics.get(nbr, 0))
+                yield ("enqueue", nbr, [n for n, _ in frontier.items], visited)
+    
+    yield ("notfound", None)
+
+
+# Binary search tree searches
+#
+# The uninformed searches number tree nodes in the order they are discovered
+# and record each node's value and parent id in lists indexed by that id, so
+# the path to the target is read back through the parents. Ids stay small
+# integers even on deep chains.
+# Steps: ("visit", value, depth), ("deepen", depth limit),
+# ("found", root-to-node values) and ("notfound", target).
+
+def _discover(values: List[int], parents: List[int], node: NodeBST, parent: int) -> int:
+    """Give a newly discovered node the next id, recording its value and parent"""
+    values.append(node.value)
+    parents.append(parent)
+    return len(values) - 1
+
+
+def _parent_path(values: List[int], parents: List[int], node_id: int) -> List[int]:
+    """Values from the root (whose parent is -1) down to node `node_id`"""
+    path = []
+    while node_id != -1:
+        path.append(values[node_id])
+        node_id = parents[node_id]
+    path.reverse()
+    return path
+
+
+def bst_descent_steps(root: Optional[NodeBST], target: int) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Guided BST search: one comparison per level picks the only subtree
+    that can hold the target
+    """
+    path = []
+    node = root
+    while node:
+        path.append(node.value)
+        yield ("visit", node.value, len(path) - 1)
+        if node.value == target:
+            yield ("found", path)
+            return
+        node = node.left if target < node.value else node.right
+    yield ("notfound", target)
+
+
+def bst_bfs_steps(root: Optional[NodeBST], target: int) -> Generator[Tuple[Any, ...], None, None]:
+    """Breadth-first search of a tree, ignoring the BST ordering"""
+    values: List[int] = []
+    parents: List[int] = []
+    q = deque([(root, _discover(values, parents, root, -1), 0)] if root else [])
+    while q:
+        node, node_id, depth = q.popleft()
+        yield ("visit", node.value, depth)
+        if node.value == target:
+            yield ("found", _parent_path(values, parents, node_id))
+            return
+        for child in (node.left, node.right):
+            if child:
+                q.append((child, _discover(values, parents, child, node_id), depth + 1))
+    yield ("notfound", target)
+
+
+def bst_dfs_steps(root: Optional[NodeBST], target: int) -> Generator[Tuple[Any, ...], None, None]:
+    """Depth-first (preorder) search of a tree, ignoring the BST ordering"""
+    values: List[int] = []
+    parents: List[int] = []
+    stack = [(root, _discover(values, parents, root, -1), 0)] if root else []
+    while stack:
+        node, node_id, depth = stack.pop()
+        yield ("visit", node.value, depth)
+        if node.value == target:
+            yield ("found", _parent_path(values, parents, node_id))
+            return
+        for child in (node.right, node.left):
+            if child:
+                stack.append((child, _discover(values, parents, child, node_id), depth + 1))
+    yield ("notfound", target)
+
+
+def bst_iddfs_steps(root: Optional[NodeBST], target: int) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Iterative deepening: depth-limited DFS with limits 0, 1, 2, ... until the
+    target is found or a pass reaches no node below its limit
+    """
+    limit = 0
+    while root:
+        yield ("deepen", limit)
+        deeper = False
+        # Ids are only needed within one pass
+        values: List[int] = []
+        parents: List[int] = []
+        stack = [(root, _discover(values, parents, root, -1), 0)]
+        while stack:
+            node, node_id, depth = stack.pop()
+            yield ("visit", node.value, depth)
+            if node.value == target:
+                yield ("found", _parent_path(values, parents, node_id))
+                return
+            if depth == limit:
+                deeper = deeper or node.left is not None or node.right is not None
+                continue
+            for child in (node.right, node.left):
+                if child:
+                    stack.append((child, _discover(values, parents, child, node_id), depth + 1))
+        if not deeper:
+            break
+        limit += 1
+    yield ("notfound", target)
+
+
+BST_SEARCHES = {
+    "Descent": bst_descent_steps,
+    "BFS": bst_bfs_steps,
+    "DFS": bst_dfs_steps,
+    "Iterative Deepening": bst_iddfs_steps,
+}
@@ -1,72 +1,179 @@
 """
 Sorting algorithms with step-by-step visualization
 Each function is a generator that yields steps for visualization
+
+Every step is a tuple ``(step_type, *args, payload)``. By default the payload
+is a full copy of the working array. With ``delta=True`` the payload is a
+tuple of ``(index, value)`` pairs holding only the cells the step wrote, which
+keeps memory flat for large arrays; use ``apply_delta``/``replay_steps`` to
+rebuild array snapshots from a delta stream.
 """
-from typing import List, Generator, Tuple, Any
+from functools import partial
+from typing import List, Generator, Tuple, Any, Callable, Iterable, Optional
+
+Delta = Tuple[Tuple[int, int], ...]
+
+# Step vocabulary shared by all generators, with the number of integer
+# arguments each step carries before its payload
+STEP_ARITY = {
+    "compare": 2,
+    "swap": 2,
+    "shift": 1,
+    "key": 1,
+    "insert": 1,
+    "merge": 3,
+    "merged": 2,
+    "run": 2,
+    "scan": 1,
+    "place": 1,
+    "done": 0,
+}
+
 
+def _payload(a: List[int], delta: bool) -> Callable[..., Any]:
+    """Return a function building the step payload for the given indices"""
+    if delta:
+        return lambda *idx: tuple((k, a[k]) for k in idx)
+    return lambda *idx: list(a)
 
-def insertion_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
+
+def apply_delta(array: List[int], changes: Delta) -> List[int]:
     """
-    Insertion sort with step-by-step visualization
-    Yields: (step_type, *args, current_array)
+    Apply the changes carried by a delta step to an array in place
+    
+    Args:
+        array: Working array to update
+        changes: Tuple of (index, value) pairs from a delta step
+    
+    Returns:
+        The same array, for convenience
+    """
+    for k, v in changes:
+        array[k] = v
+    return array
+
+
+def replay_steps(arr: List[int], steps: Iterable[Tuple[Any, ...]],
+                 upto: Optional[int] = None) -> List[int]:
+    """
+    Rebuild the array snapshot after a number of delta steps
+    
+    Args:
+        arr: Initial (unsorted) array
+        steps: Delta steps as yielded with delta=True
+        upto: Number of steps to apply (all steps if None)
+    
+    Returns:
+        A new list holding the array state after the applied steps
     """
     a = list(arr)
-    n = len(a)
-    for i in range(1, n):
+    for n, step in enumerate(steps):
+        if upto is not None and n >= upto:
+            break
+        apply_delta(a, step[-1])
+    return a
+
+
+def _insertion_range_steps(a: List[int], snap: Callable[..., Any], lo: int,
+                           hi: int, gap: int = 1) -> Generator[Tuple[str, ...], None, None]:
+    """Gapped insertion sort of a[lo..hi] (inclusive) in place"""
+    for i in range(lo + gap, hi + 1):
         key = a[i]
-        j = i - 1
-        yield ("key", i, list(a))
-        while j >= 0 and a[j] > key:
-            yield ("compare", j, j + 1, list(a))
-            a[j + 1] = a[j]
-            yield ("shift", j + 1, list(a))
-            j -= 1
-        a[j + 1] = key
-        yield ("insert", j + 1, list(a))
-    yield ("done", list(a))
+        j = i - gap
+        yield ("key", i, snap())
+        while j >= lo and a[j] > key:
+            yield ("compare", j, j + gap, snap())
+            a[j + gap] = a[j]
+            yield ("shift", j + gap, snap(j + gap))
+            j -= gap
+        a[j + gap] = key
+        yield ("insert", j + gap, snap(j + gap))
+
+
+def insertion_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Insertion sort with step-by-step visualization
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    yield from _insertion_range_steps(a, snap, 0, len(a) - 1)
+    yield ("done", snap())
 
 
-def bubble_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
+def bubble_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
     """
     Bubble sort with step-by-step visualization
-    Yields: (step_type, *args, current_array)
+    Yields: (step_type, *args, current_array or changes)
     """
     a = list(arr)
+    snap = _payload(a, delta)
     n = len(a)
     for i in range(n):
         for j in range(0, n - i - 1):
-            yield ("compare", j, j + 1, list(a))
+            yield ("compare", j, j + 1, snap())
             if a[j] > a[j + 1]:
                 a[j], a[j + 1] = a[j + 1], a[j]
-                yield ("swap", j, j + 1, list(a))
-    yield ("done", list(a))
+                yield ("swap", j, j + 1, snap(j, j + 1))
+    yield ("done", snap())
 
 
-def selection_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
+def selection_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
     """
     Selection sort with step-by-step visualization
-    Yields: (step_type, *args, current_array)
+    Yields: (step_type, *args, current_array or changes)
     """
     a = list(arr)
+    snap = _payload(a, delta)
     n = len(a)
     for i in range(n):
         min_idx = i
         for j in range(i + 1, n):
-            yield ("compare", min_idx, j, list(a))
+            yield ("compare", min_idx, j, snap())
             if a[j] < a[min_idx]:
                 min_idx = j
         if min_idx != i:
             a[i], a[min_idx] = a[min_idx], a[i]
-            yield ("swap", i, min_idx, list(a))
-    yield ("done", list(a))
+            yield ("swap", i, min_idx, snap(i, min_idx))
+    yield ("done", snap())
+
+
+def _merge_range_steps(a: List[int], snap: Callable[..., Any], lo: int, mid: int,
+                       hi: int) -> Generator[Tuple[str, ...], None, None]:
+    """Merge the sorted ranges a[lo..mid] and a[mid+1..hi] in place"""
+    yield ("merge", lo, mid, hi, snap())
+    temp = [0] * (hi - lo + 1)
+    i = lo
+    j = mid + 1
+    k = 0
+    while i <= mid and j <= hi:
+        yield ("compare", i, j, snap())
+        if a[i] <= a[j]:
+            temp[k] = a[i]
+            i += 1
+        else:
+            temp[k] = a[j]
+            j += 1
+        k += 1
+    while i <= mid:
+        temp[k] = a[i]
+        i += 1
+        k += 1
+    while j <= hi:
+        temp[k] = a[j]
+        j += 1
+        k += 1
+    a[lo:hi + 1] = temp
+    yield ("merged", lo, hi, snap(*range(lo, hi + 1)))
 
 
-def merge_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
+def merge_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
     """
     Merge sort with step-by-step visualization
-    Yields: (step_type, *args, current_array)
+    Yields: (step_type, *args, current_array or changes)
     """
     a = list(arr)
+    snap = _payload(a, delta)
     n = len(a)
     curr_size = 1
     while curr_size < n:
@@ -74,58 +181,473 @@ def merge_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
         while left_start < n - 1:
             mid = min(left_start + curr_size - 1, n - 1)
             right_end = min(left_start + 2 * curr_size - 1, n - 1)
-            yield ("merge", left_start, mid, right_end, list(a))
-            temp = [0] * (right_end - left_start + 1)
-            i = left_start
-            j = mid + 1
-            k = 0
-            while i <= mid and j <= right_end:
-                yield ("compare", i, j, list(a))
-                if a[i] <= a[j]:
-                    temp[k] = a[i]
-                    i += 1
-                else:
-                    temp[k] = a[j]
-                    j += 1
-                k += 1
-            while i <= mid:
-                temp[k] = a[i]
-                i += 1
-                k += 1
-            while j <= right_end:
-                temp[k] = a[j]
-                j += 1
-                k += 1
-            for m in range(len(temp)):
-                a[left_start + m] = temp[m]
-            yield ("merged", left_start, right_end, list(a))
+            yield from _merge_range_steps(a, snap, left_start, mid, right_end)
             left_start += 2 * curr_size
         curr_size *= 2
-    yield ("done", list(a))
+    yield ("done", snap())
+
+
+def _sift_down_steps(a: List[int], snap: Callable[..., Any], lo: int,
+                     root: int, size: int) -> Generator[Tuple[str, ...], None, None]:
+    """Sift a[lo + root] down the max-heap stored in a[lo:lo + size]"""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        c = lo + child
+        if child + 1 < size:
+            yield ("compare", c, c + 1, snap())
+            if a[c] < a[c + 1]:
+                child += 1
+                c += 1
+        r = lo + root
+        yield ("compare", r, c, snap())
+        if a[r] >= a[c]:
+            return
+        a[r], a[c] = a[c], a[r]
+        yield ("swap", r, c, snap(r, c))
+        root = child
 
 
-def quick_steps(arr: List[int]) -> Generator[Tuple[str, ...], None, None]:
+def _heap_sort_range(a: List[int], snap: Callable[..., Any], lo: int,
+                     hi: int) -> Generator[Tuple[str, ...], None, None]:
+    """Heap sort a[lo..hi] (inclusive) in place"""
+    size = hi - lo + 1
+    for root in range(size // 2 - 1, -1, -1):
+        yield from _sift_down_steps(a, snap, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        yield ("swap", lo, lo + end, snap(lo, lo + end))
+        yield from _sift_down_steps(a, snap, lo, 0, end)
+
+
+def _median_of_three(a: List[int], snap: Callable[..., Any], i: int, j: int,
+                     k: int) -> Generator[Tuple[str, ...], None, int]:
+    """Yield the comparisons for a median-of-three and return the median's index"""
+    yield ("compare", i, j, snap())
+    if a[i] > a[j]:
+        i, j = j, i
+    yield ("compare", j, k, snap())
+    if a[j] <= a[k]:
+        return j
+    yield ("compare", i, k, snap())
+    return k if a[i] <= a[k] else i
+
+
+def quick_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
     """
     Quick sort with step-by-step visualization
-    Yields: (step_type, *args, current_array)
+    Introsort: explicit range stack, median-of-three pivot (ninther on
+    ranges over 40 elements) and a heap sort fallback once the partition
+    depth exceeds 2 * log2(n), so the worst case stays O(n log n).
+    Yields: (step_type, *args, current_array or changes)
     """
     a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    depth_limit = 2 * max(n, 1).bit_length()
+    stack = [(0, n - 1, 0)]
     
-    def qs(a, l, r):
+    while stack:
+        l, r, depth = stack.pop()
         if l >= r:
-            return
+            continue
+        if depth > depth_limit:
+            yield from _heap_sort_range(a, snap, l, r)
+            continue
+        
+        # Pivot selection
+        size = r - l + 1
+        mid = l + size // 2
+        if size > 40:
+            step = size // 8
+            m1 = yield from _median_of_three(a, snap, l, l + step, l + 2 * step)
+            m2 = yield from _median_of_three(a, snap, mid - step, mid, mid + step)
+            m3 = yield from _median_of_three(a, snap, r - 2 * step, r - step, r)
+            m = yield from _median_of_three(a, snap, m1, m2, m3)
+        elif size > 2:
+            m = yield from _median_of_three(a, snap, l, mid, r)
+        else:
+            m = r
+        if m != r:
+            a[m], a[r] = a[r], a[m]
+            yield ("swap", m, r, snap(m, r))
+        
+        # Lomuto partition around a[r]
         pivot = a[r]
         i = l
         for j in range(l, r):
-            yield ("compare", j, r, list(a))
+            yield ("compare", j, r, snap())
             if a[j] < pivot:
                 a[i], a[j] = a[j], a[i]
-                yield ("swap", i, j, list(a))
+                yield ("swap", i, j, snap(i, j))
                 i += 1
         a[i], a[r] = a[r], a[i]
-        yield ("swap", i, r, list(a))
-        yield from qs(a, l, i - 1)
-        yield from qs(a, i + 1, r)
+        yield ("swap", i, r, snap(i, r))
+        
+        # Push the larger side first so the smaller one is sorted next,
+        # keeping the stack O(log n)
+        left, right = (l, i - 1), (i + 1, r)
+        if left[1] - left[0] > right[1] - right[0]:
+            left, right = right, left
+        stack.append((right[0], right[1], depth + 1))
+        stack.append((left[0], left[1], depth + 1))
     
-    yield from qs(a, 0, len(a) - 1)
-    yield ("done", a)
+    yield ("done", snap())
+
+
+def heap_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Heap sort with step-by-step visualization
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    yield from _heap_sort_range(a, snap, 0, len(a) - 1)
+    yield ("done", snap())
+
+
+def _shell_gaps(n: int) -> List[int]:
+    """Shell's original sequence: n/2, n/4, ..., 1"""
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps
+
+
+def _knuth_gaps(n: int) -> List[int]:
+    """Knuth's sequence: 1, 4, 13, 40, ... below n/3"""
+    gaps = [1]
+    while gaps[-1] * 3 + 1 < max(n // 3, 2):
+        gaps.append(gaps[-1] * 3 + 1)
+    return gaps[::-1]
+
+
+def _hibbard_gaps(n: int) -> List[int]:
+    """Hibbard's sequence: 2^k - 1"""
+    gaps = [1]
+    while gaps[-1] * 2 + 1 < n:
+        gaps.append(gaps[-1] * 2 + 1)
+    return gaps[::-1]
+
+
+def _sedgewick_gaps(n: int) -> List[int]:
+    """Sedgewick's 1982 sequence: 1, 8, 23, 77, ... (4^k + 3 * 2^(k-1) + 1)"""
+    gaps = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps[::-1]
+
+
+def _ciura_gaps(n: int) -> List[int]:
+    """Ciura's empirical sequence, extended by a factor of 2.25"""
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701]
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [g for g in reversed(gaps) if g < n] or [1]
+
+
+SHELL_GAPS = {
+    "shell": _shell_gaps,
+    "knuth": _knuth_gaps,
+    "hibbard": _hibbard_gaps,
+    "sedgewick": _sedgewick_gaps,
+    "ciura": _ciura_gaps,
+}
+
+
+def shell_steps(arr: List[int], delta: bool = False,
+                gaps: str = "ciura") -> Generator[Tuple[str, ...], None, None]:
+    """
+    Shell sort with step-by-step visualization
+    
+    Args:
+        arr: Input array
+        delta: Yield changed cells instead of full array copies
+        gaps: Gap sequence name, one of SHELL_GAPS
+    
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    for gap in SHELL_GAPS[gaps](n):
+        yield from _insertion_range_steps(a, snap, 0, n - 1, gap)
+    yield ("done", snap())
+
+
+def _min_run(n: int) -> int:
+    """Timsort minimum run length: between 32 and 64 for large n"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def tim_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Timsort-style run merging with step-by-step visualization
+    Finds natural runs (reversing descending ones), extends short runs to
+    minrun with binary insertion, and merges runs while keeping the
+    Timsort stack invariants
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    min_run = _min_run(n)
+    runs: List[Tuple[int, int]] = []  # (start, length)
+    
+    def merge_at(i):
+        s1, l1 = runs[i]
+        _, l2 = runs[i + 1]
+        runs[i] = (s1, l1 + l2)
+        del runs[i + 1]
+        return _merge_range_steps(a, snap, s1, s1 + l1 - 1, s1 + l1 + l2 - 1)
+    
+    lo = 0
+    while lo < n:
+        # Find the natural run starting at lo
+        hi = lo + 1
+        if hi < n:
+            yield ("compare", lo, hi, snap())
+            if a[hi] < a[lo]:
+                hi += 1
+                while hi < n:
+                    yield ("compare", hi - 1, hi, snap())
+                    if a[hi] >= a[hi - 1]:
+                        break
+                    hi += 1
+                i, j = lo, hi - 1
+                while i < j:
+                    a[i], a[j] = a[j], a[i]
+                    yield ("swap", i, j, snap(i, j))
+                    i += 1
+                    j -= 1
+            else:
+                hi += 1
+                while hi < n:
+                    yield ("compare", hi - 1, hi, snap())
+                    if a[hi] < a[hi - 1]:
+                        break
+                    hi += 1
+        
+        # Extend short runs with binary insertion
+        end = min(lo + min_run, n)
+        for k in range(hi, end):
+            key = a[k]
+            yield ("key", k, snap())
+            left, right = lo, k
+            while left < right:
+                m = (left + right) // 2
+                yield ("compare", m, k, snap())
+                if key < a[m]:
+                    right = m
+                else:
+                    left = m + 1
+            for p in range(k, left, -1):
+                a[p] = a[p - 1]
+                yield ("shift", p, snap(p))
+            a[left] = key
+            yield ("insert", left, snap(left))
+        hi = max(hi, end)
+        yield ("run", lo, hi - 1, snap())
+        runs.append((lo, hi - lo))
+        
+        # Restore the stack invariants
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or
+                    (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            yield from merge_at(i)
+        lo = hi
+    
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        yield from merge_at(i)
+    yield ("done", snap())
+
+
+# Counting sort allocates one counter per value in the range, so it only runs
+# when the range is at most COUNTING_SPAN_FACTOR times the input size (or
+# COUNTING_MIN_SPAN for small inputs); wider ranges fall back to LSD radix
+COUNTING_SPAN_FACTOR = 16
+COUNTING_MIN_SPAN = 1 << 16
+
+
+def counting_span_limit(n: int) -> int:
+    """Widest value range (max - min) counting sort handles for n values"""
+    return max(COUNTING_SPAN_FACTOR * n, COUNTING_MIN_SPAN)
+
+
+def counting_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Counting sort with step-by-step visualization
+    Counts every value (offset by the minimum, so negatives work), then
+    writes the values back in order; ranges wider than counting_span_limit
+    are sorted with LSD radix instead
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    if a:
+        lo = min(a)
+        if max(a) - lo > counting_span_limit(len(a)):
+            yield from radix_lsd_steps(arr, delta)
+            return
+        counts = [0] * (max(a) - lo + 1)
+        for i, v in enumerate(a):
+            counts[v - lo] += 1
+            yield ("scan", i, snap())
+        k = 0
+        for offset, c in enumerate(counts):
+            for _ in range(c):
+                a[k] = offset + lo
+                yield ("place", k, snap(k))
+                k += 1
+    yield ("done", snap())
+
+
+def radix_lsd_steps(arr: List[int], delta: bool = False,
+                    base: int = 10) -> Generator[Tuple[str, ...], None, None]:
+    """
+    LSD radix sort with step-by-step visualization
+    One stable counting pass per digit, least significant first; keys are
+    offset by the minimum so negatives work
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    if n:
+        lo = min(a)
+        span = max(a) - lo
+        exp = 1
+        while True:
+            counts = [0] * base
+            for i in range(n):
+                counts[(a[i] - lo) // exp % base] += 1
+                yield ("scan", i, snap())
+            pos = 0
+            for d in range(base):
+                counts[d], pos = pos, pos + counts[d]
+            out = [0] * n
+            for v in a:
+                d = (v - lo) // exp % base
+                out[counts[d]] = v
+                counts[d] += 1
+            for k in range(n):
+                a[k] = out[k]
+                yield ("place", k, snap(k))
+            exp *= base
+            if span // exp == 0:
+                break
+    yield ("done", snap())
+
+
+def radix_msd_steps(arr: List[int], delta: bool = False,
+                    base: int = 10) -> Generator[Tuple[str, ...], None, None]:
+    """
+    MSD radix sort with step-by-step visualization
+    Distributes each range by its most significant remaining digit, then
+    sorts every bucket on the next digit (explicit stack, no recursion)
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    if n:
+        lo = min(a)
+        span = max(a) - lo
+        exp = 1
+        while span // exp >= base:
+            exp *= base
+        stack = [(0, n - 1, exp)]
+        while stack:
+            l, r, exp = stack.pop()
+            if l >= r or exp == 0:
+                continue
+            counts = [0] * base
+            for i in range(l, r + 1):
+                counts[(a[i] - lo) // exp % base] += 1
+                yield ("scan", i, snap())
+            starts = []
+            pos = l
+            for d in range(base):
+                starts.append(pos)
+                pos += counts[d]
+            out = [0] * (r - l + 1)
+            fill = list(starts)
+            for i in range(l, r + 1):
+                d = (a[i] - lo) // exp % base
+                out[fill[d] - l] = a[i]
+                fill[d] += 1
+            for k in range(l, r + 1):
+                a[k] = out[k - l]
+                yield ("place", k, snap(k))
+            for d in range(base - 1, -1, -1):
+                if counts[d] > 1:
+                    stack.append((starts[d], starts[d] + counts[d] - 1, exp // base))
+    yield ("done", snap())
+
+
+def bucket_steps(arr: List[int], delta: bool = False) -> Generator[Tuple[str, ...], None, None]:
+    """
+    Bucket sort with step-by-step visualization
+    Scatters values into sqrt(n) equal-width buckets, writes the buckets
+    back in order and finishes each bucket with insertion sort
+    Yields: (step_type, *args, current_array or changes)
+    """
+    a = list(arr)
+    snap = _payload(a, delta)
+    n = len(a)
+    if n:
+        lo = min(a)
+        width = max(a) - lo + 1
+        count = max(1, int(n ** 0.5))
+        buckets: List[List[int]] = [[] for _ in range(count)]
+        for i, v in enumerate(a):
+            buckets[(v - lo) * count // width].append(v)
+            yield ("scan", i, snap())
+        k = 0
+        bounds = []
+        for bucket in buckets:
+            start = k
+            for v in bucket:
+                a[k] = v
+                yield ("place", k, snap(k))
+                k += 1
+            bounds.append((start, k - 1))
+        for start, end in bounds:
+            yield from _insertion_range_steps(a, snap, start, end)
+    yield ("done", snap())
+
+
+# Step generators by display name, shared by the UI and the benchmark
+SORTING_ALGORITHMS = {
+    "Insertion": insertion_steps,
+    "Bubble": bubble_steps,
+    "Selection": selection_steps,
+    "Merge": merge_steps,
+    "Quick": quick_steps,
+    "Heap": heap_steps,
+    "Shell": shell_steps,
+    "Shell (Knuth)": partial(shell_steps, gaps="knuth"),
+    "Shell (Sedgewick)": partial(shell_steps, gaps="sedgewick"),
+    "Tim": tim_steps,
+    "Counting": counting_steps,
+    "Radix (LSD)": radix_lsd_steps,
+    "Radix (MSD)": radix_msd_steps,
+    "Bucket": bucket_steps,
+}
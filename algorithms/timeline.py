@@ -0,0 +1,65 @@
+"""
+Seekable timeline over a sorting run
+Keeps full-array checkpoints every K steps plus the columnar deltas between
+them, so any step can be reached in O(K + n) instead of replaying the run
+"""
+from typing import Sequence, Tuple, Any, Iterable, List, Optional
+import numpy as np
+
+from .sorting import apply_delta
+from .trace import StepTrace
+
+
+class Timeline:
+    """
+    Step timeline with periodic checkpoints
+
+    Steps are appended as they are produced (delta mode). ``seek(n)`` copies
+    the nearest checkpoint at or before n and applies the recorded writes up
+    to step n.
+    """
+
+    def __init__(self, initial: Sequence[int], interval: Optional[int] = None):
+        # Checkpoints cost n cells each, so never take them more often than
+        # every n steps; seeking stays O(K + n) either way
+        self.interval = interval or max(256, len(initial))
+        self.trace = StepTrace(initial, 8 * len(initial))
+        self.checkpoints: List[np.ndarray] = [np.asarray(initial, dtype=np.int64)]
+        self._tail: List[int] = list(initial)
+
+    def __len__(self) -> int:
+        return len(self.trace)
+
+    def append(self, step: Tuple[Any, ...]):
+        """Record the next delta-mode step"""
+        self.trace.append(step)
+        apply_delta(self._tail, step[-1])
+        if len(self.trace) % self.interval == 0:
+            self.checkpoints.append(np.array(self._tail, dtype=np.int64))
+
+    def extend(self, steps: Iterable[Tuple[Any, ...]]):
+        """Record a stream of delta-mode steps"""
+        for step in steps:
+            self.append(step)
+
+    def step(self, n: int) -> Tuple[Any, ...]:
+        """Return step n (0-based) as a delta-mode step tuple"""
+        return self.trace.step(n)
+
+    def seek(self, n: int) -> np.ndarray:
+        """
+        Return the array state after the first n steps
+
+        Args:
+            n: Number of applied steps, clamped to [0, len(self)]
+
+        Returns:
+            A new NumPy array with the snapshot
+        """
+        n = max(0, min(n, len(self)))
+        if n == len(self):
+            return np.array(self._tail, dtype=np.int64)
+        c = min(n // self.interval, len(self.checkpoints) - 1)
+        out = self.checkpoints[c].copy()
+        trace = self.trace
+        return trace.apply_writes(out, trace.row_end(c * self.interval), trace.row_end(n))
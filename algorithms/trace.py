@@ -0,0 +1,190 @@
+"""
+Columnar step traces for the sorting generators
+Records a delta-mode step stream into preallocated NumPy columns so that
+seeking, counting and exporting are vectorized operations
+"""
+from typing import Sequence, Tuple, Callable, Iterable, Dict, Any, Optional
+import io
+import numpy as np
+
+from .sorting import STEP_ARITY
+
+# Op codes: one per step type, plus a code for the cell writes of a step
+OP_NAMES: Tuple[str, ...] = tuple(STEP_ARITY) + ("write",)
+OP_CODES: Dict[str, int] = {name: code for code, name in enumerate(OP_NAMES)}
+OP_WRITE = OP_CODES["write"]
+
+
+class StepTrace:
+    """
+    Step trace stored as parallel NumPy columns (op, i, j, value)
+
+    Each step becomes one row whose integer arguments fill ``i``, ``j`` and
+    ``value`` in order, followed by one ``write`` row per changed cell with
+    ``i`` = index and ``value`` = new value. Columns are preallocated and grow
+    by doubling, so appending is amortized O(1).
+    """
+
+    def __init__(self, initial: Sequence[int], capacity: int = 1024):
+        self.initial = np.asarray(initial, dtype=np.int64)
+        capacity = max(int(capacity), 16)
+        self.op = np.empty(capacity, dtype=np.int8)
+        self.i = np.empty(capacity, dtype=np.int32)
+        self.j = np.empty(capacity, dtype=np.int32)
+        self.value = np.empty(capacity, dtype=np.int64)
+        self.step_row = np.empty(capacity, dtype=np.int64)
+        self.rows = 0
+        self.num_steps = 0
+
+    def _grow(self, needed: int):
+        """Double the column capacity until `needed` rows fit"""
+        cap = len(self.op)
+        while cap < needed:
+            cap *= 2
+        for name in ("op", "i", "j", "value"):
+            col = getattr(self, name)
+            new = np.empty(cap, dtype=col.dtype)
+            new[:self.rows] = col[:self.rows]
+            setattr(self, name, new)
+
+    def append(self, step: Tuple[Any, ...]):
+        """Append one delta-mode step to the trace"""
+        changes = step[-1]
+        args = step[1:-1]
+        row = self.rows
+        end = row + 1 + len(changes)
+        if end > len(self.op):
+            self._grow(end)
+        if self.num_steps >= len(self.step_row):
+            new = np.empty(2 * len(self.step_row), dtype=np.int64)
+            new[:self.num_steps] = self.step_row[:self.num_steps]
+            self.step_row = new
+
+        self.op[row] = OP_CODES[step[0]]
+        self.i[row] = args[0] if len(args) > 0 else -1
+        self.j[row] = args[1] if len(args) > 1 else -1
+        self.value[row] = args[2] if len(args) > 2 else 0
+        if changes:
+            k, v = zip(*changes)
+            self.op[row + 1:end] = OP_WRITE
+            self.i[row + 1:end] = k
+            self.j[row + 1:end] = -1
+            self.value[row + 1:end] = v
+        self.step_row[self.num_steps] = row
+        self.num_steps += 1
+        self.rows = end
+
+    def __len__(self) -> int:
+        return self.num_steps
+
+    def row_end(self, n: int) -> int:
+        """Row index just past the rows of the first n steps"""
+        if n >= self.num_steps:
+            return self.rows
+        return int(self.step_row[max(n, 0)])
+
+    def apply_writes(self, out: np.ndarray, row_start: int, row_end: int) -> np.ndarray:
+        """Apply the write rows in [row_start, row_end) to `out` in place"""
+        ops = self.op[row_start:row_end]
+        mask = ops == OP_WRITE
+        idx = self.i[row_start:row_end][mask]
+        if idx.size:
+            val = self.value[row_start:row_end][mask]
+            # Keep only the last write to each cell
+            uniq, first = np.unique(idx[::-1], return_index=True)
+            out[uniq] = val[::-1][first]
+        return out
+
+    def snapshot(self, n: int) -> np.ndarray:
+        """Return the array state after the first n steps"""
+        return self.apply_writes(self.initial.copy(), 0, self.row_end(n))
+
+    def step(self, n: int) -> Tuple[Any, ...]:
+        """Rebuild step n as a delta-mode step tuple"""
+        row = int(self.step_row[n])
+        end = self.row_end(n + 1)
+        name = OP_NAMES[self.op[row]]
+        args = (int(self.i[row]), int(self.j[row]), int(self.value[row]))[:STEP_ARITY[name]]
+        changes = tuple(zip(self.i[row + 1:end].tolist(), self.value[row + 1:end].tolist()))
+        return (name, *args, changes)
+
+    def step_ops(self) -> np.ndarray:
+        """Op code of every step, in order"""
+        return self.op[self.step_row[:self.num_steps]]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of rows of each op type (writes count changed cells)"""
+        hist = np.bincount(self.op[:self.rows], minlength=len(OP_NAMES))
+        return {name: int(hist[code]) for code, name in enumerate(OP_NAMES)}
+
+    def count(self, name: str) -> int:
+        """Number of rows of one op type"""
+        return int(np.count_nonzero(self.op[:self.rows] == OP_CODES[name]))
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Trimmed views of the trace columns"""
+        return {
+            "op": self.op[:self.rows],
+            "i": self.i[:self.rows],
+            "j": self.j[:self.rows],
+            "value": self.value[:self.rows],
+        }
+
+    def to_csv(self, path: str):
+        """Export the trace rows as CSV (op name, i, j, value)"""
+        cols = self.columns()
+        names = np.asarray(OP_NAMES)[cols["op"]]
+        table = np.column_stack([names, cols["i"], cols["j"], cols["value"]])
+        np.savetxt(path, table, fmt="%s", delimiter=",",
+                   header="op,i,j,value", comments="")
+
+    def to_bytes(self) -> bytes:
+        """Serialize the trace to a compressed .npz byte string"""
+        buf = io.BytesIO()
+        np.savez_compressed(buf, initial=self.initial,
+                            step_row=self.step_row[:self.num_steps], **self.columns())
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StepTrace":
+        """Load a trace serialized with to_bytes"""
+        with np.load(io.BytesIO(data)) as z:
+            trace = cls(z["initial"], len(z["op"]) + 1)
+            trace.rows = len(z["op"])
+            trace.num_steps = len(z["step_row"])
+            for name in ("op", "i", "j", "value"):
+                getattr(trace, name)[:trace.rows] = z[name]
+            trace.step_row = np.array(z["step_row"], dtype=np.int64)
+            if not len(trace.step_row):
+                trace.step_row = np.empty(16, dtype=np.int64)
+        return trace
+
+    def save(self, path: str):
+        """Save the trace to an .npz file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "StepTrace":
+        """Load a trace saved with save"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def record_trace(steps_fn: Callable[..., Iterable[Tuple[Any, ...]]],
+                 arr: Sequence[int], capacity: Optional[int] = None) -> StepTrace:
+    """
+    Run a sorting generator to completion and record its trace
+    
+    Args:
+        steps_fn: Step generator function from algorithms.sorting
+        arr: Input array
+        capacity: Initial row capacity (defaults to 8 * len(arr))
+    
+    Returns:
+        The recorded StepTrace
+    """
+    trace = StepTrace(arr, capacity or 8 * len(arr))
+    for step in steps_fn(arr, delta=True):
+        trace.append(step)
+    return trace
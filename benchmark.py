@@ -0,0 +1,309 @@
+"""
+DSA Algorithm Visualizer - headless sorting benchmark
+Runs every step generator in algorithms/sorting.py without the GUI over a
+matrix of input sizes and distributions, and reports wall time, peak memory,
+steps yielded and bytes allocated per step as JSON/CSV.
+
+Example:
+    python benchmark.py --sizes 100 500 2000 --json bench.json
+    python benchmark.py --baseline bench.json --tolerance 0.25
+"""
+import argparse
+import csv
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from algorithms.sorting import SORTING_ALGORITHMS, apply_delta
+from algorithms.instrument import instrument, complexity_ratio
+
+DISTRIBUTIONS = ["random", "sorted", "reversed", "few-unique", "organ-pipe"]
+
+# Timed runs per case by default; the best one is kept
+DEFAULT_REPEAT = 5
+# Cases faster than this (in the baseline) are too noisy to compare wall time
+DEFAULT_MIN_TIME_S = 0.01
+
+FIELDS = ["algorithm", "distribution", "size", "mode", "steps", "wall_time_s",
+          "peak_memory_bytes", "alloc_bytes_per_step", "comparisons", "swaps", "writes",
+          "ops_per_bound", "ok", "error"]
+
+
+def make_input(distribution: str, n: int, seed: int = 0) -> List[int]:
+    """
+    Build a benchmark input array
+
+    Args:
+        distribution: One of DISTRIBUTIONS
+        n: Number of elements
+        seed: Seed for the random distributions
+
+    Returns:
+        List of n integers
+    """
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randint(0, 10 * n) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "few-unique":
+        return [rng.randint(0, 4) for _ in range(n)]
+    if distribution == "organ-pipe":
+        half = (n + 1) // 2
+        return list(range(half)) + list(range(n - half - 1, -1, -1))
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def _best_time(steps_fn: Callable, arr: List[int], delta: bool,
+               repeat: int) -> Tuple[int, float]:
+    """Step count and best wall time of `repeat` untraced runs"""
+    best = None
+    # Like timeit, keep collector pauses out of the timed runs
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeat)):
+            steps = 0
+            t0 = time.perf_counter()
+            for _step in steps_fn(arr, delta=delta):
+                steps += 1
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return steps, best
+
+
+def run_case(steps_fn: Callable, arr: List[int], delta: bool = True,
+             repeat: int = DEFAULT_REPEAT, name: str = "") -> Dict[str, Any]:
+    """
+    Benchmark one generator on one input
+
+    Wall time is the best of `repeat` untraced runs. Peak memory and
+    allocations come from a separate run under tracemalloc, which also
+    counts operations and checks that the replayed result is sorted. The
+    bytes allocated for a step are the traced high-water mark while the
+    generator produces it, above what was allocated before; this includes
+    temporaries such as copied slices, not just the yielded tuple.
+
+    Returns:
+        Dict with steps, wall_time_s, peak_memory_bytes, alloc_bytes_per_step,
+        comparisons, swaps, writes, ops_per_bound, ok and error
+    """
+    result: Dict[str, Any] = {"steps": 0, "wall_time_s": None, "peak_memory_bytes": None,
+                              "alloc_bytes_per_step": None, "comparisons": None, "swaps": None,
+                              "writes": None, "ops_per_bound": None, "ok": False, "error": ""}
+    try:
+        steps, best = _best_time(steps_fn, arr, delta, repeat)
+        result["steps"] = steps
+        result["wall_time_s"] = round(best, 6)
+
+        work = list(arr)
+        last = None
+        alloc = 0
+        peak = 0
+        counted = instrument(steps_fn(arr, delta=delta), timed=False)
+        it = iter(counted)
+        tracemalloc.start()
+        try:
+            while True:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                try:
+                    step = next(it)
+                except StopIteration:
+                    break
+                _, step_peak = tracemalloc.get_traced_memory()
+                alloc += step_peak - before
+                peak = max(peak, step_peak)
+                if delta:
+                    apply_delta(work, step[-1])
+                else:
+                    last = step[-1]
+                del step
+            # reset_peak() restarts the high-water mark, so the overall peak
+            # is the highest one seen while producing any step
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        final = work if delta else (last if last is not None else work)
+        result["peak_memory_bytes"] = peak
+        result["alloc_bytes_per_step"] = round(alloc / steps, 1) if steps else 0.0
+        c = counted.counters
+        result["comparisons"] = c.comparisons
+        result["swaps"] = c.swaps
+        result["writes"] = c.writes
+        if name:
+            result["ops_per_bound"] = round(complexity_ratio(name, len(arr), c), 4)
+        result["ok"] = final == sorted(arr)
+        if not result["ok"]:
+            result["error"] = "result not sorted"
+    except (RecursionError, MemoryError) as e:
+        result["error"] = type(e).__name__
+    return result
+
+
+def run_suite(algorithms: List[str], sizes: List[int], distributions: List[str],
+              delta: bool = True, repeat: int = DEFAULT_REPEAT, seed: int = 0,
+              progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """Run the full benchmark matrix and return one record per case"""
+    records = []
+    for name in algorithms:
+        steps_fn = SORTING_ALGORITHMS[name]
+        for distribution in distributions:
+            for n in sizes:
+                arr = make_input(distribution, n, seed)
+                record = {"algorithm": name, "distribution": distribution,
+                          "size": n, "mode": "delta" if delta else "full"}
+                record.update(run_case(steps_fn, arr, delta, repeat, name))
+                records.append(record)
+                if progress:
+                    progress(record)
+    return records
+
+
+def _case_key(r: Dict[str, Any]) -> Tuple:
+    return r["algorithm"], r["distribution"], r["size"], r["mode"]
+
+
+def _slower(r: Dict[str, Any], b: Dict[str, Any], tolerance: float, min_time: float) -> bool:
+    """Whether a case's wall time regressed beyond `tolerance` against the baseline"""
+    if not b.get("wall_time_s") or b["wall_time_s"] < min_time or r["wall_time_s"] is None:
+        return False
+    return r["wall_time_s"] > b["wall_time_s"] * (1 + tolerance)
+
+
+def retime_slow_cases(records: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+                      tolerance: float, min_time: float = DEFAULT_MIN_TIME_S,
+                      repeat: int = DEFAULT_REPEAT, seed: int = 0) -> int:
+    """
+    Time the cases that look slower than the baseline once more
+
+    A burst of load on a shared machine can slow one case down; a real
+    regression is slow both times. The faster of the two timings is kept.
+
+    Returns:
+        Number of cases re-timed
+    """
+    base = {_case_key(b): b for b in baseline}
+    retimed = 0
+    for r in records:
+        b = base.get(_case_key(r))
+        if not r["ok"] or b is None or not _slower(r, b, tolerance, min_time):
+            continue
+        arr = make_input(r["distribution"], r["size"], seed)
+        _, best = _best_time(SORTING_ALGORITHMS[r["algorithm"]], arr,
+                             r["mode"] == "delta", repeat)
+        r["wall_time_s"] = min(r["wall_time_s"], round(best, 6))
+        retimed += 1
+    return retimed
+
+
+def compare_to_baseline(records: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+                        tolerance: float, min_time: float = DEFAULT_MIN_TIME_S) -> List[str]:
+    """
+    Compare results against a baseline run
+
+    Step counts must not grow at all. Wall time and peak memory may grow by
+    `tolerance` (relative); wall time is only compared for cases that took
+    at least `min_time` seconds in the baseline, since shorter timings are
+    mostly noise.
+
+    Returns:
+        Human-readable regression messages (empty if none)
+    """
+    base = {_case_key(b): b for b in baseline}
+    problems = []
+    for r in records:
+        b = base.get(_case_key(r))
+        if b is None:
+            continue
+        label = "{} / {} / n={} ({})".format(*_case_key(r))
+        if b.get("ok") and not r["ok"]:
+            problems.append(f"{label}: now fails ({r['error']})")
+            continue
+        if not r["ok"]:
+            continue
+        if r["steps"] > b["steps"]:
+            problems.append(f"{label}: steps {b['steps']} -> {r['steps']}")
+        if _slower(r, b, tolerance, min_time):
+            problems.append(f"{label}: wall_time_s {b['wall_time_s']} -> {r['wall_time_s']}")
+        if b.get("peak_memory_bytes") and \
+                r["peak_memory_bytes"] > b["peak_memory_bytes"] * (1 + tolerance):
+            problems.append(f"{label}: peak_memory_bytes {b['peak_memory_bytes']} -> "
+                            f"{r['peak_memory_bytes']}")
+    return problems
+
+
+def _print_record(r: Dict[str, Any]):
+    """Print one result row"""
+    status = "ok" if r["ok"] else f"FAIL {r['error']}"
+    wall = f"{r['wall_time_s']:.4f}s" if r["wall_time_s"] is not None else "-"
+    peak = f"{r['peak_memory_bytes'] / 1024:.1f}KiB" if r["peak_memory_bytes"] is not None else "-"
+    print(f"{r['algorithm']:<17} {r['distribution']:<11} {r['size']:>7} "
+          f"{r['steps']:>10} {wall:>10} {peak:>12} "
+          f"{r['alloc_bytes_per_step'] or 0:>9}B  {status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Headless benchmark for the sorting step generators")
+    parser.add_argument("--algorithms", nargs="+", default=list(SORTING_ALGORITHMS),
+                        choices=list(SORTING_ALGORITHMS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 500])
+    parser.add_argument("--distributions", nargs="+", default=DISTRIBUTIONS, choices=DISTRIBUTIONS)
+    parser.add_argument("--mode", choices=["delta", "full"], default="delta",
+                        help="step payload mode (default: delta)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"timed runs per case, best is kept (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown vs baseline (default: 0.25)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME_S,
+                        help="skip the wall time check for cases faster than this many "
+                             f"seconds in the baseline (default: {DEFAULT_MIN_TIME_S})")
+    args = parser.parse_args(argv)
+
+    print(f"{'algorithm':<17} {'input':<11} {'n':>7} {'steps':>10} {'wall':>10} "
+          f"{'peak mem':>12} {'per step':>10}  status")
+    records = run_suite(args.algorithms, args.sizes, args.distributions,
+                        delta=args.mode == "delta", repeat=args.repeat,
+                        seed=args.seed, progress=_print_record)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        retime_slow_cases(records, baseline, args.tolerance, args.min_time,
+                          args.repeat, args.seed)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(records, f, indent=2)
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+    failed = [r for r in records if not r["ok"]]
+    problems = []
+    if baseline is not None:
+        problems = compare_to_baseline(records, baseline, args.tolerance, args.min_time)
+        for msg in problems:
+            print(f"REGRESSION {msg}")
+    return 1 if failed or problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 """
 Core data structures module for DSA Visualizer
 """
-from .bst import NodeBST, BST
+from .bst import NodeBST, BST, ArrayBST
+from .balanced_bst import AVLTree, RedBlackTree, Treap
 from .graph import GraphType, HeuristicsType
-from .queue_stack import Queue, Stack
+from .queue_stack import (Queue, GrowableQueue, DequeQueue, Stack, Deque, PriorityQueue,
+                          MonotonicStack, MonotonicQueue)
 
-__all__ = ['NodeBST', 'BST', 'GraphType', 'HeuristicsType', 'Queue', 'Stack']
+__all__ = ['NodeBST', 'BST', 'ArrayBST', 'AVLTree', 'RedBlackTree', 'Treap', 'GraphType', 'HeuristicsType', 'Queue', 'GrowableQueue', 'DequeQueue', 'Stack',
+           'Deque', 'PriorityQueue', 'MonotonicStack', 'MonotonicQueue']
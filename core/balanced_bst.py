@@ -0,0 +1,434 @@
+"""
+Self-balancing binary search trees
+AVL, red-black and treap variants of BST with the same insert/delete/
+search/traversal interface. Their insert_steps/delete_steps generators
+apply the operation while yielding each rotation and recoloring, so the
+tree can be repainted between structural changes.
+
+Rebalancing walks back up the search path kept on an explicit stack, so
+nodes need no parent pointers and no operation recurses.
+"""
+from typing import Iterator, List, Optional
+import random
+
+from .bst import BST, NodeBST, Step, _drain, _size
+
+
+class BalancedBST(BST):
+    """
+    Base class for trees that rebalance with rotations
+    
+    Subclasses implement insert_steps/delete_steps; insert and delete run
+    them without visualization.
+    """
+
+    def insert(self, value: int) -> bool:
+        """Insert a value, rebalancing as needed. Returns False if duplicate."""
+        return _drain(self.insert_steps(value))
+
+    def delete(self, value: int) -> bool:
+        """Delete a value, rebalancing as needed. Returns False if not found."""
+        return _drain(self.delete_steps(value))
+
+    def _find_path(self, value: int) -> List[NodeBST]:
+        """
+        Nodes from the root down to `value`, or down to the node that would
+        become its parent if it is absent
+        """
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            if value == node.value:
+                break
+            node = node.left if value < node.value else node.right
+        return path
+
+    def _attach(self, path: List[NodeBST], node: NodeBST):
+        """Hang a new leaf under the last node of `path` (or make it the root)"""
+        for ancestor in path:
+            ancestor.size += 1
+        parent = path[-1] if path else None
+        if parent is None:
+            self.root = node
+        elif node.value < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+
+    def _splice_out(self, path: List[NodeBST]) -> List[NodeBST]:
+        """
+        Unlink the last node of `path` from the tree
+        
+        A node with two children is replaced by its in-order successor node.
+        
+        Returns:
+            The nodes whose subtrees changed, top-down: the ancestors of the
+            deleted node, then (when a successor moved) the successor and
+            the nodes between it and its old position
+        """
+        node = path[-1]
+        ancestors = path[:-1]
+        for ancestor in ancestors:
+            ancestor.size -= 1
+        parent = ancestors[-1] if ancestors else None
+        if not (node.left and node.right):
+            self._replace_child(parent, node, node.left or node.right)
+            return ancestors
+        
+        chain = []
+        succ = node.right
+        while succ.left:
+            chain.append(succ)
+            succ.size -= 1
+            succ = succ.left
+        if chain:
+            chain[-1].left = succ.right
+            succ.right = node.right
+        succ.left = node.left
+        succ.size = node.size - 1
+        self._replace_child(parent, node, succ)
+        return ancestors + [succ] + chain
+
+    def _rotate_left(self, node: NodeBST, parent: Optional[NodeBST]) -> Iterator[Step]:
+        """Rotate `node` down to the left; returns the new subtree root"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._replace_child(parent, node, pivot)
+        self._rotated(node, pivot)
+        yield ("rotate", node.value, "left")
+        return pivot
+
+    def _rotate_right(self, node: NodeBST, parent: Optional[NodeBST]) -> Iterator[Step]:
+        """Rotate `node` down to the right; returns the new subtree root"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._replace_child(parent, node, pivot)
+        self._rotated(node, pivot)
+        yield ("rotate", node.value, "right")
+        return pivot
+
+    def _rotated(self, lower: NodeBST, upper: NodeBST):
+        """Refresh node metadata after `upper` moved above `lower`"""
+        lower.size = 1 + _size(lower.left) + _size(lower.right)
+        upper.size = 1 + _size(upper.left) + _size(upper.right)
+
+
+class AVLNode(NodeBST):
+    """BST node with its subtree height"""
+    __slots__ = ("height",)
+    
+    def __init__(self, value: int):
+        super().__init__(value)
+        self.height = 1
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node else 0
+
+
+class AVLTree(BalancedBST):
+    """AVL tree: sibling subtree heights differ by at most one"""
+    
+    node_class = AVLNode
+
+    def insert_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if path and path[-1].value == value:
+            yield ("duplicate", value)
+            return False
+        self._attach(path, AVLNode(value))
+        yield ("insert", value)
+        yield from self._rebalance_path(path)
+        return True
+
+    def delete_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if not path or path[-1].value != value:
+            yield ("notfound", value)
+            return False
+        changed = self._splice_out(path)
+        yield ("delete", value)
+        yield from self._rebalance_path(changed)
+        return True
+
+    def _rebalance_path(self, path: List[AVLNode]) -> Iterator[Step]:
+        """Refresh heights and rotate bottom-up along a root-to-node path"""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            parent = path[i - 1] if i else None
+            self._update(node)
+            balance = _height(node.left) - _height(node.right)
+            if balance > 1:
+                if _height(node.left.left) < _height(node.left.right):
+                    yield from self._rotate_left(node.left, node)
+                yield from self._rotate_right(node, parent)
+            elif balance < -1:
+                if _height(node.right.right) < _height(node.right.left):
+                    yield from self._rotate_right(node.right, node)
+                yield from self._rotate_left(node, parent)
+
+    @staticmethod
+    def _update(node: AVLNode):
+        node.height = 1 + max(_height(node.left), _height(node.right))
+
+    def _built(self, node: AVLNode, depth: int, levels: int):
+        # A balanced subtree of n nodes has the minimum height
+        node.height = node.size.bit_length()
+
+    def _rotated(self, lower: AVLNode, upper: AVLNode):
+        super()._rotated(lower, upper)
+        self._update(lower)
+        self._update(upper)
+
+
+class RBNode(NodeBST):
+    """BST node with its red-black color"""
+    __slots__ = ("red",)
+    
+    def __init__(self, value: int):
+        super().__init__(value)
+        self.red = True
+
+
+def _is_red(node: Optional[RBNode]) -> bool:
+    return node is not None and node.red
+
+
+class RedBlackTree(BalancedBST):
+    """
+    Red-black tree: no red node has a red child and every root-to-leaf path
+    has the same number of black nodes
+    """
+    
+    node_class = RBNode
+
+    def insert_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if path and path[-1].value == value:
+            yield ("duplicate", value)
+            return False
+        node = RBNode(value)
+        self._attach(path, node)
+        yield ("insert", value)
+        
+        # path holds the new node's ancestors; fix red-red violations upwards
+        while path and path[-1].red:
+            parent = path[-1]
+            grand = path[-2]  # A red parent is never the root
+            uncle = grand.right if parent is grand.left else grand.left
+            if _is_red(uncle):
+                parent.red = uncle.red = False
+                grand.red = True
+                yield ("recolor", grand.value)
+                node = grand
+                del path[-2:]
+                continue
+            great = path[-3] if len(path) >= 3 else None
+            if parent is grand.left:
+                if node is parent.right:
+                    yield from self._rotate_left(parent, grand)
+                    parent = node
+                yield from self._rotate_right(grand, great)
+            else:
+                if node is parent.left:
+                    yield from self._rotate_right(parent, grand)
+                    parent = node
+                yield from self._rotate_left(grand, great)
+            parent.red = False
+            grand.red = True
+            yield ("recolor", parent.value)
+            break
+        if self.root.red:
+            self.root.red = False
+            yield ("recolor", self.root.value)
+        return True
+
+    def delete_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if not path or path[-1].value != value:
+            yield ("notfound", value)
+            return False
+        node = path[-1]
+        if node.left and node.right:
+            # The successor takes the node's place and color; the color that
+            # disappears is the successor's, from its old position
+            succ_parent = node
+            succ = node.right
+            while succ.left:
+                succ_parent = succ
+                succ = succ.left
+            removed_red = succ.red
+            x = succ.right
+            x_is_left = succ_parent is not node
+            changed = self._splice_out(path)
+            succ.red = node.red
+        else:
+            removed_red = node.red
+            x = node.left or node.right
+            parent = path[-2] if len(path) > 1 else None
+            x_is_left = parent is not None and parent.left is node
+            changed = self._splice_out(path)
+        yield ("delete", value)
+        if not removed_red:
+            yield from self._fix_delete(x, x_is_left, changed)
+        return True
+
+    def _built(self, node: RBNode, depth: int, levels: int):
+        # Coloring only the possibly partial deepest level red keeps the
+        # black height equal on every path
+        node.red = 0 < depth == levels - 1
+
+    def _fix_delete(self, x: Optional[RBNode], x_is_left: bool,
+                    path: List[RBNode]) -> Iterator[Step]:
+        """
+        Restore black heights after a black node was removed
+        
+        Args:
+            x: Node that took the removed node's place (may be None)
+            x_is_left: Whether x is its parent's left child
+            path: x's ancestors, top-down
+        """
+        while path and not _is_red(x):
+            parent = path[-1]
+            grand = path[-2] if len(path) >= 2 else None
+            if x_is_left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    yield from self._rotate_left(parent, grand)
+                    path.insert(len(path) - 1, sibling)
+                    grand = sibling
+                    sibling = parent.right
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    yield ("recolor", sibling.value)
+                    x = path.pop()
+                    x_is_left = bool(path) and path[-1].left is x
+                    continue
+                if not _is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    yield from self._rotate_right(sibling, parent)
+                    sibling = parent.right
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                yield from self._rotate_left(parent, grand)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    yield from self._rotate_right(parent, grand)
+                    path.insert(len(path) - 1, sibling)
+                    grand = sibling
+                    sibling = parent.left
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    yield ("recolor", sibling.value)
+                    x = path.pop()
+                    x_is_left = bool(path) and path[-1].left is x
+                    continue
+                if not _is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    yield from self._rotate_left(sibling, parent)
+                    sibling = parent.left
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                yield from self._rotate_right(parent, grand)
+            yield ("recolor", parent.value)
+            x = self.root
+            break
+        if x is not None and x.red:
+            x.red = False
+            yield ("recolor", x.value)
+
+
+class TreapNode(NodeBST):
+    """BST node with a random heap priority"""
+    __slots__ = ("priority",)
+    
+    def __init__(self, value: int, priority: float):
+        super().__init__(value)
+        self.priority = priority
+
+
+class Treap(BalancedBST):
+    """
+    Treap: a BST on values that is also a max-heap on random priorities,
+    which keeps the expected height logarithmic
+    
+    Args:
+        seed: Seed for the priority generator (None = random)
+    """
+    
+    node_class = TreapNode
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__()
+        self._rng = random.Random(seed)
+
+    def insert_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if path and path[-1].value == value:
+            yield ("duplicate", value)
+            return False
+        node = TreapNode(value, self._rng.random())
+        self._attach(path, node)
+        yield ("insert", value)
+        # Rotate the new node up while it outranks its parent
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            grand = path[-1] if path else None
+            if parent.left is node:
+                yield from self._rotate_right(parent, grand)
+            else:
+                yield from self._rotate_left(parent, grand)
+        return True
+
+    def _build_sorted(self, values: List[int]):
+        """
+        Build a treap over sorted values in O(n)
+        
+        Each value gets a random priority and the Cartesian tree is built
+        with a stack holding the right spine, as in a sorted insert.
+        """
+        spine: List[TreapNode] = []
+        for value in values:
+            node = TreapNode(value, self._rng.random())
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        self.root = spine[0] if spine else None
+        for node, _ in self.iter_nodes("postorder"):
+            node.size = 1 + _size(node.left) + _size(node.right)
+
+    def delete_steps(self, value: int) -> Iterator[Step]:
+        path = self._find_path(value)
+        if not path or path[-1].value != value:
+            yield ("notfound", value)
+            return False
+        node = path.pop()
+        parent = path[-1] if path else None
+        # Rotate the node down, lifting its higher-priority child, until it
+        # has at most one child
+        while node.left and node.right:
+            if node.left.priority > node.right.priority:
+                parent = yield from self._rotate_right(node, parent)
+            else:
+                parent = yield from self._rotate_left(node, parent)
+        for ancestor in self._find_path(value)[:-1]:
+            ancestor.size -= 1
+        self._replace_child(parent, node, node.left or node.right)
+        yield ("delete", value)
+        return True
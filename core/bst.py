@@ -1,124 +1,680 @@
 """
 Binary Search Tree implementation
 """
-from typing import Optional, List
+from array import array
+from typing import Any, Iterable, Iterator, Optional, List, Tuple
+
+# Visualization step: (kind, value, ...) where value identifies a node
+Step = Tuple[Any, ...]
+
+
+def _drain(steps: Iterator[Step]):
+    """Run a step generator to completion and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _size(node: Optional["NodeBST"]) -> int:
+    return node.size if node else 0
 
 
 class NodeBST:
-    """Node for Binary Search Tree"""
+    """
+    Node for Binary Search Tree
+    
+    Nodes hold the key, child links and the size of their subtree (for
+    order-statistic queries); drawing coordinates live in the canvas that
+    lays the tree out.
+    """
+    __slots__ = ("value", "left", "right", "size")
+    
     def __init__(self, value: int):
         self.value = value
         self.left: Optional["NodeBST"] = None
         self.right: Optional["NodeBST"] = None
-        # Drawing coordinates
-        self.x = 0
-        self.y = 0
-        self.canvas_x = 0
-        self.canvas_y = 0
+        self.size = 1
 
 
 class BST:
-    """Binary Search Tree with insert, delete, search, and traversal operations"""
+    """
+    Binary Search Tree with insert, delete, search, and traversal operations
+    
+    All operations walk the tree with loops and explicit stacks rather than
+    recursion, so degenerate (chain-shaped) trees of any height work.
+    Subtree sizes make the order-statistic queries (select, rank,
+    range_count, floor/ceiling, ...) O(height).
+    """
+    
+    node_class = NodeBST
     
     def __init__(self):
         self.root: Optional[NodeBST] = None
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> "BST":
+        """
+        Build a balanced tree from strictly increasing values in O(n)
+        
+        Raises:
+            ValueError: If the values are not strictly increasing
+        """
+        values = list(values)
+        for prev, value in zip(values, values[1:]):
+            if not prev < value:
+                raise ValueError(f"Values must be strictly increasing: {prev} before {value}")
+        tree = cls()
+        tree._build_sorted(values)
+        return tree
+
+    def bulk_insert(self, values: Iterable[int]) -> int:
+        """
+        Insert many values at once
+        
+        The new values are sorted and deduplicated, merged with the tree's
+        in-order values in one pass and the tree is rebuilt balanced from
+        the result, in O(n + m log m) instead of m separate inserts.
+        
+        Returns:
+            The number of values actually added
+        """
+        new = sorted(set(values))
+        old = self.inorder()
+        merged: List[int] = []
+        i = j = 0
+        while i < len(old) and j < len(new):
+            if old[i] < new[j]:
+                merged.append(old[i])
+                i += 1
+            elif new[j] < old[i]:
+                merged.append(new[j])
+                j += 1
+            else:
+                merged.append(old[i])
+                i += 1
+                j += 1
+        merged.extend(old[i:])
+        merged.extend(new[j:])
+        self._build_sorted(merged)
+        return len(merged) - len(old)
+
+    def _build_sorted(self, values: List[int]):
+        """Replace the tree with a balanced one over sorted, distinct values"""
+        levels = len(values).bit_length()
+        make = self.node_class
+        self.root = None
+        # (first index, last index, parent, is left child, depth)
+        pending = [(0, len(values) - 1, None, False, 0)] if values else []
+        while pending:
+            lo, hi, parent, is_left, depth = pending.pop()
+            mid = (lo + hi) // 2
+            node = make(values[mid])
+            node.size = hi - lo + 1
+            self._built(node, depth, levels)
+            if parent is None:
+                self.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                pending.append((lo, mid - 1, node, True, depth + 1))
+            if mid < hi:
+                pending.append((mid + 1, hi, node, False, depth + 1))
+
+    def _built(self, node: NodeBST, depth: int, levels: int):
+        """
+        Hook to set node metadata during _build_sorted
+        
+        Sibling subtrees differ in size by at most one, so every level but
+        the deepest (depth == levels - 1) is full.
+        """
+
+    def plain_copy(self) -> "BST":
+        """Copy into a plain BST of the same shape in O(n)"""
+        tree = BST()
+        copies = {}
+        order = [node for node, _ in self.iter_nodes("preorder")]
+        for node in order:
+            copy = copies[node] = NodeBST(node.value)
+            copy.size = node.size
+        for node in order:
+            copy = copies[node]
+            if node.left is not None:
+                copy.left = copies[node.left]
+            if node.right is not None:
+                copy.right = copies[node.right]
+        tree.root = copies[self.root] if self.root is not None else None
+        return tree
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
     def insert(self, value: int) -> bool:
         """Insert a value into the BST. Returns True if successful, False if duplicate."""
-        if self.root is None:
-            self.root = NodeBST(value)
-            return True
-        return self._insert(self.root, value)
-
-    def _insert(self, node: NodeBST, value: int) -> bool:
-        if value == node.value:
-            return False  # Duplicate
-        if value < node.value:
-            if node.left:
-                return self._insert(node.left, value)
-            else:
-                node.left = NodeBST(value)
-                return True
+        path = []
+        node = self.root
+        while node:
+            if value == node.value:
+                return False  # Duplicate
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        for ancestor in path:
+            ancestor.size += 1
+        parent = path[-1] if path else None
+        new = NodeBST(value)
+        if parent is None:
+            self.root = new
+        elif value < parent.value:
+            parent.left = new
         else:
-            if node.right:
-                return self._insert(node.right, value)
-            else:
-                node.right = NodeBST(value)
-                return True
+            parent.right = new
+        return True
 
     def search(self, value: int) -> Optional[NodeBST]:
         """Search for a value in the BST. Returns the node if found, None otherwise."""
-        return self._search(self.root, value)
-
-    def _search(self, node: Optional[NodeBST], value: int) -> Optional[NodeBST]:
-        if not node:
-            return None
-        if node.value == value:
-            return node
-        if value < node.value:
-            return self._search(node.left, value)
-        return self._search(node.right, value)
+        node = self.root
+        while node and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
 
     def delete(self, value: int) -> bool:
         """Delete a value from the BST. Returns True if successful, False if not found."""
-        self.root, deleted = self._delete(self.root, value)
-        return deleted
-
-    def _delete(self, node: Optional[NodeBST], value: int):
+        path = []
+        node = self.root
+        while node and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
         if node is None:
-            return None, False
-        if value < node.value:
-            node.left, deleted = self._delete(node.left, value)
-            return node, deleted
-        elif value > node.value:
-            node.right, deleted = self._delete(node.right, value)
-            return node, deleted
-        else:
-            # Found the node to delete
-            if node.left is None:
-                return node.right, True
-            if node.right is None:
-                return node.left, True
-            # Node has two children - find successor
+            return False
+        for ancestor in path:
+            ancestor.size -= 1
+        
+        if node.left and node.right:
+            # Two children: splice the in-order successor into the node's place
+            succ_parent = node
             succ = node.right
             while succ.left:
+                succ_parent = succ
+                succ.size -= 1
                 succ = succ.left
-            node.value = succ.value
-            node.right, _ = self._delete(node.right, succ.value)
-            return node, True
+            if succ_parent is not node:
+                succ_parent.left = succ.right
+                succ.right = node.right
+            succ.left = node.left
+            succ.size = node.size - 1
+            replacement = succ
+        else:
+            replacement = node.left or node.right
+        self._replace_child(path[-1] if path else None, node, replacement)
+        return True
+
+    def insert_steps(self, value: int) -> Iterator[Step]:
+        """
+        insert, yielding the structural changes as visualizable steps
+        
+        Yields ("insert", value) or ("duplicate", value); balanced subclasses
+        also yield their rotations and recolorings. Returns the same result
+        as insert().
+        """
+        inserted = self.insert(value)
+        yield ("insert" if inserted else "duplicate", value)
+        return inserted
+
+    def delete_steps(self, value: int) -> Iterator[Step]:
+        """
+        delete, yielding ("delete", value) or ("notfound", value) plus any
+        rebalancing steps. Returns the same result as delete().
+        """
+        deleted = self.delete(value)
+        yield ("delete" if deleted else "notfound", value)
+        return deleted
+
+    def _replace_child(self, parent: Optional[NodeBST], old: NodeBST, new: Optional[NodeBST]):
+        """Point `parent` (or the root) at `new` instead of `old`"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def select_steps(self, k: int) -> Iterator[Step]:
+        """
+        select, yielding ("visit", value) for each node on the search path
+        
+        Returns the same result as select().
+        """
+        if not 0 <= k < len(self):
+            raise IndexError(f"select index {k} out of range for {len(self)} keys")
+        node = self.root
+        while node:
+            yield ("visit", node.value)
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.value
+            else:
+                k -= left + 1
+                node = node.right
+
+    def select(self, k: int) -> int:
+        """
+        Return the k-th smallest value (0-based)
+        
+        Raises:
+            IndexError: If k is not in 0..len-1
+        """
+        return _drain(self.select_steps(k))
+
+    def rank_steps(self, value: int, inclusive: bool = False) -> Iterator[Step]:
+        """
+        rank, yielding ("visit", value) for each node on the search path
+        
+        Args:
+            value: Value to rank; it need not be in the tree
+            inclusive: Count values equal to `value` too
+        
+        Returns the same result as rank().
+        """
+        count = 0
+        node = self.root
+        while node:
+            yield ("visit", node.value)
+            if node.value < value or (inclusive and node.value == value):
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def rank(self, value: int) -> int:
+        """Return the number of values smaller than `value`"""
+        return _drain(self.rank_steps(value))
+
+    def range_count_steps(self, low: int, high: int) -> Iterator[Step]:
+        """range_count, yielding the visits of both boundary searches"""
+        if low > high:
+            return 0
+        upto_high = yield from self.rank_steps(high, inclusive=True)
+        below_low = yield from self.rank_steps(low)
+        return upto_high - below_low
+
+    def range_count(self, low: int, high: int) -> int:
+        """Return the number of values in [low, high]"""
+        return _drain(self.range_count_steps(low, high))
+
+    def range_iter(self, low: int, high: int) -> Iterator[int]:
+        """
+        Lazily yield the values in [low, high] in ascending order
+        
+        Subtrees outside the range are never entered, so producing m values
+        costs O(height + m). The tree must not be modified while iterating.
+        """
+        stack: List[NodeBST] = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.value < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > high:
+                return
+            yield node.value
+            node = node.right
+
+    def bound_steps(self, value: int, below: bool, strict: bool) -> Iterator[Step]:
+        """
+        Closest value on one side of `value`, yielding ("visit", value) steps
+        
+        Args:
+            below: Look for values smaller (True) or larger (False)
+            strict: Exclude `value` itself
+        
+        Returns:
+            The value found, or None when there is none
+        """
+        best = None
+        node = self.root
+        while node:
+            yield ("visit", node.value)
+            current = node.value
+            if current == value and not strict:
+                return current
+            if current != value and (current < value) == below:
+                best = current
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return best
+
+    def floor(self, value: int) -> Optional[int]:
+        """Largest value <= `value`, or None"""
+        return _drain(self.bound_steps(value, below=True, strict=False))
+
+    def ceiling(self, value: int) -> Optional[int]:
+        """Smallest value >= `value`, or None"""
+        return _drain(self.bound_steps(value, below=False, strict=False))
+
+    def successor(self, value: int) -> Optional[int]:
+        """Smallest value > `value`, or None"""
+        return _drain(self.bound_steps(value, below=False, strict=True))
+
+    def predecessor(self, value: int) -> Optional[int]:
+        """Largest value < `value`, or None"""
+        return _drain(self.bound_steps(value, below=True, strict=True))
+
+    def iter_nodes(self, order: str = "inorder") -> Iterator[Tuple[NodeBST, int]]:
+        """
+        Lazily walk the tree
+        
+        The tree must not be modified while the walk is in progress.
+        
+        Args:
+            order: "inorder", "preorder" or "postorder"
+        
+        Yields:
+            (node, depth) pairs, the root at depth 0
+        """
+        if order == "inorder":
+            stack: List[Tuple[NodeBST, int]] = []
+            node, depth = self.root, 0
+            while stack or node:
+                while node:
+                    stack.append((node, depth))
+                    node, depth = node.left, depth + 1
+                node, depth = stack.pop()
+                yield node, depth
+                node, depth = node.right, depth + 1
+        elif order == "preorder":
+            stack = [(self.root, 0)] if self.root else []
+            while stack:
+                node, depth = stack.pop()
+                yield node, depth
+                if node.right:
+                    stack.append((node.right, depth + 1))
+                if node.left:
+                    stack.append((node.left, depth + 1))
+        elif order == "postorder":
+            # Each node is pushed twice: to expand its children, then to emit it
+            pending = [(self.root, 0, False)] if self.root else []
+            while pending:
+                node, depth, expanded = pending.pop()
+                if expanded:
+                    yield node, depth
+                    continue
+                pending.append((node, depth, True))
+                if node.right:
+                    pending.append((node.right, depth + 1, False))
+                if node.left:
+                    pending.append((node.left, depth + 1, False))
+        else:
+            raise ValueError(f"Unknown traversal order: {order}")
+
+    def iter_inorder(self) -> Iterator[int]:
+        """Lazily yield values in inorder"""
+        return (node.value for node, _ in self.iter_nodes("inorder"))
+
+    def iter_preorder(self) -> Iterator[int]:
+        """Lazily yield values in preorder"""
+        return (node.value for node, _ in self.iter_nodes("preorder"))
+
+    def iter_postorder(self) -> Iterator[int]:
+        """Lazily yield values in postorder"""
+        return (node.value for node, _ in self.iter_nodes("postorder"))
 
     def inorder(self) -> List[int]:
         """Return inorder traversal of the BST"""
-        res = []
-        self._in(self.root, res)
-        return res
-
-    def _in(self, node: Optional[NodeBST], arr: List[int]):
-        if node:
-            self._in(node.left, arr)
-            arr.append(node.value)
-            self._in(node.right, arr)
+        return list(self.iter_inorder())
 
     def preorder(self) -> List[int]:
         """Return preorder traversal of the BST"""
-        res = []
-        self._pre(self.root, res)
-        return res
-
-    def _pre(self, node: Optional[NodeBST], arr: List[int]):
-        if node:
-            arr.append(node.value)
-            self._pre(node.left, arr)
-            self._pre(node.right, arr)
+        return list(self.iter_preorder())
 
     def postorder(self) -> List[int]:
         """Return postorder traversal of the BST"""
-        res = []
-        self._post(self.root, res)
-        return res
-
-    def _post(self, node: Optional[NodeBST], arr: List[int]):
-        if node:
-            self._post(node.left, arr)
-            self._post(node.right, arr)
-            arr.append(node.value)
+        return list(self.iter_postorder())
+
+
+# Child index meaning "no child" in ArrayBST
+NIL = -1
+
+
+class ArrayBST:
+    """
+    Binary Search Tree stored as a struct of arrays
+    
+    Node i has key ``keys[i]`` and children ``left[i]``/``right[i]`` (NIL when
+    absent), each a machine-integer ``array('q')``, so a node costs 24 bytes
+    instead of a Python object. Deleted slots are reused through a free
+    list threaded through ``left``. Keys must fit in a signed 64-bit int.
+    
+    Nodes are identified by slot index: search returns an index and
+    iter_nodes yields (index, depth) pairs.
+    
+    This is a standalone store for trees too large to keep as node objects
+    (e.g. million-node chains); the visualizer draws linked BSTs, so convert
+    with to_bst/from_bst, which copy the shape in O(n).
+    """
+    
+    __slots__ = ("keys", "left", "right", "root", "_free", "_size")
+    
+    def __init__(self, values: Iterable[int] = ()):
+        self.keys = array("q")
+        self.left = array("q")
+        self.right = array("q")
+        self.root = NIL
+        self._free = NIL
+        self._size = 0
+        for value in values:
+            self.insert(value)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __contains__(self, value: int) -> bool:
+        return self.search(value) is not None
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the node arrays"""
+        return sum(a.itemsize * len(a) for a in (self.keys, self.left, self.right))
+    
+    def _new_node(self, value: int) -> int:
+        if self._free != NIL:
+            i = self._free
+            self._free = self.left[i]
+            self.keys[i] = value
+            self.left[i] = self.right[i] = NIL
+            return i
+        self.keys.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.keys) - 1
+    
+    def insert(self, value: int) -> bool:
+        """Insert a value. Returns True if successful, False if duplicate."""
+        keys, left, right = self.keys, self.left, self.right
+        parent = NIL
+        i = self.root
+        while i != NIL:
+            key = keys[i]
+            if value == key:
+                return False
+            parent = i
+            i = left[i] if value < key else right[i]
+        new = self._new_node(value)
+        if parent == NIL:
+            self.root = new
+        elif value < keys[parent]:
+            left[parent] = new
+        else:
+            right[parent] = new
+        self._size += 1
+        return True
+    
+    def search(self, value: int) -> Optional[int]:
+        """Search for a value. Returns its slot index if found, None otherwise."""
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root
+        while i != NIL:
+            key = keys[i]
+            if value == key:
+                return i
+            i = left[i] if value < key else right[i]
+        return None
+    
+    def delete(self, value: int) -> bool:
+        """Delete a value. Returns True if successful, False if not found."""
+        keys, left, right = self.keys, self.left, self.right
+        parent = NIL
+        i = self.root
+        while i != NIL and keys[i] != value:
+            parent = i
+            i = left[i] if value < keys[i] else right[i]
+        if i == NIL:
+            return False
+        
+        if left[i] != NIL and right[i] != NIL:
+            # Two children: splice the in-order successor into the slot's place
+            succ_parent = i
+            succ = right[i]
+            while left[succ] != NIL:
+                succ_parent = succ
+                succ = left[succ]
+            if succ_parent != i:
+                left[succ_parent] = right[succ]
+                right[succ] = right[i]
+            left[succ] = left[i]
+            replacement = succ
+        else:
+            replacement = left[i] if left[i] != NIL else right[i]
+        
+        if parent == NIL:
+            self.root = replacement
+        elif left[parent] == i:
+            left[parent] = replacement
+        else:
+            right[parent] = replacement
+        
+        left[i] = self._free
+        right[i] = NIL
+        self._free = i
+        self._size -= 1
+        return True
+    
+    def iter_nodes(self, order: str = "inorder") -> Iterator[Tuple[int, int]]:
+        """
+        Lazily walk the tree like BST.iter_nodes
+        
+        Yields:
+            (slot index, depth) pairs
+        """
+        left, right = self.left, self.right
+        if order == "inorder":
+            stack: List[Tuple[int, int]] = []
+            i, depth = self.root, 0
+            while stack or i != NIL:
+                while i != NIL:
+                    stack.append((i, depth))
+                    i, depth = left[i], depth + 1
+                i, depth = stack.pop()
+                yield i, depth
+                i, depth = right[i], depth + 1
+        elif order == "preorder":
+            stack = [(self.root, 0)] if self.root != NIL else []
+            while stack:
+                i, depth = stack.pop()
+                yield i, depth
+                if right[i] != NIL:
+                    stack.append((right[i], depth + 1))
+                if left[i] != NIL:
+                    stack.append((left[i], depth + 1))
+        elif order == "postorder":
+            pending = [(self.root, 0, False)] if self.root != NIL else []
+            while pending:
+                i, depth, expanded = pending.pop()
+                if expanded:
+                    yield i, depth
+                    continue
+                pending.append((i, depth, True))
+                if right[i] != NIL:
+                    pending.append((right[i], depth + 1, False))
+                if left[i] != NIL:
+                    pending.append((left[i], depth + 1, False))
+        else:
+            raise ValueError(f"Unknown traversal order: {order}")
+    
+    def iter_inorder(self) -> Iterator[int]:
+        """Lazily yield values in inorder"""
+        keys = self.keys
+        return (keys[i] for i, _ in self.iter_nodes("inorder"))
+    
+    def inorder(self) -> List[int]:
+        """Return inorder traversal"""
+        return list(self.iter_inorder())
+    
+    def preorder(self) -> List[int]:
+        """Return preorder traversal"""
+        keys = self.keys
+        return [keys[i] for i, _ in self.iter_nodes("preorder")]
+    
+    def postorder(self) -> List[int]:
+        """Return postorder traversal"""
+        keys = self.keys
+        return [keys[i] for i, _ in self.iter_nodes("postorder")]
+    
+    def to_bst(self) -> BST:
+        """Copy into a linked BST of the same shape in O(n)"""
+        tree = BST()
+        if self.root == NIL:
+            return tree
+        keys, left, right = self.keys, self.left, self.right
+        nodes: List[Optional[NodeBST]] = [None] * len(keys)
+        order = [i for i, _ in self.iter_nodes("preorder")]
+        for i in order:
+            nodes[i] = NodeBST(keys[i])
+        # Children follow their parent in preorder, so reversed order links
+        # each subtree (and knows its size) before its parent
+        for i in reversed(order):
+            node = nodes[i]
+            if left[i] != NIL:
+                node.left = nodes[left[i]]
+                node.size += node.left.size
+            if right[i] != NIL:
+                node.right = nodes[right[i]]
+                node.size += node.right.size
+        tree.root = nodes[self.root]
+        return tree
+    
+    @classmethod
+    def from_bst(cls, tree: BST) -> "ArrayBST":
+        """Copy a linked BST into array storage, keeping its shape, in O(n)"""
+        store = cls()
+        if tree.root is None:
+            return store
+        # Slots are assigned in preorder, so the root lands in slot 0
+        order: List[NodeBST] = []
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        slot = {node: i for i, node in enumerate(order)}
+        store.keys = array("q", (node.value for node in order))
+        store.left = array("q", (slot[n.left] if n.left is not None else NIL for n in order))
+        store.right = array("q", (slot[n.right] if n.right is not None else NIL for n in order))
+        store.root = 0
+        store._size = len(order)
+        return store
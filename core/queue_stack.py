@@ -1,49 +1,334 @@
 """
-Queue and Stack data structures with fixed size
+Queue and Stack data structures
+
+``Queue`` is a fixed-size circular buffer. ``GrowableQueue`` doubles (and
+halves) its buffer as needed and ``DequeQueue`` is backed by
+``collections.deque``; both are unbounded unless given a ``max_size``.
+``Stack`` sits on a Python list, which is already a doubling array, so it is
+unbounded with ``max_size=None``.
+
+``Deque``, ``PriorityQueue`` (binary heap with decrease-key),
+``MonotonicStack`` and ``MonotonicQueue`` also offer step-yielding versions
+of their operations for visualization.
 """
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import (Any, Deque as DequeType, Dict, Hashable, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple, Union)
+import random
 
 
 class Queue:
-    """Fixed-size Queue implementation (FIFO)"""
+    """
+    Fixed-size Queue implementation (FIFO)
+    
+    Items live in a circular buffer: ``head`` is the slot of the front item
+    and ``tail`` the slot the next item goes into, so enqueue and dequeue
+    are O(1).
+    """
+    
+    __slots__ = ("max_size", "_buffer", "_head", "_tail", "_size")
     
     def __init__(self, max_size: int):
         self.max_size = max_size
-        self.items: List[str] = []
+        self._buffer: List[Optional[str]] = [None] * max_size
+        self._head = 0
+        self._tail = 0
+        self._size = 0
+    
+    @property
+    def items(self) -> List[str]:
+        """Items in logical order, front first"""
+        return list(self)
+    
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the buffer"""
+        return len(self._buffer)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate from front to rear"""
+        buf, cap = self._buffer, len(self._buffer)
+        for k in range(self._size):
+            yield buf[(self._head + k) % cap]
+    
+    def window(self, count: int) -> List[str]:
+        """Up to `count` items from the front, front first"""
+        return list(islice(self, max(count, 0)))
     
     def enqueue(self, item: str) -> bool:
         """Add item to rear of queue. Returns True if successful, False if full."""
         if self.is_full():
             return False
-        self.items.append(item)
+        self._buffer[self._tail] = item
+        self._tail = (self._tail + 1) % len(self._buffer)
+        self._size += 1
         return True
     
     def dequeue(self) -> Optional[str]:
         """Remove and return item from front of queue. Returns None if empty."""
         if self.is_empty():
             return None
-        return self.items.pop(0)
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+        return item
+    
+    def peek(self) -> Optional[str]:
+        """Return the front item without removing it. Returns None if empty."""
+        if self.is_empty():
+            return None
+        return self._buffer[self._head]
+    
+    def enqueue_many(self, items: Iterable[str]) -> int:
+        """
+        Add items to the rear in order until the queue is full
+        
+        Returns:
+            Number of items added
+        """
+        cap = len(self._buffer)
+        items = list(items)[:cap - self._size]
+        count = len(items)
+        if not count:
+            return 0
+        # Copy in at most two slices: up to the end of the buffer, then wrapped
+        first = min(count, cap - self._tail)
+        self._buffer[self._tail:self._tail + first] = items[:first]
+        self._buffer[:count - first] = items[first:]
+        self._tail = (self._tail + count) % cap
+        self._size += count
+        return count
+    
+    def dequeue_many(self, count: int) -> List[str]:
+        """
+        Remove up to `count` items from the front
+        
+        Returns:
+            The removed items, front first
+        """
+        count = max(0, min(count, self._size))
+        if not count:
+            return []
+        cap = len(self._buffer)
+        first = min(count, cap - self._head)
+        out = self._buffer[self._head:self._head + first] + self._buffer[:count - first]
+        self._buffer[self._head:self._head + first] = [None] * first
+        self._buffer[:count - first] = [None] * (count - first)
+        self._head = (self._head + count) % cap
+        self._size -= count
+        return out
     
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return len(self.items) == 0
+        return self._size == 0
     
     def is_full(self) -> bool:
         """Check if queue is full"""
-        return len(self.items) >= self.max_size
+        return self._size >= self.max_size
     
     def clear(self):
         """Clear all items from queue"""
-        self.items = []
+        self._buffer = [None] * self.max_size
+        self._head = self._tail = self._size = 0
+
+
+class GrowableQueue(Queue):
+    """
+    Queue on a circular buffer that doubles when full and halves when a
+    quarter full, so every operation is amortized O(1)
+    
+    Args:
+        max_size: Item limit (None = unbounded)
+    """
+    
+    __slots__ = ()
+    
+    INITIAL_CAPACITY = 8
+    
+    def __init__(self, max_size: Optional[int] = None):
+        super().__init__(self._initial_capacity(max_size))
+        self.max_size = max_size
+    
+    def _initial_capacity(self, max_size: Optional[int]) -> int:
+        if max_size is None:
+            return self.INITIAL_CAPACITY
+        return max(min(self.INITIAL_CAPACITY, max_size), 1)
+    
+    def _resize(self, capacity: int):
+        """Move the items to a new buffer of `capacity` slots, front at slot 0"""
+        items = self.items
+        self._buffer = items + [None] * (capacity - len(items))
+        self._head = 0
+        self._tail = self._size % capacity
+    
+    def _reserve(self, size: int):
+        """Grow the buffer by doubling until it holds `size` items"""
+        cap = len(self._buffer)
+        if size <= cap:
+            return
+        while cap < size:
+            cap *= 2
+        if self.max_size is not None:
+            cap = min(cap, self.max_size)
+        self._resize(cap)
+    
+    def _shrink(self):
+        cap = len(self._buffer)
+        if cap > self.INITIAL_CAPACITY and self._size <= cap // 4:
+            self._resize(max(cap // 2, self.INITIAL_CAPACITY))
+    
+    def enqueue(self, item: str) -> bool:
+        """Add item to rear of queue. Returns False only if max_size is reached."""
+        if self.is_full():
+            return False
+        self._reserve(self._size + 1)
+        return super().enqueue(item)
+    
+    def dequeue(self) -> Optional[str]:
+        """Remove and return item from front of queue. Returns None if empty."""
+        item = super().dequeue()
+        self._shrink()
+        return item
+    
+    def enqueue_many(self, items: Iterable[str]) -> int:
+        """
+        Add items to the rear in order until max_size is reached
+        
+        Returns:
+            Number of items added
+        """
+        items = list(items)
+        if self.max_size is not None:
+            items = items[:self.max_size - self._size]
+        self._reserve(self._size + len(items))
+        return super().enqueue_many(items)
+    
+    def dequeue_many(self, count: int) -> List[str]:
+        """
+        Remove up to `count` items from the front
+        
+        Returns:
+            The removed items, front first
+        """
+        out = super().dequeue_many(count)
+        self._shrink()
+        return out
+    
+    def is_full(self) -> bool:
+        """Check if max_size is reached (never true when unbounded)"""
+        return self.max_size is not None and self._size >= self.max_size
+    
+    def clear(self):
+        """Clear all items from queue"""
+        self._buffer = [None] * self._initial_capacity(self.max_size)
+        self._head = self._tail = self._size = 0
+
+
+class DequeQueue:
+    """
+    Queue backed by collections.deque
+    
+    Args:
+        max_size: Item limit (None = unbounded)
+    """
+    
+    __slots__ = ("max_size", "_items")
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self._items: DequeType[str] = deque()
+    
+    @property
+    def items(self) -> List[str]:
+        """Items in logical order, front first"""
+        return list(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate from front to rear"""
+        return iter(self._items)
+    
+    def window(self, count: int) -> List[str]:
+        """Up to `count` items from the front, front first"""
+        return list(islice(self._items, max(count, 0)))
+    
+    def enqueue(self, item: str) -> bool:
+        """Add item to rear of queue. Returns False only if max_size is reached."""
+        if self.is_full():
+            return False
+        self._items.append(item)
+        return True
+    
+    def dequeue(self) -> Optional[str]:
+        """Remove and return item from front of queue. Returns None if empty."""
+        return self._items.popleft() if self._items else None
+    
+    def peek(self) -> Optional[str]:
+        """Return the front item without removing it. Returns None if empty."""
+        return self._items[0] if self._items else None
+    
+    def enqueue_many(self, items: Iterable[str]) -> int:
+        """
+        Add items to the rear in order until max_size is reached
+        
+        Returns:
+            Number of items added
+        """
+        items = list(items)
+        if self.max_size is not None:
+            items = items[:self.max_size - len(self._items)]
+        self._items.extend(items)
+        return len(items)
+    
+    def dequeue_many(self, count: int) -> List[str]:
+        """
+        Remove up to `count` items from the front
+        
+        Returns:
+            The removed items, front first
+        """
+        popleft = self._items.popleft
+        return [popleft() for _ in range(max(0, min(count, len(self._items))))]
+    
+    def is_empty(self) -> bool:
+        """Check if queue is empty"""
+        return not self._items
+    
+    def is_full(self) -> bool:
+        """Check if max_size is reached (never true when unbounded)"""
+        return self.max_size is not None and len(self._items) >= self.max_size
+    
+    def clear(self):
+        """Clear all items from queue"""
+        self._items.clear()
 
 
 class Stack:
-    """Fixed-size Stack implementation (LIFO)"""
+    """
+    Stack implementation (LIFO)
     
-    def __init__(self, max_size: int):
+    Args:
+        max_size: Item limit (None = unbounded)
+    """
+    
+    def __init__(self, max_size: Optional[int]):
         self.max_size = max_size
         self.items: List[str] = []
     
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def window(self, count: int) -> List[str]:
+        """Up to `count` items from the top, top first"""
+        return self.items[:-count - 1:-1] if count > 0 else []
+    
     def push(self, item: str) -> bool:
         """Push item onto stack. Returns True if successful, False if full."""
         if self.is_full():
@@ -57,14 +342,660 @@ class Stack:
             return None
         return self.items.pop()
     
+    def push_many(self, items: Iterable[str]) -> int:
+        """
+        Push items in order until the stack is full
+        
+        Returns:
+            Number of items pushed
+        """
+        items = list(items)
+        if self.max_size is not None:
+            items = items[:self.max_size - len(self.items)]
+        self.items.extend(items)
+        return len(items)
+    
+    def pop_many(self, count: int) -> List[str]:
+        """
+        Pop up to `count` items
+        
+        Returns:
+            The popped items, top first
+        """
+        count = max(0, min(count, len(self.items)))
+        if not count:
+            return []
+        out = self.items[-count:]
+        del self.items[-count:]
+        out.reverse()
+        return out
+    
     def is_empty(self) -> bool:
         """Check if stack is empty"""
         return len(self.items) == 0
     
     def is_full(self) -> bool:
-        """Check if stack is full"""
-        return len(self.items) >= self.max_size
+        """Check if stack is full (never true when unbounded)"""
+        return self.max_size is not None and len(self.items) >= self.max_size
+    
+    def clear(self):
+        """Clear all items from stack"""
+        self.items = []
+
+
+# Step-yielding operations of the structures below (for visualization):
+#   ("compare", i, j)  positions i and j compared (j None = the incoming value)
+#   ("swap", i, j)     positions i and j exchanged
+#   ("insert", i)      new item now at position i
+#   ("remove", i)      item at position i is about to be removed
+#   ("removed", item)  item left the structure
+#   ("overflow",) / ("underflow",)
+# Positions index the structure's ``items`` list.
+Step = Tuple[Any, ...]
+
+
+class Deque(GrowableQueue):
+    """
+    Double-ended queue on a growable circular buffer
+    
+    Args:
+        max_size: Item limit (None = unbounded)
+    """
+    
+    __slots__ = ()
+    
+    # Operation name -> number of arguments, for run_steps
+    OPERATIONS = {"push_front": 1, "push_back": 1, "pop_front": 0, "pop_back": 0}
+    
+    def push_front(self, item: str) -> bool:
+        """Add item at the front. Returns False only if max_size is reached."""
+        if self.is_full():
+            return False
+        self._reserve(self._size + 1)
+        self._head = (self._head - 1) % len(self._buffer)
+        self._buffer[self._head] = item
+        self._size += 1
+        return True
+    
+    def push_back(self, item: str) -> bool:
+        """Add item at the back. Returns False only if max_size is reached."""
+        return self.enqueue(item)
+    
+    def pop_front(self) -> Optional[str]:
+        """Remove and return the front item. Returns None if empty."""
+        return self.dequeue()
+    
+    def pop_back(self) -> Optional[str]:
+        """Remove and return the back item. Returns None if empty."""
+        if self.is_empty():
+            return None
+        self._tail = (self._tail - 1) % len(self._buffer)
+        item = self._buffer[self._tail]
+        self._buffer[self._tail] = None
+        self._size -= 1
+        self._shrink()
+        return item
+    
+    def peek_back(self) -> Optional[str]:
+        """Return the back item without removing it. Returns None if empty."""
+        if self.is_empty():
+            return None
+        return self._buffer[(self._tail - 1) % len(self._buffer)]
+    
+    def run_steps(self, op: str, *args) -> Iterator[Step]:
+        """Run operation `op` (a key of OPERATIONS) step by step"""
+        return getattr(self, op + "_steps")(*args)
+    
+    def push_front_steps(self, item: str) -> Iterator[Step]:
+        yield ("insert", 0) if self.push_front(item) else ("overflow",)
+    
+    def push_back_steps(self, item: str) -> Iterator[Step]:
+        yield ("insert", self._size - 1) if self.push_back(item) else ("overflow",)
+    
+    def pop_front_steps(self) -> Iterator[Step]:
+        if self.is_empty():
+            yield ("underflow",)
+            return
+        yield ("remove", 0)
+        yield ("removed", self.pop_front())
+    
+    def pop_back_steps(self) -> Iterator[Step]:
+        if self.is_empty():
+            yield ("underflow",)
+            return
+        yield ("remove", self._size - 1)
+        yield ("removed", self.pop_back())
+
+
+class PriorityQueue:
+    """
+    Binary min-heap priority queue with decrease-key
+    
+    Items and priorities are kept in parallel heap-ordered lists, and an
+    index map from item to heap position makes ``decrease_key`` and
+    membership tests O(1) to locate and O(log n) to restore. Items must be
+    hashable and unique, e.g. graph nodes in Dijkstra or A*.
+    
+    Args:
+        max_size: Item limit (None = unbounded)
+    """
+    
+    __slots__ = ("max_size", "_items", "_keys", "_index")
+    
+    OPERATIONS = {"push": 2, "pop": 0, "decrease_key": 2}
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self._items: List[Hashable] = []
+        self._keys: List[float] = []
+        self._index: Dict[Hashable, int] = {}
+    
+    @property
+    def items(self) -> List[Tuple[Hashable, float]]:
+        """(item, priority) pairs in heap order"""
+        return list(zip(self._items, self._keys))
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._index
+    
+    def window(self, count: int) -> List[Tuple[Hashable, float]]:
+        """Up to `count` (item, priority) pairs from the top of the heap"""
+        count = max(count, 0)
+        return list(zip(self._items[:count], self._keys[:count]))
+    
+    def priority(self, item: Hashable) -> float:
+        """
+        Current priority of a queued item
+        
+        Raises:
+            KeyError: If item is not queued
+        """
+        return self._keys[self._index[item]]
+    
+    def push(self, item: Hashable, priority: float) -> bool:
+        """
+        Add an item. Returns True if successful, False if full.
+        
+        Raises:
+            ValueError: If item is already queued (use decrease_key)
+        """
+        if item in self._index:
+            raise ValueError(f"{item!r} is already queued")
+        if self.is_full():
+            return False
+        self._append(item, priority)
+        self._sift_up(len(self._items) - 1)
+        return True
+    
+    def pop(self) -> Optional[Tuple[Hashable, float]]:
+        """Remove and return the (item, priority) with the lowest priority. Returns None if empty."""
+        if not self._items:
+            return None
+        top = (self._items[0], self._keys[0])
+        self._swap(0, len(self._items) - 1)
+        self._remove_last()
+        if self._items:
+            self._sift_down(0)
+        return top
+    
+    def peek(self) -> Optional[Tuple[Hashable, float]]:
+        """Return the lowest (item, priority) without removing it. Returns None if empty."""
+        if not self._items:
+            return None
+        return self._items[0], self._keys[0]
+    
+    def decrease_key(self, item: Hashable, priority: float) -> bool:
+        """
+        Lower a queued item's priority
+        
+        Returns:
+            False if `priority` is not lower than the current one
+        
+        Raises:
+            KeyError: If item is not queued
+        """
+        i = self._index[item]
+        if priority >= self._keys[i]:
+            return False
+        self._keys[i] = priority
+        self._sift_up(i)
+        return True
+    
+    def push_or_decrease(self, item: Hashable, priority: float) -> bool:
+        """
+        Queue an item, or lower its priority if it is already queued
+        
+        Returns:
+            True if the queue changed
+        """
+        if item in self._index:
+            return self.decrease_key(item, priority)
+        return self.push(item, priority)
+    
+    def is_empty(self) -> bool:
+        """Check if queue is empty"""
+        return not self._items
+    
+    def is_full(self) -> bool:
+        """Check if max_size is reached (never true when unbounded)"""
+        return self.max_size is not None and len(self._items) >= self.max_size
+    
+    def clear(self):
+        """Clear all items from queue"""
+        self._items = []
+        self._keys = []
+        self._index = {}
+    
+    def _append(self, item: Hashable, priority: float):
+        self._index[item] = len(self._items)
+        self._items.append(item)
+        self._keys.append(priority)
+    
+    def _remove_last(self):
+        del self._index[self._items.pop()]
+        self._keys.pop()
+    
+    def _swap(self, i: int, j: int):
+        items, keys = self._items, self._keys
+        items[i], items[j] = items[j], items[i]
+        keys[i], keys[j] = keys[j], keys[i]
+        self._index[items[i]] = i
+        self._index[items[j]] = j
+    
+    def _sift_up(self, i: int):
+        keys = self._keys
+        while i > 0:
+            parent = (i - 1) // 2
+            if keys[i] >= keys[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+    
+    def _sift_down(self, i: int):
+        keys, n = self._keys, len(self._keys)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] >= keys[i]:
+                break
+            self._swap(i, child)
+            i = child
+    
+    def run_steps(self, op: str, *args) -> Iterator[Step]:
+        """Run operation `op` (a key of OPERATIONS) step by step"""
+        return getattr(self, op + "_steps")(*args)
+    
+    def push_steps(self, item: Hashable, priority: float) -> Iterator[Step]:
+        """push, yielding each comparison and swap of the sift-up"""
+        if item in self._index:
+            raise ValueError(f"{item!r} is already queued")
+        if self.is_full():
+            yield ("overflow",)
+            return
+        self._append(item, priority)
+        yield ("insert", len(self._items) - 1)
+        yield from self._sift_up_steps(len(self._items) - 1)
+    
+    def pop_steps(self) -> Iterator[Step]:
+        """pop, yielding each comparison and swap of the sift-down"""
+        if not self._items:
+            yield ("underflow",)
+            return
+        yield ("remove", 0)
+        top = (self._items[0], self._keys[0])
+        last = len(self._items) - 1
+        if last:
+            self._swap(0, last)
+            yield ("swap", 0, last)
+        self._remove_last()
+        yield ("removed", top)
+        yield from self._sift_down_steps(0)
+    
+    def decrease_key_steps(self, item: Hashable, priority: float) -> Iterator[Step]:
+        """decrease_key, yielding each comparison and swap of the sift-up"""
+        i = self._index[item]
+        yield ("compare", i, None)
+        if priority < self._keys[i]:
+            self._keys[i] = priority
+            yield ("insert", i)
+            yield from self._sift_up_steps(i)
+    
+    def _sift_up_steps(self, i: int) -> Iterator[Step]:
+        keys = self._keys
+        while i > 0:
+            parent = (i - 1) // 2
+            yield ("compare", i, parent)
+            if keys[i] >= keys[parent]:
+                break
+            self._swap(i, parent)
+            yield ("swap", i, parent)
+            i = parent
+    
+    def _sift_down_steps(self, i: int) -> Iterator[Step]:
+        keys, n = self._keys, len(self._keys)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n:
+                yield ("compare", child, child + 1)
+                if keys[child + 1] < keys[child]:
+                    child += 1
+            yield ("compare", i, child)
+            if keys[child] >= keys[i]:
+                break
+            self._swap(i, child)
+            yield ("swap", i, child)
+            i = child
+
+
+class MonotonicStack:
+    """
+    Stack whose items stay sorted from bottom to top
+    
+    A push first pops every item the new one would break the order with,
+    as in next-smaller/next-greater element problems. Each item is pushed
+    and popped at most once, so a sequence of pushes is amortized O(1).
+    
+    Args:
+        increasing: Keep items non-decreasing from bottom to top (False =
+            non-increasing)
+    """
+    
+    OPERATIONS = {"push": 1, "pop": 0}
+    
+    def __init__(self, increasing: bool = True):
+        self.increasing = increasing
+        self.max_size: Optional[int] = None
+        self.items: List[Any] = []
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def window(self, count: int) -> List[Any]:
+        """Up to `count` items from the top, top first"""
+        return self.items[:-count - 1:-1] if count > 0 else []
+    
+    def _breaks_order(self, top: Any, value: Any) -> bool:
+        return top > value if self.increasing else top < value
+    
+    def push(self, value: Any) -> List[Any]:
+        """
+        Push a value, popping the items that would break the order
+        
+        Returns:
+            The popped items, top first
+        """
+        popped = []
+        while self.items and self._breaks_order(self.items[-1], value):
+            popped.append(self.items.pop())
+        self.items.append(value)
+        return popped
+    
+    def pop(self) -> Optional[Any]:
+        """Pop and return item from top of stack. Returns None if empty."""
+        return self.items.pop() if self.items else None
+    
+    def peek(self) -> Optional[Any]:
+        """Return the top item without removing it. Returns None if empty."""
+        return self.items[-1] if self.items else None
+    
+    def is_empty(self) -> bool:
+        """Check if stack is empty"""
+        return not self.items
+    
+    def is_full(self) -> bool:
+        """Monotonic stacks are unbounded"""
+        return False
     
     def clear(self):
         """Clear all items from stack"""
         self.items = []
+    
+    def run_steps(self, op: str, *args) -> Iterator[Step]:
+        """Run operation `op` (a key of OPERATIONS) step by step"""
+        return getattr(self, op + "_steps")(*args)
+    
+    def push_steps(self, value: Any) -> Iterator[Step]:
+        items = self.items
+        while items:
+            yield ("compare", len(items) - 1, None)
+            if not self._breaks_order(items[-1], value):
+                break
+            yield ("remove", len(items) - 1)
+            yield ("removed", items.pop())
+        items.append(value)
+        yield ("insert", len(items) - 1)
+    
+    def pop_steps(self) -> Iterator[Step]:
+        if not self.items:
+            yield ("underflow",)
+            return
+        yield ("remove", len(self.items) - 1)
+        yield ("removed", self.items.pop())
+
+
+class MonotonicQueue:
+    """
+    Queue whose items stay sorted from front to back
+    
+    A push first drops every item at the back that the new one would break
+    the order with, so the front is always the minimum (or maximum) of the
+    items pushed since it, as in sliding-window minimum/maximum.
+    
+    Args:
+        increasing: Keep items non-decreasing from front to back, so the
+            front is the minimum (False = non-increasing, front is maximum)
+    """
+    
+    OPERATIONS = {"push": 1, "pop_front": 0, "expire": 1}
+    
+    def __init__(self, increasing: bool = True):
+        self.increasing = increasing
+        self.max_size: Optional[int] = None
+        self._deque = Deque()
+    
+    @property
+    def items(self) -> List[Any]:
+        """Items in logical order, front first"""
+        return self._deque.items
+    
+    def __len__(self) -> int:
+        return len(self._deque)
+    
+    def window(self, count: int) -> List[Any]:
+        """Up to `count` items from the front, front first"""
+        return self._deque.window(count)
+    
+    def _breaks_order(self, back: Any, value: Any) -> bool:
+        return back > value if self.increasing else back < value
+    
+    def push(self, value: Any) -> List[Any]:
+        """
+        Push a value at the back, dropping the items that would break the order
+        
+        Returns:
+            The dropped items, back first
+        """
+        dropped = []
+        d = self._deque
+        while not d.is_empty() and self._breaks_order(d.peek_back(), value):
+            dropped.append(d.pop_back())
+        d.push_back(value)
+        return dropped
+    
+    def pop_front(self) -> Optional[Any]:
+        """Remove and return the front item. Returns None if empty."""
+        return self._deque.pop_front()
+    
+    def expire(self, value: Any) -> bool:
+        """
+        Remove `value` from the front if it is there, e.g. when it slides out
+        of the window (an item that was already dropped needs no removal)
+        
+        Returns:
+            True if the front was removed
+        """
+        if not self._deque.is_empty() and self._deque.peek() == value:
+            self._deque.pop_front()
+            return True
+        return False
+    
+    def peek(self) -> Optional[Any]:
+        """Return the front item (the window minimum/maximum). Returns None if empty."""
+        return self._deque.peek()
+    
+    def is_empty(self) -> bool:
+        """Check if queue is empty"""
+        return self._deque.is_empty()
+    
+    def is_full(self) -> bool:
+        """Monotonic queues are unbounded"""
+        return False
+    
+    def clear(self):
+        """Clear all items from queue"""
+        self._deque.clear()
+    
+    def run_steps(self, op: str, *args) -> Iterator[Step]:
+        """Run operation `op` (a key of OPERATIONS) step by step"""
+        return getattr(self, op + "_steps")(*args)
+    
+    def push_steps(self, value: Any) -> Iterator[Step]:
+        d = self._deque
+        while not d.is_empty():
+            yield ("compare", len(d) - 1, None)
+            if not self._breaks_order(d.peek_back(), value):
+                break
+            yield ("remove", len(d) - 1)
+            yield ("removed", d.pop_back())
+        d.push_back(value)
+        yield ("insert", len(d) - 1)
+    
+    def pop_front_steps(self) -> Iterator[Step]:
+        yield from self._deque.pop_front_steps()
+    
+    def expire_steps(self, value: Any) -> Iterator[Step]:
+        if self._deque.is_empty():
+            yield ("underflow",)
+            return
+        yield ("compare", 0, None)
+        if self._deque.peek() == value:
+            yield ("remove", 0)
+            yield ("removed", self._deque.pop_front())
+
+
+# Batch operations: (op, value) pairs with op in OPS; value is None for removals
+Op = Tuple[str, Optional[str]]
+OPS = ("push", "pop", "enqueue", "dequeue")
+_ADDS = ("push", "enqueue")
+
+
+def parse_ops(text: str) -> List[Op]:
+    """
+    Parse an operation script
+    
+    Operations are separated by newlines or semicolons. Each is ``push V``,
+    ``pop``, ``enqueue V`` or ``dequeue``, optionally followed by ``xN`` to
+    repeat it N times (e.g. ``push 7 x100; pop x20``).
+    
+    Raises:
+        ValueError: On an unknown operation or a missing value
+    """
+    ops: List[Op] = []
+    for line in text.replace(";", "\n").splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        repeat = 1
+        if len(parts) > 1 and parts[-1][0] in "xX" and parts[-1][1:].isdigit():
+            repeat = int(parts.pop()[1:])
+        op = parts[0].lower()
+        if op not in OPS:
+            raise ValueError(f"Unknown operation: {parts[0]}")
+        if op in _ADDS:
+            if len(parts) != 2:
+                raise ValueError(f"'{op}' needs exactly one value")
+            ops.extend([(op, parts[1])] * repeat)
+        else:
+            if len(parts) != 1:
+                raise ValueError(f"'{op}' takes no value")
+            ops.extend([(op, None)] * repeat)
+    return ops
+
+
+def random_ops(count: int, seed: Optional[int] = None) -> List[Op]:
+    """Generate a random mix of stack and queue operations"""
+    rng = random.Random(seed)
+    ops: List[Op] = []
+    for _ in range(count):
+        op = rng.choice(OPS)
+        ops.append((op, str(rng.randint(0, 99)) if op in _ADDS else None))
+    return ops
+
+
+class BatchStats:
+    """Aggregated results of batch operations"""
+    
+    def __init__(self):
+        self.applied = {op: 0 for op in OPS}
+        self.overflows = 0   # Adds rejected because the structure was full
+        self.underflows = 0  # Removals from an empty structure
+    
+    @property
+    def total(self) -> int:
+        return sum(self.applied.values()) + self.overflows + self.underflows
+    
+    def summary(self) -> str:
+        """One-line summary"""
+        counts = "  ".join(f"{op.capitalize()}: {n}" for op, n in self.applied.items())
+        return (f"Ops: {self.total}  {counts}  "
+                f"Overflows: {self.overflows}  Underflows: {self.underflows}")
+
+
+def apply_ops(ops: Sequence[Op], stack: Optional[Stack],
+              queue: Optional[Union[Queue, DequeQueue]],
+              stats: Optional[BatchStats] = None) -> BatchStats:
+    """
+    Apply operations in bulk
+    
+    Runs of the same operation go through push_many/pop_many and
+    enqueue_many/dequeue_many instead of one call per item.
+    
+    Args:
+        ops: Operations from parse_ops or random_ops
+        stack: Target of push/pop (ops for a missing structure are skipped)
+        queue: Target of enqueue/dequeue
+        stats: Statistics to add to (a new one is created if omitted)
+    
+    Returns:
+        The updated statistics
+    """
+    stats = stats or BatchStats()
+    i = 0
+    while i < len(ops):
+        op = ops[i][0]
+        j = i + 1
+        while j < len(ops) and ops[j][0] == op:
+            j += 1
+        run = ops[i:j]
+        i = j
+        target = stack if op in ("push", "pop") else queue
+        if target is None:
+            continue
+        if op in _ADDS:
+            add = target.push_many if op == "push" else target.enqueue_many
+            done = add(value for _, value in run)
+            stats.overflows += len(run) - done
+        else:
+            remove = target.pop_many if op == "pop" else target.dequeue_many
+            done = len(remove(len(run)))
+            stats.underflows += len(run) - done
+        stats.applied[op] += done
+    return stats
@@ -2,6 +2,7 @@
 DSA Algorithm Visualizer
 Main entry point for the application
 """
+import multiprocessing
 import sys
 from PySide6.QtWidgets import QApplication
 from ui.main_window import MainWindow
@@ -24,4 +25,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds need this so spawned trace workers run
+    # the worker code instead of relaunching the app
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,219 @@
+"""
+Frame-budgeted animation scheduler shared by all visualizers
+A single QTimer ticks at the target frame rate and advances every playing
+animation by as many steps as its speed asks for, capped by a per-frame
+time budget that adapts to how long steps and paints actually take
+"""
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QComboBox, QApplication
+from PySide6.QtCore import QObject, QTimer, QEvent
+from typing import Callable, List, Optional
+import time
+
+TARGET_FPS = 60
+# Share of the frame the scheduler may spend stepping; the rest is left for
+# painting and input handling
+FRAME_BUDGET_SHARE = 0.6
+# Longest time gap credited to an animation at once (e.g. after a stall)
+MAX_FRAME_GAP_S = 0.25
+
+SPEEDS = [0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 50.0]
+
+
+class Animation:
+    """
+    One scheduled animation: a step callback plus playback state
+
+    Args:
+        step: Called to apply one step; returns False when finished, or None
+            when no step is ready yet (e.g. a background producer lags behind)
+        render: Called once per frame after one or more steps were applied
+        interval_ms: Time per step at speed 1.0 (0 = as many as fit the budget)
+        page: Widget whose visibility gates playback (None = always runs)
+        on_finished: Called once when `step` reports the end
+    """
+
+    def __init__(self, step: Callable[[], Optional[bool]], render: Optional[Callable[[], None]] = None,
+                 interval_ms: float = 220, page: Optional[QWidget] = None,
+                 on_finished: Optional[Callable[[], None]] = None):
+        self.step = step
+        self.render = render
+        self.interval_ms = interval_ms
+        self.page = page
+        self.on_finished = on_finished
+        self.speed = 1.0
+        self.playing = False
+        self.scheduler: Optional["AnimationScheduler"] = None
+        self._credit = 0.0  # Accumulated step time, in ms
+        self._listeners: List[Callable[[], None]] = []
+
+    def play(self):
+        """Start or resume playback"""
+        if not self.playing:
+            self.playing = True
+            self._credit = 0.0
+            self._notify()
+        if self.scheduler:
+            self.scheduler.wake()
+
+    def pause(self):
+        """Pause playback, keeping the current position"""
+        if self.playing:
+            self.playing = False
+            self._notify()
+
+    def toggle(self):
+        """Toggle between playing and paused"""
+        self.pause() if self.playing else self.play()
+
+    def set_speed(self, speed: float):
+        """Set the playback speed multiplier"""
+        self.speed = max(speed, 0.01)
+
+    def is_visible(self) -> bool:
+        """Whether the animation's page is currently shown"""
+        return self.page is None or self.page.isVisible()
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Call `callback` whenever the play/pause state changes"""
+        self._listeners.append(callback)
+
+    def _notify(self):
+        for callback in self._listeners:
+            callback()
+
+    def _finish(self):
+        self.playing = False
+        self._notify()
+        if self.on_finished:
+            self.on_finished()
+
+
+class AnimationScheduler(QObject):
+    """Single frame clock driving every registered Animation"""
+
+    def __init__(self, fps: int = TARGET_FPS, parent=None):
+        super().__init__(parent)
+        self.frame_ms = 1000.0 / fps
+        self.animations: List[Animation] = []
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+        self._last_tick = 0.0
+        # Adaptive stepping budget per frame, in seconds
+        self.budget = self.frame_ms / 1000.0 * FRAME_BUDGET_SHARE
+
+    def register(self, animation: Animation) -> Animation:
+        """Add an animation to the frame clock"""
+        animation.scheduler = self
+        self.animations.append(animation)
+        if animation.page is not None:
+            # Resume as soon as a hidden page is shown again
+            animation.page.installEventFilter(self)
+        return animation
+
+    def unregister(self, animation: Animation):
+        """Remove an animation from the frame clock"""
+        if animation in self.animations:
+            self.animations.remove(animation)
+        animation.scheduler = None
+
+    def eventFilter(self, obj, event) -> bool:
+        """Wake the clock when an animation's page is shown"""
+        if event.type() == QEvent.Show:
+            self.wake()
+        return False
+
+    def wake(self):
+        """Start ticking if any animation can run"""
+        if not self.timer.isActive() and self._runnable():
+            self._last_tick = time.perf_counter()
+            self.timer.start(int(self.frame_ms))
+
+    def _runnable(self) -> List[Animation]:
+        return [a for a in self.animations if a.playing and a.is_visible()]
+
+    def _tick(self):
+        """Advance every playing, visible animation within the frame budget"""
+        now = time.perf_counter()
+        gap = min(now - self._last_tick, MAX_FRAME_GAP_S)
+        self._last_tick = now
+
+        # Shrink the budget when frames arrive late, grow it back when on time
+        target = self.frame_ms / 1000.0
+        full = target * FRAME_BUDGET_SHARE
+        if gap > target * 1.5:
+            self.budget = max(self.budget * 0.8, full * 0.1)
+        else:
+            self.budget = min(self.budget * 1.1, full)
+
+        running = self._runnable()
+        if not running:
+            self.timer.stop()
+            return
+
+        deadline = now + self.budget
+        share = self.budget / len(running)
+        for anim in running:
+            anim_deadline = min(deadline, time.perf_counter() + share)
+            anim._credit += gap * 1000.0 * anim.speed
+            stepped = False
+            while True:
+                if anim.interval_ms > 0:
+                    if anim._credit < anim.interval_ms:
+                        break
+                    anim._credit -= anim.interval_ms
+                result = anim.step()
+                if result is None:
+                    # Nothing ready: retry next frame without banking a backlog
+                    anim._credit = anim.interval_ms
+                    break
+                if not result:
+                    anim._finish()
+                    break
+                stepped = True
+                if time.perf_counter() >= anim_deadline:
+                    # Out of budget: drop the backlog instead of piling it up
+                    anim._credit = min(anim._credit, anim.interval_ms)
+                    break
+            if stepped and anim.render:
+                anim.render()
+
+
+_scheduler: Optional[AnimationScheduler] = None
+
+
+def get_scheduler() -> AnimationScheduler:
+    """Return the application-wide animation scheduler"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = AnimationScheduler(parent=QApplication.instance())
+    return _scheduler
+
+
+class PlaybackControls(QWidget):
+    """Play/pause button and speed selector bound to an Animation"""
+
+    def __init__(self, animation: Animation, parent=None):
+        super().__init__(parent)
+        self.animation = animation
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.play_btn = QPushButton("Pause")
+        self.play_btn.setMinimumHeight(35)
+        self.play_btn.clicked.connect(animation.toggle)
+        layout.addWidget(self.play_btn)
+
+        self.speed_combo = QComboBox()
+        self.speed_combo.addItems([f"{s:g}x" for s in SPEEDS])
+        self.speed_combo.setCurrentIndex(SPEEDS.index(1.0))
+        self.speed_combo.setMinimumHeight(35)
+        self.speed_combo.currentIndexChanged.connect(
+            lambda i: animation.set_speed(SPEEDS[i]))
+        layout.addWidget(self.speed_combo)
+
+        animation.add_listener(self._refresh)
+        self._refresh()
+
+    def _refresh(self):
+        self.play_btn.setText("Pause" if self.animation.playing else "Play")
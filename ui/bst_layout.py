@@ -0,0 +1,303 @@
+"""
+Layouts for binary search trees, in abstract units (x columns, depth rows)
+BSTLayout gives each node its in-order rank as column and is updated
+incrementally: ranks are kept as a sorted key list, so an insert or delete
+shifts a whole rank range with one list operation, and cached depths are
+repaired only inside the subtree that a structural step actually moved.
+TidyLayout is a linear-time Reingold-Tilford layout recomputed lazily after a
+structural change.
+Both answer viewport queries by walking the tree top-down with subtree bounds,
+so the tree itself serves as the spatial index (a bounding-volume hierarchy):
+subtrees outside the view are skipped and subtrees narrower than a threshold
+are reported as collapsed glyphs instead of being descended into.
+"""
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.bst import BST, NodeBST
+
+# Minimum horizontal distance between nodes on one level in TidyLayout
+TIDY_SEPARATION = 1.0
+
+# (subtree root, leftmost x, rightmost x, node count) for a collapsed subtree
+Glyph = Tuple[NodeBST, float, float, int]
+
+
+class BSTLayout:
+    """Cached in-order ranks and depths of a BST, updated step by step"""
+
+    def __init__(self):
+        self.tree: Optional[BST] = None
+        # Sorted keys and their nodes: list index == in-order rank
+        self.keys: List[Any] = []
+        self.nodes: List[NodeBST] = []
+        self.depths: Dict[NodeBST, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rebuild(self, tree: Optional[BST]):
+        """Lay out a whole tree from scratch"""
+        self.tree = tree
+        self.keys = []
+        self.nodes = []
+        self.depths = {}
+        if tree is None:
+            return
+        for node, depth in tree.iter_nodes("inorder"):
+            self.keys.append(node.value)
+            self.nodes.append(node)
+            self.depths[node] = depth
+
+    def node_changed(self, key: Any):
+        """
+        Update the layout after one structural step involving `key`
+
+        Call this after every insert, delete or rotation step, with the tree
+        already mutated. Whatever moved sits on the search path for `key`: the
+        first node on that path whose cached depth is wrong (or missing) roots
+        the moved subtree, and only that subtree is re-measured.
+
+        Args:
+            key: Value inserted, deleted or rotated at
+        """
+        node = self.tree.root if self.tree is not None else None
+        depth = 0
+        while node is not None:
+            if self.depths.get(node) != depth:
+                self._measure(node, depth)
+                break
+            if key == node.value:
+                break
+            node = node.left if key < node.value else node.right
+            depth += 1
+        found = self.tree.search(key) if self.tree is not None else None
+
+        rank = bisect_left(self.keys, key)
+        cached = rank < len(self.keys) and self.keys[rank] == key
+        if found is not None and not cached:
+            self.keys.insert(rank, key)
+            self.nodes.insert(rank, found)
+        elif found is None and cached:
+            self.depths.pop(self.nodes[rank], None)
+            del self.keys[rank]
+            del self.nodes[rank]
+
+    def _measure(self, root: NodeBST, depth: int):
+        """Recompute cached depths for the subtree under `root`"""
+        depths = self.depths
+        stack = [(root, depth)]
+        while stack:
+            node, d = stack.pop()
+            depths[node] = d
+            if node.left is not None:
+                stack.append((node.left, d + 1))
+            if node.right is not None:
+                stack.append((node.right, d + 1))
+
+    def width_units(self) -> float:
+        """Number of columns spanned by the layout"""
+        return len(self.keys)
+
+    def point(self, node: NodeBST) -> Tuple[float, int]:
+        """Layout position of a node as (column, depth); columns start at 1"""
+        return bisect_left(self.keys, node.value) + 1, self.depths[node]
+
+    def query(self, x0: float, x1: float, max_depth: float,
+              collapse: float) -> Tuple[List[NodeBST], List[Glyph]]:
+        """
+        Nodes and collapsed subtrees intersecting a viewport
+
+        A subtree's columns are the contiguous rank range it covers, which
+        the walk narrows at each node, so no per-subtree bounds are stored.
+
+        Args:
+            x0, x1: Visible column range
+            max_depth: Deepest visible row
+            collapse: Subtrees spanning fewer columns than this become glyphs
+
+        Returns:
+            (nodes to draw, collapsed glyphs)
+        """
+        nodes: List[NodeBST] = []
+        glyphs: List[Glyph] = []
+        if self.tree is None or self.tree.root is None:
+            return nodes, glyphs
+        depths = self.depths
+        stack = [(self.tree.root, 1, len(self.keys))]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi < x0 or lo > x1 or depths[node] > max_depth:
+                continue
+            if lo < hi and hi - lo < collapse:
+                glyphs.append((node, lo, hi, hi - lo + 1))
+                continue
+            nodes.append(node)
+            column = bisect_left(self.keys, node.value) + 1
+            if node.left is not None:
+                stack.append((node.left, lo, column - 1))
+            if node.right is not None:
+                stack.append((node.right, column + 1, hi))
+        return nodes, glyphs
+
+
+class TidyLayout:
+    """
+    Reingold-Tilford tidy layout of a binary tree
+
+    Parents are centred over their children and sibling subtrees are pushed
+    together until their facing contours are TIDY_SEPARATION apart. Contours
+    are stored bottom-up and the taller child's lists are reused, so merging
+    costs the height of the shorter subtree and the whole pass is linear.
+    """
+
+    def __init__(self):
+        self.tree: Optional[BST] = None
+        self.dirty = False
+        self.xs: Dict[NodeBST, float] = {}
+        self.depths: Dict[NodeBST, int] = {}
+        # node -> (leftmost x, rightmost x, size, height) of its subtree
+        self.bounds: Dict[NodeBST, Tuple[float, float, int, int]] = {}
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self.xs)
+
+    def rebuild(self, tree: Optional[BST]):
+        """Lay out a whole tree from scratch"""
+        self.tree = tree
+        self.dirty = True
+
+    def node_changed(self, key: Any):
+        """Mark the layout stale after a structural step; recomputed on next use"""
+        self.dirty = True
+
+    def _ensure(self):
+        if self.dirty:
+            self.dirty = False
+            self._compute()
+
+    def _compute(self):
+        """Run the layout pass over the whole tree"""
+        self.xs, self.depths, self.bounds = {}, {}, {}
+        root = self.tree.root if self.tree is not None else None
+        if root is None:
+            return
+
+        # Parents before children; reversed it is a valid postorder
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+
+        # Offset of each child from its parent
+        rel: Dict[NodeBST, float] = {}
+        # node -> (left contour, right contour, shift); contours are listed
+        # deepest level first and stored values + shift are relative to node
+        contours: Dict[NodeBST, Tuple[List[float], List[float], float]] = {}
+        for node in reversed(order):
+            left, right = node.left, node.right
+            if left is not None and right is not None:
+                lcl, rcl, offl = contours.pop(left)
+                lcr, rcr, offr = contours.pop(right)
+                hl, hr = len(lcl), len(lcr)
+                gap = 0.0
+                for k in range(1, min(hl, hr) + 1):
+                    gap = max(gap, (rcl[hl - k] + offl) - (lcr[hr - k] + offr))
+                half = (gap + TIDY_SEPARATION) / 2
+                rel[left], rel[right] = -half, half
+                if hl >= hr:
+                    lc, rc, off = lcl, rcl, offl - half
+                    for k in range(1, hr + 1):
+                        rc[hl - k] = rcr[hr - k] + offr + half - off
+                else:
+                    lc, rc, off = lcr, rcr, offr + half
+                    for k in range(1, hl + 1):
+                        lc[hr - k] = lcl[hl - k] + offl - half - off
+            elif left is not None or right is not None:
+                child = left if left is not None else right
+                lc, rc, off = contours.pop(child)
+                shift = -TIDY_SEPARATION / 2 if child is left else TIDY_SEPARATION / 2
+                rel[child] = shift
+                off += shift
+            else:
+                lc, rc, off = [], [], 0.0
+            lc.append(-off)
+            rc.append(-off)
+            contours[node] = (lc, rc, off)
+
+        # Absolute positions, top-down
+        xs, depths = self.xs, self.depths
+        xs[root], depths[root] = 0.0, 0
+        for node in order:
+            for child in (node.left, node.right):
+                if child is not None:
+                    xs[child] = xs[node] + rel[child]
+                    depths[child] = depths[node] + 1
+        shift = 1 - min(xs.values())
+        for node in order:
+            xs[node] += shift
+
+        # Subtree bounds, bottom-up
+        bounds = self.bounds
+        for node in reversed(order):
+            x = xs[node]
+            lo, hi, size, height = x, x, 1, 0
+            for child in (node.left, node.right):
+                if child is not None:
+                    clo, chi, csize, cheight = bounds[child]
+                    lo, hi = min(lo, clo), max(hi, chi)
+                    size += csize
+                    height = max(height, cheight + 1)
+            bounds[node] = (lo, hi, size, height)
+
+    def width_units(self) -> float:
+        """Number of columns spanned by the layout"""
+        self._ensure()
+        root = self.tree.root if self.tree is not None else None
+        return self.bounds[root][1] if root is not None else 0
+
+    def point(self, node: NodeBST) -> Tuple[float, int]:
+        """Layout position of a node as (column, depth); columns start at 1"""
+        self._ensure()
+        return self.xs[node], self.depths[node]
+
+    def query(self, x0: float, x1: float, max_depth: float,
+              collapse: float) -> Tuple[List[NodeBST], List[Glyph]]:
+        """
+        Nodes and collapsed subtrees intersecting a viewport
+
+        Args:
+            x0, x1: Visible column range
+            max_depth: Deepest visible row
+            collapse: Subtrees spanning fewer columns than this become glyphs
+
+        Returns:
+            (nodes to draw, collapsed glyphs)
+        """
+        self._ensure()
+        nodes: List[NodeBST] = []
+        glyphs: List[Glyph] = []
+        if self.tree is None or self.tree.root is None:
+            return nodes, glyphs
+        bounds, depths = self.bounds, self.depths
+        stack = [self.tree.root]
+        while stack:
+            node = stack.pop()
+            lo, hi, size, _ = bounds[node]
+            if hi < x0 or lo > x1 or depths[node] > max_depth:
+                continue
+            if size > 1 and hi - lo < collapse:
+                glyphs.append((node, lo, hi, size))
+                continue
+            nodes.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return nodes, glyphs
@@ -204,7 +204,7 @@ class HomeWidget(QWidget):
         features_data = [
             ("🌳", "Binary Search Tree", "Visualize Insert, Delete,\nand Search with BFS/DFS\ntraversals.", "Beginner"),
             ("🔗", "Graph Algorithms", "Explore directed weighted\ngraphs with BFS, DFS, and\nsearching.", "Intermediate"),
-            ("📊", "Sorting Algorithms", "5 key sorting algorithms\nwith step-by-step visual\nfeedback.", "Beginner"),
+            ("📊", "Sorting Algorithms", "12 sorting algorithms\nwith step-by-step visual\nfeedback.", "Beginner"),
             ("📚", "Queue & Stack", "Interactive simulators for\nLIFO and FIFO data\nstructures.", "Beginner"),
             ("🔢", "Expressions", "Convert and evaluate\ninfix, Postfix, and Prefix\nexpressions.", "Intermediate")
         ]
@@ -460,7 +460,8 @@ Graph Visualizer:
 - Preorder/Postorder DFS traversals
 
 Sorting Visualizer:
-- Supports 5 sorting algorithms
+- Supports comparison sorts (insertion to Timsort) and
+  counting, radix and bucket sorts
 - Step-by-step or full animation
 - View code for each algorithm
 
@@ -2,36 +2,179 @@
 Binary Search Tree Visualizer Widget
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                                QLineEdit, QLabel, QMessageBox)
-from PySide6.QtCore import Qt, QTimer, QPointF
+                                QLineEdit, QLabel, QMessageBox, QComboBox)
+from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from core.bst import BST, NodeBST
+from core.bst import BST, NodeBST, Step
+from core.balanced_bst import AVLTree, RedBlackTree, Treap
+from algorithms.searching import BST_SEARCHES
 from algorithms.traversals import get_traversal_code
+from ui.animation import Animation, PlaybackControls, get_scheduler
+from ui.bst_layout import BSTLayout, TidyLayout, Glyph
 from utils.constants import COLORS, DEFAULT_NODE_RADIUS, ANIMATION_SPEED
-from typing import Optional, List
+from typing import Any, Optional, List, Iterator, Set, Tuple
+from itertools import islice
+import random
+
+TREE_TYPES = {
+    "BST": BST,
+    "AVL": AVLTree,
+    "Red-Black": RedBlackTree,
+    "Treap": Treap,
+}
+
+TREE_LAYOUTS = {
+    "In-order": BSTLayout,
+    "Tidy": TidyLayout,
+}
+
+# Query name -> (BST method, number of integer arguments)
+TREE_QUERIES = {
+    "Select k-th": ("select", 1),
+    "Rank": ("rank", 1),
+    "Range Count": ("range_count", 2),
+    "Range": ("range_iter", 2),
+    "Floor": ("floor", 1),
+    "Ceiling": ("ceiling", 1),
+    "Successor": ("successor", 1),
+    "Predecessor": ("predecessor", 1),
+}
+# Values listed (and highlighted) for a range query
+RANGE_PREVIEW = 20
+
+# Time each insert/delete/rotation step stays on screen at 1x speed
+TREE_STEP_INTERVAL_MS = 600
+
+MIN_ZOOM = 0.01
+MAX_ZOOM = 4.0
+# Subtrees narrower than this on screen are drawn as a single glyph
+COLLAPSE_PX = 12
+# Node values are only written when nodes are at least this large
+MIN_LABEL_RADIUS_PX = 7
+# Most values one bulk input may produce
+MAX_BULK_VALUES = 1_000_000
+
+
+def _parse_values(text: str) -> List[int]:
+    """
+    Parse bulk input: "5, 3, 8", an inclusive range "1..100", or
+    "random N [MAX]" for N random values in 0..MAX (default 10*N)
+    
+    Raises:
+        ValueError: With a readable message for malformed input or more
+            than MAX_BULK_VALUES values
+    """
+    text = text.strip()
+    try:
+        if text.startswith("random"):
+            parts = text.split()
+            if len(parts) not in (2, 3):
+                raise ValueError
+            count = int(parts[1])
+            high = int(parts[2]) if len(parts) == 3 else 10 * count
+            if high < 0:
+                raise ValueError
+            values = None
+        elif ".." in text:
+            low, high = text.split("..")
+            values = range(int(low), int(high) + 1)
+            count = len(values)
+        else:
+            values = [int(part) for part in text.split(",") if part.strip()]
+            count = len(values)
+    except ValueError:
+        raise ValueError(f"Cannot read '{text}': use 5,3,8 or 1..100 or random 50") from None
+    # Checked before a random list or range is built
+    if count > MAX_BULK_VALUES:
+        raise ValueError(f"Too many values ({count}): at most {MAX_BULK_VALUES} at once")
+    if values is None:
+        return [random.randint(0, high) for _ in range(count)]
+    return list(values)
+
+
+def _trace(steps: Iterator[Step]) -> Tuple[Any, List[int]]:
+    """Run a query step generator, returning its result and the values visited"""
+    path = []
+    while True:
+        try:
+            path.append(next(steps)[1])
+        except StopIteration as stop:
+            return stop.value, path
 
 
 class BSTCanvas(QWidget):
-    """Canvas widget for drawing BST"""
+    """Canvas widget for drawing BST; wheel zooms, drag pans, double-click resets"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.bst: Optional[BST] = None
         self.highlight_value: Optional[int] = None
-        self.highlight_path: List[int] = []
+        self.highlight_path: Set[int] = set()
+        # Cached layout in columns/rows; canvas coordinates are derived per paint
+        self.layout = BSTLayout()
+        self._spacing_key: Tuple[int, float] = (-1, -1.0)
+        self._spacing = 40.0
+        self.zoom = 1.0
+        self.pan = QPointF(0, 0)
+        self._drag_from: Optional[QPointF] = None
         self.setMinimumSize(600, 400)
     
     def set_bst(self, bst: BST):
-        """Set the BST to visualize"""
+        """Set the BST to visualize, laying it out from scratch"""
         self.bst = bst
+        self.layout.rebuild(bst)
+        self.update()
+    
+    def set_layout(self, layout):
+        """Switch to another layout engine (BSTLayout or TidyLayout)"""
+        self.layout = layout
+        self.layout.rebuild(self.bst)
+        self.reset_view()
+    
+    def node_changed(self, value: int):
+        """Update the layout after one insert/delete/rotation step at `value`"""
+        self.layout.node_changed(value)
         self.update()
     
     def set_highlight(self, value: Optional[int] = None, path: List[int] = None):
         """Set highlighting for search visualization"""
         self.highlight_value = value
-        self.highlight_path = path if path else []
+        self.highlight_path = set(path) if path else set()
         self.update()
     
+    def reset_view(self):
+        """Return to 1x zoom with no panning"""
+        self.zoom = 1.0
+        self.pan = QPointF(0, 0)
+        self.update()
+    
+    def wheelEvent(self, event):
+        """Zoom around the cursor"""
+        factor = 1.15 ** (event.angleDelta().y() / 120)
+        zoom = min(max(self.zoom * factor, MIN_ZOOM), MAX_ZOOM)
+        pos = event.position()
+        # Keep the point under the cursor fixed
+        self.pan = pos - (pos - self.pan) * (zoom / self.zoom)
+        self.zoom = zoom
+        self.update()
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_from = event.position()
+    
+    def mouseMoveEvent(self, event):
+        if self._drag_from is not None:
+            pos = event.position()
+            self.pan += pos - self._drag_from
+            self._drag_from = pos
+            self.update()
+    
+    def mouseReleaseEvent(self, event):
+        self._drag_from = None
+    
+    def mouseDoubleClickEvent(self, event):
+        self.reset_view()
+    
     def paintEvent(self, event):
         """Draw the BST"""
         painter = QPainter(self)
@@ -43,92 +186,97 @@ class BSTCanvas(QWidget):
             painter.drawText(self.rect(), Qt.AlignCenter, "Empty BST - Insert nodes to visualize")
             return
         
-        # Layout the tree
-        self._layout_tree()
+        # Map the repainted area back to layout columns and rows
+        spacing = self._column_spacing()
+        rect = event.rect()
+        r = DEFAULT_NODE_RADIUS
+        left = (rect.left() - self.pan.x()) / self.zoom
+        right = (rect.right() - self.pan.x()) / self.zoom
+        bottom = (rect.bottom() - self.pan.y()) / self.zoom
+        nodes, glyphs = self.layout.query(
+            (left - r - 20) / spacing, (right + r - 20) / spacing,
+            (bottom + r - 60) / 80, COLLAPSE_PX / (spacing * self.zoom))
+        
+        painter.translate(self.pan)
+        painter.scale(self.zoom, self.zoom)
         
         # Draw edges first
-        self._draw_edges(painter, self.bst.root)
+        self._draw_edges(painter, nodes)
+        
+        # Subtrees too narrow to draw node by node
+        self._draw_glyphs(painter, glyphs)
         
         # Draw nodes
-        self._draw_nodes(painter, self.bst.root)
+        self._draw_nodes(painter, nodes)
     
-    def _layout_tree(self):
-        """Calculate positions for all nodes"""
-        counter = {'x': 0}
-        
-        def assign_positions(node: Optional[NodeBST], depth: int = 0):
-            if not node:
-                return
-            assign_positions(node.left, depth + 1)
-            counter['x'] += 1
-            node.x = counter['x']
-            node.y = depth
-            assign_positions(node.right, depth + 1)
-        
-        assign_positions(self.bst.root)
-        
-        # Convert to canvas coordinates
-        if counter['x'] == 0:
-            return
-        
-        w = self.width()
-        spacing = max((w - 40) / (counter['x'] + 1), 40)
-        
-        def set_canvas_coords(node: Optional[NodeBST]):
-            if not node:
-                return
-            node.canvas_x = int(20 + node.x * spacing)
-            node.canvas_y = int(60 + node.y * 80)
-            set_canvas_coords(node.left)
-            set_canvas_coords(node.right)
-        
-        set_canvas_coords(self.bst.root)
+    def _column_spacing(self) -> float:
+        """Horizontal distance between layout columns, cached per width"""
+        key = (self.width(), self.layout.width_units())
+        if key != self._spacing_key:
+            self._spacing_key = key
+            self._spacing = max((key[0] - 40) / (key[1] + 1), 40)
+        return self._spacing
     
-    def _draw_edges(self, painter: QPainter, node: Optional[NodeBST]):
-        """Draw edges between nodes"""
-        if not node:
-            return
-        
+    def _node_point(self, node: NodeBST) -> Tuple[float, float]:
+        """Unzoomed canvas position of a node"""
+        column, depth = self.layout.point(node)
+        return 20 + column * self._spacing, 60 + depth * 80
+    
+    def _draw_edges(self, painter: QPainter, nodes: List[NodeBST]):
+        """Draw edges from the given nodes to their children"""
         pen = QPen(QColor(COLORS['text']), 2)
         painter.setPen(pen)
         
-        if node.left:
-            painter.drawLine(node.canvas_x, node.canvas_y,
-                           node.left.canvas_x, node.left.canvas_y)
-        if node.right:
-            painter.drawLine(node.canvas_x, node.canvas_y,
-                           node.right.canvas_x, node.right.canvas_y)
-        
-        self._draw_edges(painter, node.left)
-        self._draw_edges(painter, node.right)
+        for node in nodes:
+            x, y = self._node_point(node)
+            for child in (node.left, node.right):
+                if child:
+                    cx, cy = self._node_point(child)
+                    painter.drawLine(QPointF(x, y), QPointF(cx, cy))
+    
+    def _draw_glyphs(self, painter: QPainter, glyphs: List[Glyph]):
+        """Draw collapsed subtrees as triangles labelled with their size"""
+        color = QColor(COLORS['node_default'])
+        color.setAlpha(140)
+        painter.setBrush(QBrush(color))
+        painter.setPen(QPen(QColor(COLORS['node_border']), 1))
+        painter.setFont(QFont("Arial", 9))
+        for node, lo, hi, size in glyphs:
+            x, y = self._node_point(node)
+            x0 = 20 + lo * self._spacing
+            x1 = 20 + hi * self._spacing
+            painter.drawPolygon([QPointF(x, y), QPointF(x0, y + 80), QPointF(x1, y + 80)])
+            if self.zoom * (x1 - x0) >= 30:
+                painter.drawText(QRectF(x0, y + 40, x1 - x0, 40), Qt.AlignCenter, str(size))
     
-    def _draw_nodes(self, painter: QPainter, node: Optional[NodeBST]):
+    def _draw_nodes(self, painter: QPainter, nodes: List[NodeBST]):
         """Draw nodes"""
-        if not node:
-            return
-        
         r = DEFAULT_NODE_RADIUS
-        
-        # Determine fill color
-        fill_color = COLORS['node_default']
-        if node.value in self.highlight_path:
-            fill_color = COLORS['node_path']
-        elif node.value == self.highlight_value:
-            fill_color = COLORS['node_highlight']
-        
-        # Draw circle
-        painter.setBrush(QBrush(QColor(fill_color)))
-        painter.setPen(QPen(QColor(COLORS['node_border']), 2))
-        painter.drawEllipse(QPointF(node.canvas_x, node.canvas_y), r, r)
-        
-        # Draw value
-        painter.setPen(QColor("white"))
-        painter.setFont(QFont("Arial", 11, QFont.Bold))
-        painter.drawText(node.canvas_x - r, node.canvas_y - r,
-                        r * 2, r * 2, Qt.AlignCenter, str(node.value))
-        
-        self._draw_nodes(painter, node.left)
-        self._draw_nodes(painter, node.right)
+        labels = r * self.zoom >= MIN_LABEL_RADIUS_PX
+        
+        for node in nodes:
+            x, y = self._node_point(node)
+            # Determine fill color
+            fill_color = COLORS['node_default']
+            red = getattr(node, "red", None)
+            if red is not None:
+                fill_color = COLORS['node_red'] if red else COLORS['node_black']
+            if node.value == self.highlight_value:
+                fill_color = COLORS['node_highlight']
+            elif node.value in self.highlight_path:
+                fill_color = COLORS['node_path']
+            
+            # Draw circle
+            painter.setBrush(QBrush(QColor(fill_color)))
+            painter.setPen(QPen(QColor(COLORS['node_border']), 2))
+            painter.drawEllipse(QPointF(x, y), r, r)
+            
+            if not labels:
+                continue
+            # Draw value
+            painter.setPen(QColor("white"))
+            painter.setFont(QFont("Arial", 11, QFont.Bold))
+            painter.drawText(QRectF(x - r, y - r, r * 2, r * 2), Qt.AlignCenter, str(node.value))
 
 
 class BSTWidget(QWidget):
@@ -137,6 +285,15 @@ class BSTWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.bst = BST()
+        self.op_steps: Optional[Iterator[Step]] = None
+        self.op_highlight: Optional[int] = None
+        # Nodes visited by a running search, and the path it ended with
+        self.op_visited: List[int] = []
+        self.op_path: List[int] = []
+        self.op_message = ""
+        self.animation = get_scheduler().register(
+            Animation(self._op_step, self._op_render, TREE_STEP_INTERVAL_MS,
+                      page=self, on_finished=self._op_finished))
         self.init_ui()
     
     def init_ui(self):
@@ -156,6 +313,20 @@ class BSTWidget(QWidget):
         controls.setSpacing(8)
         controls.setContentsMargins(0, 0, 0, 0)
         
+        self.tree_combo = QComboBox()
+        self.tree_combo.addItems(list(TREE_TYPES))
+        self.tree_combo.setMinimumHeight(35)
+        self.tree_combo.currentTextChanged.connect(self.change_tree_type)
+        controls.addWidget(self.tree_combo)
+        
+        self.layout_combo = QComboBox()
+        self.layout_combo.addItems(list(TREE_LAYOUTS))
+        self.layout_combo.setMinimumHeight(35)
+        self.layout_combo.setToolTip("Wheel to zoom, drag to pan, double-click to reset")
+        self.layout_combo.currentTextChanged.connect(
+            lambda name: self.canvas.set_layout(TREE_LAYOUTS[name]()))
+        controls.addWidget(self.layout_combo)
+        
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("Enter integer value")
         self.input_field.setMinimumHeight(35)
@@ -171,6 +342,11 @@ class BSTWidget(QWidget):
         delete_btn.setMinimumHeight(35)
         controls.addWidget(delete_btn)
         
+        self.search_combo = QComboBox()
+        self.search_combo.addItems(list(BST_SEARCHES))
+        self.search_combo.setMinimumHeight(35)
+        controls.addWidget(self.search_combo)
+        
         search_btn = QPushButton("Search")
         search_btn.clicked.connect(self.search_node)
         search_btn.setMinimumHeight(35)
@@ -218,54 +394,260 @@ class BSTWidget(QWidget):
         postorder_code_btn.setMinimumHeight(35)
         traversal_layout.addWidget(postorder_code_btn)
         
+        traversal_layout.addWidget(PlaybackControls(self.animation))
+        
         layout.addLayout(traversal_layout)
         
+        # Bulk building
+        bulk_layout = QHBoxLayout()
+        bulk_layout.setSpacing(8)
+        bulk_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.bulk_input = QLineEdit()
+        self.bulk_input.setPlaceholderText("Bulk values: 5,3,8 or 1..100 or random 50")
+        self.bulk_input.setMinimumHeight(35)
+        self.bulk_input.returnPressed.connect(self.bulk_insert)
+        bulk_layout.addWidget(self.bulk_input, 1)
+        
+        bulk_btn = QPushButton("Bulk Insert")
+        bulk_btn.clicked.connect(self.bulk_insert)
+        bulk_btn.setMinimumHeight(35)
+        bulk_layout.addWidget(bulk_btn)
+        
+        build_btn = QPushButton("Build Balanced")
+        build_btn.clicked.connect(self.build_balanced)
+        build_btn.setMinimumHeight(35)
+        bulk_layout.addWidget(build_btn)
+        
+        layout.addLayout(bulk_layout)
+        
+        # Order-statistic queries
+        query_layout = QHBoxLayout()
+        query_layout.setSpacing(8)
+        query_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.query_combo = QComboBox()
+        self.query_combo.addItems(list(TREE_QUERIES))
+        self.query_combo.setMinimumHeight(35)
+        query_layout.addWidget(self.query_combo)
+        
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("Value, k (0-based) or range a,b")
+        self.query_input.setMinimumHeight(35)
+        self.query_input.returnPressed.connect(self.run_query)
+        query_layout.addWidget(self.query_input, 1)
+        
+        query_btn = QPushButton("Query")
+        query_btn.clicked.connect(self.run_query)
+        query_btn.setMinimumHeight(35)
+        query_layout.addWidget(query_btn)
+        
+        layout.addLayout(query_layout)
+        
+        # Current insert/delete step
+        self.step_label = QLabel("")
+        self.step_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        layout.addWidget(self.step_label)
+        
         # Canvas
         self.canvas = BSTCanvas()
         self.canvas.set_bst(self.bst)
         layout.addWidget(self.canvas, 1)  # Give canvas stretch factor
     
+    def change_tree_type(self, name: str):
+        """Rebuild the current values in the selected kind of tree"""
+        self._finish_operation()
+        tree_type = TREE_TYPES[name]
+        if tree_type is BST:
+            # A plain BST keeps the current shape
+            self.bst = self.bst.plain_copy()
+        else:
+            # Balanced trees are rebuilt from the sorted values in O(n)
+            self.bst = tree_type.from_sorted(self.bst.iter_inorder())
+        self.step_label.clear()
+        self.canvas.set_bst(self.bst)
+        self.canvas.set_highlight()
+    
     def insert_node(self):
         """Insert a node into the BST"""
         try:
             value = int(self.input_field.text())
-            if self.bst.insert(value):
-                self.canvas.set_bst(self.bst)
-                self.input_field.clear()
-            else:
-                QMessageBox.information(self, "Info", f"{value} already exists in the tree")
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid integer")
+            return
+        self.input_field.clear()
+        self._start_operation(self.bst.insert_steps(value))
     
     def delete_node(self):
         """Delete a node from the BST"""
         try:
             value = int(self.input_field.text())
-            if self.bst.delete(value):
-                self.canvas.set_bst(self.bst)
-                self.input_field.clear()
-            else:
-                QMessageBox.information(self, "Info", f"{value} not found in the tree")
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid integer")
+            return
+        self.input_field.clear()
+        self._start_operation(self.bst.delete_steps(value))
+    
+    def _read_bulk(self) -> Optional[List[int]]:
+        try:
+            return _parse_values(self.bulk_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Input", str(e))
+            return None
+    
+    def bulk_insert(self):
+        """Merge many values into the tree in one pass and redraw once"""
+        values = self._read_bulk()
+        if values is None:
+            return
+        self._finish_operation()
+        added = self.bst.bulk_insert(values)
+        self.step_label.setText(f"Added {added} values ({len(values) - added} duplicates skipped), "
+                                f"{len(self.bst)} in tree")
+        self.canvas.set_bst(self.bst)
+        self.canvas.set_highlight()
+    
+    def build_balanced(self):
+        """Replace the tree with a balanced one over the given values"""
+        values = self._read_bulk()
+        if values is None:
+            return
+        self._finish_operation()
+        self.bst = TREE_TYPES[self.tree_combo.currentText()].from_sorted(sorted(set(values)))
+        self.step_label.setText(f"Built a balanced tree of {len(self.bst)} values")
+        self.canvas.set_bst(self.bst)
+        self.canvas.set_highlight()
+    
+    def _start_operation(self, steps: Iterator[Step]):
+        """Animate an insert/delete one structural step at a time"""
+        self._finish_operation()
+        self.op_steps = steps
+        self.op_message = ""
+        self.op_visited = []
+        self.op_path = []
+        self.animation.play()
+    
+    def _finish_operation(self):
+        """Apply the rest of a running insert/delete/search at once"""
+        if self.op_steps is not None:
+            for step in self.op_steps:
+                self._apply_layout(step)
+            self.op_steps = None
+        self.animation.pause()
+    
+    def _op_step(self) -> bool:
+        """Scheduler callback: apply the next step of the running operation"""
+        step = next(self.op_steps, None) if self.op_steps is not None else None
+        if step is None:
+            return False
+        kind, value = step[0], step[1]
+        self._apply_layout(step)
+        if kind == "deepen":
+            self.op_visited = []
+            self.step_label.setText(f"Depth limit {value}")
+            return True
+        if kind == "found":
+            self.op_path = value
+            self.op_highlight = value[-1]
+            self.step_label.setText("Path: " + " -> ".join(map(str, value)))
+            self.op_message = f"{value[-1]} found at depth {len(value) - 1}"
+            return True
+        self.op_highlight = value
+        if kind == "visit":
+            self.op_visited.append(value)
+            self.step_label.setText(f"Visit {value} (depth {step[2]})")
+        elif kind == "rotate":
+            self.step_label.setText(f"Rotate {step[2]} at {value}")
+        elif kind == "recolor":
+            self.step_label.setText(f"Recolor {value}")
+        elif kind == "duplicate":
+            self.op_message = f"{value} already exists in the tree"
+        elif kind == "notfound":
+            self.op_message = f"{value} not found in the tree"
+        else:
+            self.step_label.setText(f"{kind.capitalize()} {value}")
+        return True
+    
+    def _apply_layout(self, step: Step):
+        """Let the canvas layout follow a structural step"""
+        if step[0] in ("insert", "delete", "rotate"):
+            self.canvas.node_changed(step[1])
+    
+    def _op_render(self):
+        self.canvas.set_highlight(value=self.op_highlight, path=self.op_path or self.op_visited)
+    
+    def _op_finished(self):
+        if self.op_steps is None:
+            # Play pressed with no operation running
+            return
+        self.op_steps = None
+        # A successful search keeps its path on screen
+        if self.op_path:
+            self.canvas.set_highlight(value=self.op_path[-1], path=self.op_path[:-1])
+        else:
+            self.canvas.set_highlight()
+        # Consume the result so a later Play with nothing running stays quiet
+        message, self.op_message = self.op_message, ""
+        self.op_visited = []
+        self.op_path = []
+        if message:
+            QMessageBox.information(self, "Info", message)
     
     def search_node(self):
-        """Search for a node in the BST"""
+        """Animate the selected search algorithm looking for a value"""
         try:
             value = int(self.input_field.text())
-            node = self.bst.search(value)
-            if node:
-                QMessageBox.information(self, "Found", f"{value} found in the tree!")
-                # Highlight the found node
-                self.canvas.set_highlight(value=value)
-            else:
-                QMessageBox.information(self, "Not Found", f"{value} not found in the tree")
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid integer")
+            return
+        search = BST_SEARCHES[self.search_combo.currentText()]
+        self._start_operation(search(self.bst.root, value))
+    
+    def run_query(self):
+        """Run the selected order-statistic query and highlight its search path"""
+        name = self.query_combo.currentText()
+        method, arity = TREE_QUERIES[name]
+        try:
+            args = [int(part) for part in self.query_input.text().split(",")]
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Input", "Please enter integers")
+            return
+        if len(args) != arity:
+            QMessageBox.warning(self, "Invalid Input",
+                                f"{name} takes {'a range a,b' if arity == 2 else 'one integer'}")
+            return
+        
+        self._finish_operation()
+        try:
+            if method == "range_iter":
+                count, path = _trace(self.bst.range_count_steps(*args))
+                values = list(islice(self.bst.range_iter(*args), RANGE_PREVIEW))
+                listed = ", ".join(map(str, values)) + (", ..." if count > len(values) else "")
+                self.step_label.setText(f"{count} values in [{args[0]}, {args[1]}]: {listed}")
+                self.canvas.set_highlight(path=path + values)
+                return
+            if method in ("floor", "ceiling", "successor", "predecessor"):
+                below = method in ("floor", "predecessor")
+                strict = method in ("successor", "predecessor")
+                steps = self.bst.bound_steps(args[0], below, strict)
+            else:
+                steps = getattr(self.bst, f"{method}_steps")(*args)
+            result, path = _trace(steps)
+        except IndexError as e:
+            QMessageBox.warning(self, "Invalid Input", str(e))
+            return
+        
+        arg_text = ", ".join(map(str, args))
+        self.step_label.setText(f"{method}({arg_text}) = {'none' if result is None else result}")
+        # Node results are highlighted; counts only show the path walked
+        found = result if method in ("select", "floor", "ceiling", "successor", "predecessor") else None
+        self.canvas.set_highlight(value=found, path=[v for v in path if v != found])
     
     def clear_tree(self):
         """Clear the entire tree"""
-        self.bst = BST()
+        self._finish_operation()
+        self.step_label.clear()
+        self.bst = TREE_TYPES[self.tree_combo.currentText()]()
         self.canvas.set_bst(self.bst)
         self.canvas.set_highlight()
     
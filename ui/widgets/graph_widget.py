@@ -3,15 +3,20 @@ Graph Visualizer Widget
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                 QLineEdit, QLabel, QMessageBox, QTextEdit, QInputDialog)
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPolygonF
 from core.graph import GraphType, HeuristicsType
-from algorithms.searching import bfs_steps, dfs_steps
+from algorithms.searching import bfs_steps, dfs_steps, ucs_steps, astar_steps
+from algorithms.producer import StepProducer
 from algorithms.traversals import get_traversal_code
+from ui.animation import Animation, PlaybackControls, get_scheduler
 from utils.constants import COLORS, DEFAULT_GRAPH_NODE_RADIUS
-from typing import Dict, Tuple, List, Set
+from typing import Dict, Tuple, List, Set, Optional
 import math
 
+# Time per visited node when running at 1x speed
+SEARCH_INTERVAL_MS = 800
+
 
 class GraphCanvas(QWidget):
     """Canvas widget for drawing graphs"""
@@ -153,6 +158,11 @@ class GraphWidget(QWidget):
         super().__init__(parent)
         self.graph: GraphType = {}
         self.heuristics: HeuristicsType = {}
+        self.search_gen: Optional[StepProducer] = None
+        self.search_path: Optional[List[str]] = None
+        self.animation = get_scheduler().register(
+            Animation(self._search_step, self._search_render, SEARCH_INTERVAL_MS,
+                      page=self, on_finished=self._search_finished))
         self.init_ui()
     
     def init_ui(self):
@@ -223,7 +233,7 @@ class GraphWidget(QWidget):
         self.goal_input.setMinimumHeight(35)
         search_layout.addWidget(self.goal_input)
         
-        search_btn = QPushButton("Search (BFS/DFS)")
+        search_btn = QPushButton("Search (BFS/DFS/UCS/A*)")
         search_btn.clicked.connect(self.search_graph)
         search_btn.setMinimumHeight(35)
         search_layout.addWidget(search_btn)
@@ -238,8 +248,15 @@ class GraphWidget(QWidget):
         postorder_btn.setMinimumHeight(35)
         search_layout.addWidget(postorder_btn)
         
+        search_layout.addWidget(PlaybackControls(self.animation))
+        
         layout.addLayout(search_layout)
         
+        # Search counters
+        self.stats_label = QLabel("Visited: 0  Enqueued: 0  Steps: 0")
+        self.stats_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        layout.addWidget(self.stats_label)
+        
         # Canvas
         self.canvas = GraphCanvas()
         layout.addWidget(self.canvas, 1)
@@ -276,7 +293,7 @@ class GraphWidget(QWidget):
         self.canvas.update()
     
     def search_graph(self):
-        """Search the graph using BFS or DFS"""
+        """Search the graph using BFS, DFS, uniform-cost search or A*"""
         start = self.start_input.text().strip()
         goal = self.goal_input.text().strip()
         
@@ -289,31 +306,69 @@ class GraphWidget(QWidget):
             return
         
         algo, ok = QInputDialog.getItem(self, "Algorithm", "Choose search algorithm:",
-                                        ["BFS", "DFS"], 0, False)
+                                        ["BFS", "DFS", "UCS", "A*"], 0, False)
         if not ok:
             return
         
-        # Run search
-        if algo == "BFS":
-            gen = bfs_steps(self.graph, start, goal)
+        # Search on a worker thread; the animation scheduler drains its steps
+        if self.search_gen is not None:
+            self.search_gen.cancel()
+        if algo == "A*":
+            steps = astar_steps(self.graph, start, goal, self.heuristics)
         else:
-            gen = dfs_steps(self.graph, start, goal)
-        
-        visited_order = []
-        path = None
-        for step in gen:
+            steps_fn = {"BFS": bfs_steps, "DFS": dfs_steps, "UCS": ucs_steps}[algo]
+            steps = steps_fn(self.graph, start, goal)
+        self.search_gen = StepProducer(steps).start()
+        self.search_path = None
+        self.canvas.set_highlight()
+        self.animation.play()
+    
+    def _search_step(self) -> Optional[bool]:
+        """Scheduler callback: advance the search to its next visited node"""
+        if self.search_gen is None:
+            return False
+        while True:
+            step = self.search_gen.take()
+            if step is None:
+                # Still searching: try again next frame
+                return False if self.search_gen.exhausted else None
             if step[0] == "visit":
-                visited_order.append(step[1])
-            elif step[0] == "found":
-                path = step[1]
-                break
-        
-        if path:
-            QMessageBox.information(self, "Found", f"Path: {' -> '.join(path)}")
-            self.canvas.set_highlight(path=path)
+                self.canvas.highlight_node = step[1]
+                return True
+            if step[0] == "found":
+                self.search_path = step[1]
+                return False
+            if step[0] == "notfound":
+                return False
+    
+    def _search_render(self):
+        """Scheduler callback: repaint the current node and counters"""
+        self.canvas.update()
+        self._update_stats()
+    
+    def _search_finished(self):
+        """Show the search result once the animation completes"""
+        if self.search_gen is None:
+            # Play pressed with no search running
+            return
+        self._update_stats()
+        self.search_gen.cancel()
+        self.search_gen = None
+        if self.search_path:
+            self.canvas.set_highlight(path=self.search_path)
+            QMessageBox.information(self, "Found", f"Path: {' -> '.join(self.search_path)}")
         else:
+            self.canvas.set_highlight()
             QMessageBox.information(self, "Not Found", "Goal not reachable from start")
     
+    def _update_stats(self):
+        """Show the running search counters"""
+        if self.search_gen is None:
+            return
+        c = self.search_gen.counters
+        self.stats_label.setText(f"Visited: {c.visits}  Enqueued: {c.enqueues}  Steps: {c.steps}  "
+                                 f"Time: {c.elapsed * 1000:.2f} ms")
+    
     def show_preorder(self):
         """Show preorder DFS traversal"""
         start = self.start_input.text().strip() or (list(self.graph.keys())[0] if self.graph else "")
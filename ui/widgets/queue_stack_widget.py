@@ -2,29 +2,87 @@
 Queue and Stack Simulator Widget
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                                QLineEdit, QLabel, QMessageBox, QGroupBox)
+                                QLineEdit, QLabel, QMessageBox, QGroupBox, QSpinBox,
+                                QComboBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from core.queue_stack import Queue, Stack
+from core.queue_stack import (Queue, GrowableQueue, DequeQueue, Stack, Deque, PriorityQueue,
+                              MonotonicStack, MonotonicQueue, Step, BatchStats,
+                               Op, apply_ops, parse_ops, random_ops)
+from ui.animation import Animation, PlaybackControls, get_scheduler
 from utils.constants import COLORS
 from utils.sound import create_pop_sound
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import pygame
 
+# Batch mode applies BATCH_CHUNK operations per step and runs as many steps
+# as fit in the scheduler's frame budget (like sorting turbo mode); the
+# canvases repaint at most once per frame
+BATCH_CHUNK = 256
+
+# Smallest box height; structures with more slots than fit are windowed
+MIN_BOX_H = 40
+
+# Structure mode -> (queue class, stack class, size required)
+STRUCTURE_MODES = {
+    "Fixed": (Queue, Stack, True),
+    "Growable": (GrowableQueue, Stack, False),
+    "Deque": (DequeQueue, Stack, False),
+}
+
+# Advanced structure -> (factory taking the structure size, canvas layout)
+ADVANCED_STRUCTURES = {
+    "Deque": (Deque, "queue"),
+    "Priority Queue": (PriorityQueue, "queue"),
+    "Monotonic Stack": (lambda size: MonotonicStack(), "stack"),
+    "Monotonic Queue": (lambda size: MonotonicQueue(), "queue"),
+}
+ADVANCED_INTERVAL_MS = 350
+
+# Highlight colors for the advanced structures' steps
+STEP_COLORS = {
+    "compare": COLORS['warning'],
+    "swap": COLORS['danger'],
+    "insert": COLORS['primary'],
+    "remove": COLORS['error'],
+}
+
+
+def _parse_number(text: str):
+    """Parse an int or float, raising ValueError otherwise"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"'{text}' is not a number") from None
+
 
 class QueueStackCanvas(QWidget):
-    """Canvas for drawing queue and stack boxes"""
+    """
+    Canvas for drawing queue and stack boxes
+    
+    Bounded structures whose slots fit are drawn one box per slot. Larger or
+    unbounded ones switch to a windowed view: only the boxes for the top of
+    the stack or the front of the queue are drawn (fetched with ``window``,
+    so the cost does not depend on the item count), plus a count summary.
+    """
     
     def __init__(self, structure_type: str, parent=None):
         super().__init__(parent)
         self.structure_type = structure_type  # "queue" or "stack"
-        self.items: list = []
-        self.max_size: int = 0
+        self.structure = None
+        self.highlights: Dict[int, str] = {}  # items index -> color
+        self.label_fn: Callable[[Any], str] = str
         self.setMinimumSize(200, 400)
     
-    def set_data(self, items: list, max_size: int):
-        """Set the data to visualize"""
-        self.items = items
-        self.max_size = max_size
+    def set_data(self, structure, highlights: Optional[Dict[int, str]] = None):
+        """Set the Queue/Stack to visualize and the items to highlight"""
+        self.structure = structure
+        self.highlights = highlights or {}
         self.update()
     
     def paintEvent(self, event):
@@ -32,52 +90,77 @@ class QueueStackCanvas(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        if self.max_size == 0:
+        if self.structure is None:
             painter.setPen(QColor(COLORS['text_light']))
             painter.setFont(QFont("Arial", 12))
             painter.drawText(self.rect(), Qt.AlignCenter, "Set size first")
             return
         
-        w = self.width()
-        h = self.height()
-        box_h = max((h - 80) // self.max_size, 40)
+        max_size = self.structure.max_size
+        rows = max((self.height() - 80) // MIN_BOX_H, 2)
+        if max_size is not None and max_size <= rows:
+            self._draw_slots(painter, max_size)
+        else:
+            self._draw_window(painter, rows - 1)
+    
+    def _draw_slots(self, painter: QPainter, max_size: int):
+        """Draw one box per slot"""
+        items = self.structure.items
+        box_h = max((self.height() - 80) // max_size, MIN_BOX_H)
         
         # Draw boxes (top to bottom)
-        for i in range(self.max_size):
+        for i in range(max_size):
             y = 40 + i * box_h
             
             # Determine if box is filled
             if self.structure_type == "stack":
                 # Stack: Fill from bottom to top, show most recent at top
-                # Calculate position from bottom
-                stack_size = len(self.items)
-                box_from_bottom = self.max_size - i - 1  # 0 is bottom, max_size-1 is top
-                
-                if box_from_bottom < stack_size:
-                    # This box should be filled
-                    filled = True
-                    # Get the item: bottom item is items[0], top item is items[-1]
-                    value = self.items[box_from_bottom]
-                else:
-                    filled = False
-                    value = ""
+                box_from_bottom = max_size - i - 1  # 0 is bottom, max_size-1 is top
+                # Bottom item is items[0], top item is items[-1]
+                index = box_from_bottom
             else:
-                # Queue: rear at index 0 in display (top), front at bottom
-                filled = i < len(self.items)
-                value = self.items[i] if filled else ""
+                # Queue: front of the queue at the top
+                index = i
+            filled = index < len(items)
+            value = items[index] if filled else ""
             
-            # Draw box
-            color = COLORS['box_filled'] if filled else COLORS['box_empty']
-            painter.setBrush(QBrush(QColor(color)))
-            painter.setPen(QPen(QColor(COLORS['border']), 2))
-            painter.drawRect(w // 2 - 80, y, 160, box_h - 10)
-            
-            # Draw value
-            if filled:
-                painter.setPen(QColor(COLORS['text']))
-                painter.setFont(QFont("Arial", 14, QFont.Bold))
-                painter.drawText(w // 2 - 80, y, 160, box_h - 10,
-                               Qt.AlignCenter, str(value))
+            self._draw_box(painter, y, box_h, value, filled, self.highlights.get(index))
+    
+    def _draw_window(self, painter: QPainter, rows: int):
+        """Draw the top/front `rows` items and a summary line"""
+        values = self.structure.window(rows)
+        count = len(self.structure)
+        for i, value in enumerate(values):
+            index = count - 1 - i if self.structure_type == "stack" else i
+            self._draw_box(painter, 40 + i * MIN_BOX_H, MIN_BOX_H, value, True,
+                           self.highlights.get(index))
+        
+        end = "top" if self.structure_type == "stack" else "front"
+        limit = self.structure.max_size
+        summary = f"Showing {len(values):,} of {count:,} items from the {end}"
+        summary += f" (max {limit:,})" if limit is not None else " (unbounded)"
+        capacity = getattr(self.structure, "capacity", None)
+        if capacity is not None and capacity != limit:
+            summary += f", buffer {capacity:,}"
+        painter.setPen(QColor(COLORS['text_light']))
+        painter.setFont(QFont("Arial", 11))
+        painter.drawText(10, 40 + rows * MIN_BOX_H, self.width() - 20, 2 * MIN_BOX_H,
+                         Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, summary)
+    
+    def _draw_box(self, painter: QPainter, y: int, box_h: int, value, filled: bool,
+                  highlight: Optional[str] = None):
+        w = self.width()
+        color = highlight or (COLORS['box_filled'] if filled else COLORS['box_empty'])
+        painter.setBrush(QBrush(QColor(color)))
+        painter.setPen(QPen(QColor(COLORS['border']), 2))
+        painter.drawRect(w // 2 - 80, y, 160, box_h - 10)
+        
+        # Draw value
+        if filled:
+            painter.setPen(QColor(COLORS['text']))
+            painter.setFont(QFont("Arial", 14, QFont.Bold))
+            painter.drawText(w // 2 - 80, y, 160, box_h - 10,
+                           Qt.AlignCenter, self.label_fn(value))
 
 
 class QueueStackWidget(QWidget):
@@ -85,9 +168,23 @@ class QueueStackWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.queue: Queue = None
-        self.stack: Stack = None
-        self.max_size = 0
+        self.queue: Optional[Union[Queue, DequeQueue]] = None
+        self.stack: Optional[Stack] = None
+        self.batch_ops: List[Op] = []
+        self.batch_pos = 0
+        self.batch_stats: Optional[BatchStats] = None
+        self.size: Optional[int] = None
+        self.advanced = None
+        self.advanced_steps: Optional[Iterator[Step]] = None
+        self.advanced_highlights: Dict[int, str] = {}
+        self.advanced_removed: List[Any] = []
+        self.advanced_message = ""
+        self.animation = get_scheduler().register(
+            Animation(self._batch_step, self.update_display, 0,
+                      page=self, on_finished=self._batch_finished))
+        self.advanced_animation = get_scheduler().register(
+            Animation(self._advanced_step, self._advanced_render, ADVANCED_INTERVAL_MS,
+                      page=self, on_finished=self._advanced_finished))
         pygame.init()
         self.pop_sound = create_pop_sound()
         self.init_ui()
@@ -107,6 +204,12 @@ class QueueStackWidget(QWidget):
         # Size input
         size_layout = QHBoxLayout()
         size_layout.setSpacing(8)
+        size_layout.addWidget(QLabel("Mode:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(list(STRUCTURE_MODES))
+        self.mode_combo.setMinimumHeight(35)
+        self.mode_combo.currentTextChanged.connect(self._mode_changed)
+        size_layout.addWidget(self.mode_combo)
         size_layout.addWidget(QLabel("Structure Size:"))
         self.size_input = QLineEdit()
         self.size_input.setPlaceholderText("e.g., 8")
@@ -156,6 +259,39 @@ class QueueStackWidget(QWidget):
         
         layout.addLayout(controls)
         
+        # Batch operations
+        batch = QHBoxLayout()
+        batch.setSpacing(8)
+        batch.setContentsMargins(0, 0, 0, 0)
+        
+        self.script_input = QLineEdit()
+        self.script_input.setPlaceholderText("Script, e.g. push 7 x100; pop x20; enqueue a x50; dequeue")
+        self.script_input.setMinimumHeight(35)
+        batch.addWidget(self.script_input, 1)
+        
+        script_btn = QPushButton("Run Script")
+        script_btn.clicked.connect(self.run_script)
+        script_btn.setMinimumHeight(35)
+        batch.addWidget(script_btn)
+        
+        self.random_count = QSpinBox()
+        self.random_count.setRange(1, 1_000_000)
+        self.random_count.setValue(5000)
+        self.random_count.setMinimumHeight(35)
+        batch.addWidget(self.random_count)
+        
+        random_btn = QPushButton("Random Ops")
+        random_btn.clicked.connect(self.run_random)
+        random_btn.setMinimumHeight(35)
+        batch.addWidget(random_btn)
+        
+        batch.addWidget(PlaybackControls(self.animation))
+        layout.addLayout(batch)
+        
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        layout.addWidget(self.stats_label)
+        
         # Display area
         display_layout = QHBoxLayout()
         display_layout.setSpacing(8)
@@ -165,34 +301,73 @@ class QueueStackWidget(QWidget):
         stack_layout = QVBoxLayout(stack_group)
         self.stack_canvas = QueueStackCanvas("stack")
         stack_layout.addWidget(self.stack_canvas)
-        display_layout.addWidget(stack_group)
+        display_layout.addWidget(stack_group, 1)
         
         # Queue
         queue_group = QGroupBox("Queue (Rear → Front)")
         queue_layout = QVBoxLayout(queue_group)
         self.queue_canvas = QueueStackCanvas("queue")
         queue_layout.addWidget(self.queue_canvas)
-        display_layout.addWidget(queue_group)
+        display_layout.addWidget(queue_group, 1)
+        
+        # Deque, priority queue and monotonic structures
+        advanced_group = QGroupBox("Advanced Structures")
+        advanced_layout = QVBoxLayout(advanced_group)
+        self.advanced_combo = QComboBox()
+        self.advanced_combo.addItems(list(ADVANCED_STRUCTURES))
+        self.advanced_combo.setMinimumHeight(35)
+        self.advanced_combo.currentTextChanged.connect(self.create_advanced)
+        advanced_layout.addWidget(self.advanced_combo)
+        op_layout = QHBoxLayout()
+        self.advanced_op_combo = QComboBox()
+        self.advanced_op_combo.setMinimumHeight(35)
+        op_layout.addWidget(self.advanced_op_combo, 1)
+        apply_btn = QPushButton("Apply")
+        apply_btn.clicked.connect(self.run_advanced)
+        apply_btn.setMinimumHeight(35)
+        op_layout.addWidget(apply_btn)
+        advanced_layout.addLayout(op_layout)
+        self.advanced_canvas = QueueStackCanvas("queue")
+        advanced_layout.addWidget(self.advanced_canvas, 1)
+        self.advanced_label = QLabel("")
+        self.advanced_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        self.advanced_label.setWordWrap(True)
+        advanced_layout.addWidget(self.advanced_label)
+        display_layout.addWidget(advanced_group, 1)
         
         layout.addLayout(display_layout, 1)
     
+    def _mode_changed(self, mode: str):
+        self.size_input.setPlaceholderText("e.g., 8" if STRUCTURE_MODES[mode][2] else "blank = unbounded")
+    
     def create_structures(self):
-        """Create queue and stack with specified size"""
+        """Create queue and stack in the selected mode"""
+        queue_cls, stack_cls, size_required = STRUCTURE_MODES[self.mode_combo.currentText()]
+        text = self.size_input.text().strip()
         try:
-            size = int(self.size_input.text())
-            if size <= 0:
+            size = int(text) if text or size_required else None
+            if size is not None and size <= 0:
                 raise ValueError
-            self.max_size = size
-            self.queue = Queue(size)
-            self.stack = Stack(size)
-            self.update_display()
-            QMessageBox.information(self, "Success", f"Created structures with size {size}")
         except ValueError:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a positive integer")
+            msg = "Please enter a positive integer"
+            if not size_required:
+                msg += ", or leave the size blank for unbounded structures"
+            QMessageBox.warning(self, "Invalid Input", msg)
+            return
+        self.stop_batch()
+        self.batch_stats = None
+        self.stats_label.clear()
+        self.size = size
+        self.queue = queue_cls(size)
+        self.stack = stack_cls(size)
+        self.create_advanced()
+        self.update_display()
+        limit = f"size {size}" if size is not None else "no size limit"
+        QMessageBox.information(self, "Success", f"Created structures with {limit}")
     
     def stack_push(self):
         """Push to stack"""
-        if not self.stack:
+        if self.stack is None:
             QMessageBox.warning(self, "Error", "Create structures first")
             return
         
@@ -208,7 +383,7 @@ class QueueStackWidget(QWidget):
     
     def stack_pop(self):
         """Pop from stack"""
-        if not self.stack:
+        if self.stack is None:
             QMessageBox.warning(self, "Error", "Create structures first")
             return
         
@@ -221,7 +396,7 @@ class QueueStackWidget(QWidget):
     
     def queue_enqueue(self):
         """Enqueue to queue"""
-        if not self.queue:
+        if self.queue is None:
             QMessageBox.warning(self, "Error", "Create structures first")
             return
         
@@ -237,7 +412,7 @@ class QueueStackWidget(QWidget):
     
     def queue_dequeue(self):
         """Dequeue from queue"""
-        if not self.queue:
+        if self.queue is None:
             QMessageBox.warning(self, "Error", "Create structures first")
             return
         
@@ -248,9 +423,181 @@ class QueueStackWidget(QWidget):
         else:
             QMessageBox.information(self, "Empty", "Queue is empty")
     
+    def create_advanced(self):
+        """Create the selected advanced structure with the current size"""
+        name = self.advanced_combo.currentText()
+        factory, layout = ADVANCED_STRUCTURES[name]
+        self.advanced_animation.pause()
+        self.advanced_steps = None
+        self.advanced_highlights = {}
+        self.advanced_op_combo.clear()
+        self.advanced_label.clear()
+        self.advanced = factory(self.size) if self.stack is not None else None
+        if self.advanced is not None:
+            self.advanced_op_combo.addItems(list(self.advanced.OPERATIONS))
+        self.advanced_canvas.structure_type = layout
+        self.advanced_canvas.label_fn = (
+            (lambda entry: f"{entry[0]} ({entry[1]:g})") if name == "Priority Queue" else str)
+        self.advanced_canvas.set_data(self.advanced)
+    
+    def _advanced_args(self, op: str) -> Tuple:
+        """
+        Arguments for an advanced operation from the value box
+        
+        Raises:
+            ValueError: If the value does not fit the operation
+        """
+        arity = self.advanced.OPERATIONS[op]
+        text = self.value_input.text().strip()
+        if not arity:
+            return ()
+        if not text:
+            raise ValueError("Enter a value")
+        if isinstance(self.advanced, PriorityQueue):
+            # "item priority", or a bare number used as both
+            parts = text.split()
+            if len(parts) > 2:
+                raise ValueError("Enter 'item priority' or a number")
+            item, priority = parts[0], _parse_number(parts[-1])
+            if op == "push" and item in self.advanced:
+                raise ValueError(f"'{item}' is already queued; use decrease_key")
+            if op == "decrease_key" and item not in self.advanced:
+                raise ValueError(f"'{item}' is not queued")
+            return item, priority
+        if isinstance(self.advanced, (MonotonicStack, MonotonicQueue)):
+            return (_parse_number(text),)
+        return (text,)
+    
+    def run_advanced(self):
+        """Animate the selected operation on the advanced structure"""
+        if self.advanced is None:
+            QMessageBox.warning(self, "Error", "Create structures first")
+            return
+        op = self.advanced_op_combo.currentText()
+        if self.advanced_steps is not None:
+            # Finish the previous operation instantly, so the new one is
+            # validated against the structure it will actually run on
+            for _ in self.advanced_steps:
+                pass
+            self.advanced_steps = None
+        try:
+            args = self._advanced_args(op)
+            steps = self.advanced.run_steps(op, *args)
+            # Generators validate lazily: prime the first step here so a bad
+            # operation is reported now instead of inside the animation tick
+            first = next(steps, None)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Input", str(e))
+            return
+        if args:
+            self.value_input.clear()
+        self.advanced_steps = chain([first], steps) if first is not None else iter(())
+        self.advanced_removed = []
+        self.advanced_message = ""
+        self.advanced_animation.play()
+    
+    def _advanced_step(self) -> bool:
+        """Apply the next step of the running advanced operation"""
+        step = next(self.advanced_steps, None) if self.advanced_steps else None
+        if step is None:
+            return False
+        kind = step[0]
+        self.advanced_highlights = {}
+        if kind in STEP_COLORS:
+            color = STEP_COLORS[kind]
+            for index in step[1:]:
+                if index is not None:
+                    self.advanced_highlights[index] = color
+        elif kind == "removed":
+            self.advanced_removed.append(step[1])
+        elif kind == "overflow":
+            self.advanced_message = "Full"
+        elif kind == "underflow":
+            self.advanced_message = "Empty"
+        return True
+    
+    def _advanced_render(self):
+        self.advanced_canvas.set_data(self.advanced, self.advanced_highlights)
+    
+    def _advanced_finished(self):
+        self.advanced_steps = None
+        self.advanced_highlights = {}
+        self.advanced_canvas.set_data(self.advanced)
+        text = self.advanced_message
+        if self.advanced_removed:
+            label = self.advanced_canvas.label_fn
+            text = "Removed: " + ", ".join(label(item) for item in self.advanced_removed)
+            self.pop_sound.play()
+        peek = self.advanced.peek()
+        if peek is not None:
+            end = "Top" if self.advanced_canvas.structure_type == "stack" else "Front"
+            text += f"{'  ' if text else ''}{end}: {self.advanced_canvas.label_fn(peek)}"
+        self.advanced_label.setText(text)
+    
+    def run_script(self):
+        """Apply the operations in the script box"""
+        try:
+            ops = parse_ops(self.script_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Script", str(e))
+            return
+        self.start_batch(ops)
+    
+    def run_random(self):
+        """Apply a random sequence of operations"""
+        self.start_batch(random_ops(self.random_count.value()))
+    
+    def start_batch(self, ops: List[Op]):
+        """
+        Play a sequence of operations against both structures
+        
+        Full/empty conditions are counted in the statistics line instead of
+        interrupting the run with a message box.
+        """
+        if self.stack is None:
+            QMessageBox.warning(self, "Error", "Create structures first")
+            return
+        if not ops:
+            return
+        self.batch_ops = ops
+        self.batch_pos = 0
+        self.batch_stats = BatchStats()
+        self._update_stats()
+        self.animation.play()
+    
+    def stop_batch(self):
+        """Abandon the running batch, if any"""
+        self.animation.pause()
+        self.batch_ops = []
+        self.batch_pos = 0
+    
+    def _batch_step(self) -> bool:
+        """Apply the next chunk of batch operations"""
+        if self.batch_pos >= len(self.batch_ops):
+            return False
+        end = self.batch_pos + BATCH_CHUNK
+        apply_ops(self.batch_ops[self.batch_pos:end], self.stack, self.queue, self.batch_stats)
+        self.batch_pos = end
+        return True
+    
+    def _batch_finished(self):
+        if not self.batch_ops:
+            # Play pressed with no batch loaded
+            return
+        self.batch_ops = []
+        self.update_display()
+        self.pop_sound.play()
+    
+    def _update_stats(self):
+        if self.batch_stats is None:
+            return
+        text = self.batch_stats.summary()
+        if self.batch_ops:
+            text = f"Batch {min(self.batch_pos, len(self.batch_ops))}/{len(self.batch_ops)}  {text}"
+        self.stats_label.setText(text)
+    
     def update_display(self):
         """Update both canvases"""
-        if self.stack:
-            self.stack_canvas.set_data(self.stack.items, self.max_size)
-        if self.queue:
-            self.queue_canvas.set_data(self.queue.items, self.max_size)
+        self.stack_canvas.set_data(self.stack)
+        self.queue_canvas.set_data(self.queue)
+        self._update_stats()
@@ -2,65 +2,478 @@
 Sorting Visualizer Widget
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                                QLineEdit, QLabel, QMessageBox, QComboBox)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from algorithms.sorting import (insertion_steps, bubble_steps, selection_steps,
-                                 merge_steps, quick_steps)
+                                QLineEdit, QLabel, QMessageBox, QComboBox,
+                                QFileDialog, QSlider, QStackedWidget, QGridLayout,
+                                QDialog, QListWidget, QListWidgetItem,
+                                QDialogButtonBox, QCheckBox, QApplication)
+from PySide6.QtCore import Qt, QRect, QTimer, Signal
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QImage
+from algorithms.sorting import SORTING_ALGORITHMS, quick_steps, apply_delta, counting_span_limit
+from algorithms.trace import StepTrace
+from algorithms.precompute import TraceService
+from algorithms.timeline import Timeline
+from algorithms.instrument import OpCounters
+from algorithms.producer import StepProducer
+from ui.animation import Animation, PlaybackControls, get_scheduler
 from utils.constants import COLORS
-from typing import List, Optional, Generator
+from typing import Dict, List, Optional, Set, Iterable, Tuple
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+# Time per step when running at 1x speed
+STEP_INTERVAL_MS = 220
+# How often Step retries while the producer has no step ready, and how often
+# a background trace export is polled
+STEP_RETRY_MS = 10
+EXPORT_POLL_MS = 100
+
+# Bar layout: labeled bars are at least this wide, with this gap between them
+MIN_LABELED_BAR_W = 8
+BAR_GAP = 6
+BAR_MARGIN = 10
+
+# Algorithms checked by default when starting a race
+RACE_DEFAULT = ["Insertion", "Bubble", "Selection", "Merge", "Quick"]
+# Inputs at least this long default to precomputing race traces
+RACE_PRECOMPUTE_MIN = 2000
+
+# Values must fit the int64 columns of StepTrace/Timeline
+VALUE_MIN = -2 ** 63
+VALUE_MAX = 2 ** 63 - 1
 
 
 class SortingCanvas(QWidget):
-    """Canvas widget for drawing sorting bars"""
+    """
+    Canvas widget for drawing sorting bars
+    
+    Bars are drawn into a cached image layer; paint events only blit it.
+    Updates that name the changed indices redraw just those columns and
+    repaint their rectangles. With more elements than pixel columns, each
+    column shows the min/max range of the elements it covers.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.array: List[int] = []
-        self.highlights: List[int] = []
+        self.highlights: Set[int] = set()
+        self.mode = "bars"  # "bars" (labeled), "compact" or "density"
+        self._layer: Optional[QImage] = None
+        self._max_val = 1
+        self._cols = 0
+        self._hl_cols: Set[int] = set()
+        # Drawing resources are created once, not per bar per frame
+        self._bar_brush = QBrush(QColor(COLORS['bar_default']))
+        self._compare_brush = QBrush(QColor(COLORS['bar_compare']))
+        # Opaque tint for min..max ranges; alpha fills are several times slower
+        self._range_brush = QBrush(QColor(COLORS['bar_default']).lighter(130))
+        self._outline_pen = QPen(QColor(COLORS['text']), 1)
+        self._text_pen = QPen(QColor(COLORS['text']))
+        self._value_font = QFont("Arial", 9)
+        self._empty_font = QFont("Arial", 14)
         self.setMinimumSize(600, 300)
     
-    def set_array(self, array: List[int], highlights: List[int] = None):
-        """Set the array to visualize"""
+    def set_array(self, array: List[int], highlights: Iterable[int] = None,
+                  changed: Optional[Iterable[int]] = None):
+        """
+        Set the array to visualize
+        
+        Args:
+            array: Values to draw
+            highlights: Indices to draw in the compare color
+            changed: Indices whose values changed since the last call;
+                None redraws every bar
+        """
+        highlights = set(highlights) if highlights else set()
+        if changed is None or self._layer is None or len(array) != len(self.array):
+            self.array = array
+            self.highlights = highlights
+            self._rebuild()
+            self.update()
+            return
+        
+        dirty = set(changed)
         self.array = array
-        self.highlights = highlights if highlights else []
-        self.update()
+        if any(array[i] > self._max_val for i in dirty):
+            # Rescale everything when a new maximum appears
+            self.highlights = highlights
+            self._rebuild()
+            self.update()
+            return
+        dirty |= self.highlights ^ highlights
+        self.highlights = highlights
+        if not dirty:
+            return
+        
+        cols = self._columns_of(dirty)
+        if self.mode == "density":
+            self._hl_cols = self._columns_of(highlights)
+        if len(cols) > self._cols // 2:
+            self._rebuild()
+            self.update()
+            return
+        
+        painter = QPainter(self._layer)
+        for c in cols:
+            self._draw_column(painter, c)
+        painter.end()
+        for first, last in self._runs(sorted(cols)):
+            x0, _ = self._column_span(first)
+            x1, w1 = self._column_span(last)
+            self.update(QRect(x0, 0, x1 + w1 - x0, self.height()))
+    
+    def _columns_of(self, indices: Iterable[int]) -> Set[int]:
+        """Columns that draw the given indices"""
+        if self.mode != "density":
+            return set(indices)
+        n, cols = len(self.array), self._cols
+        return {i * cols // n for i in indices}
+    
+    @staticmethod
+    def _runs(cols: List[int]):
+        """Group sorted column numbers into contiguous (first, last) runs"""
+        start = prev = cols[0]
+        for c in cols[1:]:
+            if c != prev + 1:
+                yield start, prev
+                start = c
+            prev = c
+        yield start, prev
+    
+    def _relayout(self):
+        """Pick the drawing mode and column geometry for the current size"""
+        n = len(self.array)
+        w = self.width()
+        usable = max(w - 2 * BAR_MARGIN, 1)
+        self._bar_w = max(MIN_LABELED_BAR_W, w / (n * 1.6))
+        if n * (self._bar_w + BAR_GAP) - BAR_GAP <= usable:
+            self.mode, self._cols = "bars", n
+        elif n <= usable:
+            self.mode, self._cols = "compact", n
+        else:
+            self.mode, self._cols = "density", usable
+        self._usable = usable
+        self._max_val = max(self.array)
+    
+    def _column_span(self, c: int) -> Tuple[int, int]:
+        """Left edge and width of column c"""
+        if self.mode == "bars":
+            return int(BAR_MARGIN + c * (self._bar_w + BAR_GAP)), int(self._bar_w)
+        x0 = BAR_MARGIN + c * self._usable // self._cols
+        x1 = BAR_MARGIN + (c + 1) * self._usable // self._cols
+        return x0, max(x1 - x0, 1)
+    
+    def _bar_top(self, val: int) -> int:
+        """Y coordinate of the top of a bar for value val"""
+        h = self.height()
+        bar_h = (val / self._max_val) * (h - 50) if self._max_val > 0 else 10
+        return int(h - max(bar_h, 0) - 20)
+    
+    def _rebuild(self):
+        """Redraw the whole bar layer"""
+        if not self.array:
+            self._layer = None
+            return
+        dpr = self.devicePixelRatioF()
+        self._layer = QImage(int(self.width() * dpr), int(self.height() * dpr),
+                             QImage.Format_ARGB32_Premultiplied)
+        self._layer.setDevicePixelRatio(dpr)
+        self._layer.fill(Qt.transparent)
+        self._relayout()
+        if self.mode == "density":
+            self._hl_cols = self._columns_of(self.highlights)
+        painter = QPainter(self._layer)
+        for c in range(self._cols):
+            self._draw_column(painter, c, clear=False)
+        painter.end()
+    
+    def _draw_column(self, painter: QPainter, c: int, clear: bool = True):
+        """Draw one column of the bar layer"""
+        x, bar_w = self._column_span(c)
+        h = self.height()
+        base = h - 20
+        if clear:
+            # Labeled bars have a 1px outline past their width
+            outline = 1 if self.mode == "bars" else 0
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.fillRect(x, 0, bar_w + outline, h, Qt.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        
+        if self.mode == "density":
+            n = len(self.array)
+            lo, hi = c * n // self._cols, (c + 1) * n // self._cols
+            bucket = self.array[lo:hi]
+            top, low = self._bar_top(max(bucket)), self._bar_top(min(bucket))
+            if c in self._hl_cols:
+                painter.fillRect(x, top, bar_w, base - top, self._compare_brush)
+            else:
+                painter.fillRect(x, low, bar_w, base - low, self._bar_brush)
+                painter.fillRect(x, top, bar_w, max(low - top, 1), self._range_brush)
+            return
+        
+        val = self.array[c]
+        y = self._bar_top(val)
+        brush = self._compare_brush if c in self.highlights else self._bar_brush
+        if self.mode == "compact":
+            gap = 1 if bar_w >= 3 else 0
+            painter.fillRect(x, y, bar_w - gap, base - y, brush)
+            return
+        
+        painter.setBrush(brush)
+        painter.setPen(self._outline_pen)
+        painter.drawRect(x, y, bar_w, base - y)
+        painter.setPen(self._text_pen)
+        painter.setFont(self._value_font)
+        painter.drawText(x, y - 10, bar_w, 10, Qt.AlignCenter, str(val))
+    
+    def resizeEvent(self, event):
+        """Drop the cached layer; it is rebuilt at the new size on paint"""
+        self._layer = None
+        super().resizeEvent(event)
     
     def paintEvent(self, event):
-        """Draw the sorting bars"""
+        """Blit the cached bar layer"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         if not self.array:
             painter.setPen(QColor(COLORS['text_light']))
-            painter.setFont(QFont("Arial", 14))
+            painter.setFont(self._empty_font)
             painter.drawText(self.rect(), Qt.AlignCenter,
                            "Enter comma-separated numbers to visualize sorting")
             return
         
-        w = self.width()
-        h = self.height()
-        n = len(self.array)
-        bar_w = max(8, w / (n * 1.6))
-        max_val = max(self.array) if self.array else 1
+        if self._layer is None:
+            self._rebuild()
+        painter.drawImage(0, 0, self._layer)
+
+
+class RaceLane(QWidget):
+    """
+    One algorithm's canvas and counters in a race
+    
+    A lane replays either a precomputed trace or steps from a live
+    background producer. It tracks how many elements already sit in their
+    final sorted position, which is what ranks the lanes.
+    """
+    
+    def __init__(self, name: str, arr: List[int], parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.target = sorted(arr)
+        self.array: List[int] = list(arr)
+        self.in_place = sum(a == t for a, t in zip(self.array, self.target))
+        self.trace: Optional[StepTrace] = None
+        self.producer: Optional[StepProducer] = None
+        self.position = 0
+        self.place = 0  # Finishing place, 0 while running
+        self._counters = OpCounters()
+        self._pending: Set[int] = set()
+        self._changed: Set[int] = set()
         
-        for i, val in enumerate(self.array):
-            x = 10 + i * (bar_w + 6)
-            bar_h = (val / max_val) * (h - 50) if max_val > 0 else 10
-            y = h - bar_h - 20
-            
-            # Color based on highlight
-            color = COLORS['bar_compare'] if i in self.highlights else COLORS['bar_default']
-            
-            painter.setBrush(QBrush(QColor(color)))
-            painter.setPen(QPen(QColor(COLORS['text']), 1))
-            painter.drawRect(int(x), int(y), int(bar_w), int(bar_h))
-            
-            # Draw value
-            painter.setPen(QColor(COLORS['text']))
-            painter.setFont(QFont("Arial", 9))
-            painter.drawText(int(x), int(y - 10), int(bar_w), 10,
-                           Qt.AlignCenter, str(val))
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+        self.label = QLabel(f"{name}: waiting for trace...")
+        self.label.setFont(QFont("Arial", 11, QFont.Bold))
+        layout.addWidget(self.label)
+        self.counter_label = QLabel("")
+        self.counter_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        layout.addWidget(self.counter_label)
+        self.canvas = SortingCanvas()
+        self.canvas.setMinimumSize(250, 150)
+        self.canvas.set_array(self.array)
+        layout.addWidget(self.canvas, 1)
+    
+    @property
+    def counters(self) -> OpCounters:
+        return self.producer.counters if self.producer is not None else self._counters
+    
+    @property
+    def loaded(self) -> bool:
+        return self.trace is not None or self.producer is not None
+    
+    @property
+    def progress(self) -> float:
+        """Fraction of elements in their final position"""
+        return self.in_place / len(self.target) if self.target else 1.0
+    
+    def load(self, trace: StepTrace):
+        """Feed the lane from a recorded trace"""
+        self.trace = trace
+    
+    def start_live(self, steps_fn):
+        """Feed the lane from a generator running on a worker thread"""
+        self.producer = StepProducer(steps_fn(list(self.array), delta=True)).start()
+    
+    def ready(self) -> bool:
+        """Whether the next step can be taken without waiting"""
+        return self.producer.ready if self.producer is not None else self.trace is not None
+    
+    def advance(self) -> bool:
+        """Apply the next step without repainting; False when the lane is done"""
+        if self.producer is not None:
+            step = self.producer.take()
+            if step is None:
+                return False
+        else:
+            if self.position >= len(self.trace):
+                return False
+            step = self.trace.step(self.position)
+            self._counters.record(step)
+        self.position += 1
+        target, array = self.target, self.array
+        for k, v in step[-1]:
+            self.in_place += (v == target[k]) - (array[k] == target[k])
+            array[k] = v
+            self._changed.add(k)
+        self._pending.update(SortingWidget._step_highlights(step))
+        return True
+    
+    def render(self, leader: bool):
+        """Repaint the canvas and status lines"""
+        highlights = () if self.place else self._pending
+        self.canvas.set_array(self.array, highlights, self._changed)
+        self._pending.clear()
+        self._changed.clear()
+        status = f"#{self.place} finished" if self.place else f"{self.progress:.0%} in place"
+        marker = "\u2605 " if leader else ""
+        self.label.setText(f"{marker}{self.name}: {status}")
+        self.label.setStyleSheet(f"color: {COLORS['primary'] if leader else COLORS['text']};")
+        self.counter_label.setText(self.counters.summary())
+    
+    def stop(self):
+        """Cancel a live producer"""
+        if self.producer is not None:
+            self.producer.cancel()
+
+
+class RaceView(QWidget):
+    """
+    Several algorithms sorting the same input side by side
+    
+    One Animation on the shared scheduler advances every lane by one step
+    per tick, so step counts are directly comparable, and renders all lanes
+    together once per frame.
+    """
+    
+    closed = Signal()
+    
+    def __init__(self, trace_service: TraceService, parent=None):
+        super().__init__(parent)
+        self.trace_service = trace_service
+        self.lanes: List[RaceLane] = []
+        self.futures: Dict[str, Future] = {}
+        # Lanes whose trace could not be recorded and that run live instead
+        self.failed: List[str] = []
+        self.leader: Optional[RaceLane] = None
+        self.animation = get_scheduler().register(
+            Animation(self._step, self._render, STEP_INTERVAL_MS, page=self))
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        header = QHBoxLayout()
+        self.status = QLabel("")
+        header.addWidget(self.status, 1)
+        header.addWidget(PlaybackControls(self.animation))
+        close_btn = QPushButton("Close Race")
+        close_btn.setMinimumHeight(35)
+        close_btn.clicked.connect(self.closed.emit)
+        header.addWidget(close_btn)
+        layout.addLayout(header)
+        self.grid = QGridLayout()
+        self.grid.setSpacing(12)
+        layout.addLayout(self.grid, 1)
+    
+    def start(self, names: List[str], arr: List[int], precompute: bool):
+        """
+        Race the given algorithms on one input
+        
+        Args:
+            names: Keys of SORTING_ALGORITHMS
+            arr: Shared input array
+            precompute: Record traces in worker processes first instead of
+                running live generators on background threads
+        """
+        self.stop()
+        for k, name in enumerate(names):
+            lane = RaceLane(name, arr)
+            self.lanes.append(lane)
+            self.grid.addWidget(lane, k // 2, k % 2)
+        if precompute:
+            self.futures = self.trace_service.submit(names, arr)
+            self.status.setText(f"Recording {len(names)} traces...")
+        else:
+            for lane in self.lanes:
+                lane.start_live(SORTING_ALGORITHMS[lane.name])
+            self.status.setText("Racing")
+        self.animation.play()
+    
+    def stop(self):
+        """Cancel pending work and remove the lanes"""
+        self.animation.pause()
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        self.failed = []
+        for lane in self.lanes:
+            lane.stop()
+            self.grid.removeWidget(lane)
+            lane.deleteLater()
+        self.lanes = []
+        self.leader = None
+    
+    def _step(self) -> Optional[bool]:
+        """Scheduler callback: advance every running lane by one step"""
+        if self.futures:
+            # Wait until every trace is back so all lanes start together
+            for name, future in list(self.futures.items()):
+                if future.done():
+                    lane = next(l for l in self.lanes if l.name == name)
+                    try:
+                        lane.load(StepTrace.from_bytes(future.result()))
+                    except Exception as e:
+                        # A failed worker or broken pool: race this lane live
+                        if isinstance(e, BrokenProcessPool):
+                            self.trace_service.shutdown()
+                        lane.start_live(SORTING_ALGORITHMS[name])
+                        self.failed.append(f"{name} ({type(e).__name__}: {e})")
+                    del self.futures[name]
+            if self.futures:
+                return None
+            self.status.setText(self._with_failures("Racing"))
+        
+        running = [lane for lane in self.lanes if not lane.place]
+        if not running:
+            return False
+        if not all(lane.ready() for lane in running):
+            # A live producer lags behind; hold everyone for fairness
+            return None
+        place = len(self.lanes) - len(running) + 1
+        for lane in running:
+            if not lane.advance():
+                lane.place = place
+        return True
+    
+    def _render(self):
+        """Scheduler callback: repaint all lanes once per frame"""
+        # Finished lanes rank by place, running ones by sorted progress, then
+        # by fewer operations
+        def rank(lane: RaceLane):
+            c = lane.counters
+            return (lane.place or len(self.lanes) + 1, -lane.progress,
+                    c.comparisons + c.writes)
+        self.leader = min(self.lanes, key=rank) if self.lanes else None
+        for lane in self.lanes:
+            lane.render(lane is self.leader)
+        if self.leader is not None:
+            done = all(lane.place for lane in self.lanes)
+            self.status.setText(self._with_failures(
+                f"{'Winner' if done else 'Leader'}: {self.leader.name}"))
+    
+    def _with_failures(self, text: str) -> str:
+        """Append a note about lanes whose trace recording failed"""
+        if not self.failed:
+            return text
+        return f"{text}  |  Trace recording failed, running live: {', '.join(self.failed)}"
 
 
 class SortingWidget(QWidget):
@@ -68,9 +481,31 @@ class SortingWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.sort_gen: Optional[Generator] = None
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.next_step)
+        self.sort_gen: Optional[StepProducer] = None
+        self.timeline: Optional[Timeline] = None
+        self.position = 0  # Number of timeline steps currently applied
+        self.counters = OpCounters()
+        self.array: List[int] = []
+        # Highlights of the steps applied since the last repaint
+        self._pending: Set[int] = set()
+        # Indices written since the last repaint
+        self._changed: Set[int] = set()
+        self.animation = get_scheduler().register(
+            Animation(self._animation_step, self._animation_render,
+                      STEP_INTERVAL_MS, page=self, on_finished=self._animation_finished))
+        # Race mode can record traces in worker processes
+        self.trace_service = TraceService()
+        QApplication.instance().aboutToQuit.connect(self.trace_service.shutdown)
+        # Step never blocks on the producer: it re-arms this timer instead
+        self._step_timer = QTimer(self)
+        self._step_timer.setSingleShot(True)
+        self._step_timer.setInterval(STEP_RETRY_MS)
+        self._step_timer.timeout.connect(self._advance)
+        # Pending trace export as (future, path)
+        self._export: Optional[Tuple[Future, str]] = None
+        self._export_timer = QTimer(self)
+        self._export_timer.setInterval(EXPORT_POLL_MS)
+        self._export_timer.timeout.connect(self._check_export)
         self.init_ui()
     
     def init_ui(self):
@@ -96,10 +531,15 @@ class SortingWidget(QWidget):
         controls.addWidget(self.input_field)
         
         self.algo_combo = QComboBox()
-        self.algo_combo.addItems(["Insertion", "Bubble", "Selection", "Merge"])
+        self.algo_combo.addItems(list(SORTING_ALGORITHMS))
         self.algo_combo.setMinimumHeight(35)  # Match input field height
         controls.addWidget(self.algo_combo)
         
+        back_btn = QPushButton("Back")
+        back_btn.clicked.connect(self.step_back)
+        back_btn.setMinimumHeight(35)
+        controls.addWidget(back_btn)
+        
         step_btn = QPushButton("Step")
         step_btn.clicked.connect(self.step_sort)
         step_btn.setMinimumHeight(35)
@@ -110,6 +550,26 @@ class SortingWidget(QWidget):
         run_btn.setMinimumHeight(35)
         controls.addWidget(run_btn)
         
+        turbo_btn = QPushButton("Turbo")
+        turbo_btn.setToolTip("Run to completion, repainting once per frame")
+        turbo_btn.clicked.connect(self.run_turbo)
+        turbo_btn.setMinimumHeight(35)
+        controls.addWidget(turbo_btn)
+        
+        self.playback = PlaybackControls(self.animation)
+        controls.addWidget(self.playback)
+        
+        race_btn = QPushButton("Race")
+        race_btn.setToolTip("Play several algorithms side by side on the same input")
+        race_btn.clicked.connect(self.run_race)
+        race_btn.setMinimumHeight(35)
+        controls.addWidget(race_btn)
+        
+        export_btn = QPushButton("Export Trace")
+        export_btn.clicked.connect(self.export_trace)
+        export_btn.setMinimumHeight(35)
+        controls.addWidget(export_btn)
+        
         code_btn = QPushButton("Show Code")
         code_btn.clicked.connect(self.show_code)
         code_btn.setMinimumHeight(35)
@@ -117,35 +577,57 @@ class SortingWidget(QWidget):
         
         layout.addLayout(controls)
         
-        # Canvas
+        # Timeline scrubber
+        timeline_layout = QHBoxLayout()
+        timeline_layout.setSpacing(8)
+        timeline_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, 0)
+        self.slider.valueChanged.connect(self.seek)
+        timeline_layout.addWidget(self.slider, 1)
+        
+        self.step_label = QLabel("Step 0 / 0")
+        self.step_label.setMinimumWidth(120)
+        timeline_layout.addWidget(self.step_label)
+        
+        self.counter_label = QLabel(self.counters.summary())
+        self.counter_label.setStyleSheet(f"color: {COLORS['text_light']};")
+        timeline_layout.addWidget(self.counter_label)
+        
+        layout.addLayout(timeline_layout)
+        
+        # Canvas, or the race lanes
+        self.views = QStackedWidget()
         self.canvas = SortingCanvas()
-        layout.addWidget(self.canvas, 1)  # Give canvas stretch factor
+        self.views.addWidget(self.canvas)
+        
+        self.race_view = RaceView(self.trace_service)
+        self.race_view.closed.connect(self.close_race)
+        self.views.addWidget(self.race_view)
+        
+        layout.addWidget(self.views, 1)  # Give canvas stretch factor
     
     def step_sort(self):
         """Perform one step of sorting"""
-        if self.sort_gen is None:
+        self.close_race()
+        if self.timeline is None or (self.sort_gen is None and
+                                     self.position >= len(self.timeline)):
             # Initialize generator
             arr = self._parse_input()
             if arr is None:
                 return
             
-            algo = self.algo_combo.currentText()
-            if algo == "Insertion":
-                self.sort_gen = insertion_steps(arr)
-            elif algo == "Bubble":
-                self.sort_gen = bubble_steps(arr)
-            elif algo == "Selection":
-                self.sort_gen = selection_steps(arr)
-            elif algo == "Merge":
-                self.sort_gen = merge_steps(arr)
-            else:
-                self.sort_gen = quick_steps(arr)
+            self._start_generator(arr)
         
-        try:
-            step = next(self.sort_gen)
-            self._handle_step(step)
-        except StopIteration:
-            self.sort_gen = None
+        self._advance()
+    
+    def step_back(self):
+        """Step one position back on the timeline"""
+        if self.timeline is not None:
+            self.animation.pause()
+            self._step_timer.stop()
+            self.seek(self.position - 1)
     
     def run_full(self):
         """Run full sorting with animation"""
@@ -153,31 +635,160 @@ class SortingWidget(QWidget):
         if arr is None:
             return
         
-        algo = self.algo_combo.currentText()
-        if algo == "Insertion":
-            self.sort_gen = insertion_steps(arr)
-        elif algo == "Bubble":
-            self.sort_gen = bubble_steps(arr)
-        elif algo == "Selection":
-            self.sort_gen = selection_steps(arr)
-        elif algo == "Merge":
-            self.sort_gen = merge_steps(arr)
+        self._start_generator(arr)
+        self.animation.interval_ms = STEP_INTERVAL_MS
+        self.animation.play()
+    
+    def run_turbo(self):
+        """Run to completion, draining as many steps as fit in each frame"""
+        arr = self._parse_input()
+        if arr is None:
+            return
+        
+        self._start_generator(arr)
+        self.animation.interval_ms = 0
+        self.animation.play()
+    
+    def _animation_step(self) -> Optional[bool]:
+        """Scheduler callback: apply one step without repainting"""
+        step = self._pull_step()
+        if step is None:
+            # None while the producer is still running but has nothing ready
+            return None if self.sort_gen is not None else False
+        self._pending.update(self._step_highlights(step))
+        self._changed.update(k for k, _ in step[-1])
+        return True
+    
+    def _animation_render(self):
+        """Scheduler callback: repaint once for all steps applied this frame"""
+        self.canvas.set_array(self.array, self._pending, self._changed)
+        self._pending.clear()
+        self._changed.clear()
+        self.counter_label.setText(self.counters.summary())
+        self._sync_timeline()
+    
+    def _animation_finished(self):
+        """Clear highlights once the run is complete"""
+        self._pending.clear()
+        self.animation.interval_ms = STEP_INTERVAL_MS
+        self.canvas.set_array(self.array, changed=self._changed)
+        self._changed.clear()
+        self.counter_label.setText(self.counters.summary())
+        self._sync_timeline()
+    
+    def seek(self, n: int):
+        """Show the array state after the first n steps of the current run"""
+        if self.timeline is None:
+            return
+        n = max(0, min(n, len(self.timeline)))
+        if n == self.position:
+            return
+        if n == self.position + 1:
+            # Plain forward step: apply one delta instead of seeking
+            self.position = n
+            self._handle_step(self.timeline.step(n - 1))
         else:
-            self.sort_gen = quick_steps(arr)
+            self.position = n
+            self.array = self.timeline.seek(n).tolist()
+            highlights = self._step_highlights(self.timeline.step(n - 1)) if n > 0 else []
+            self.canvas.set_array(self.array, highlights)
+        self._sync_timeline()
+    
+    def _pull_step(self):
+        """
+        Apply the next step to the array without repainting
+        
+        Never waits for the producer. If the generator raised, the run is
+        cancelled and the error reported.
         
-        self.timer.start(220)
+        Returns:
+            The step, or None at the end or if the producer has none ready
+        """
+        if self.timeline is None:
+            return None
+        if self.position < len(self.timeline):
+            step = self.timeline.step(self.position)
+        else:
+            if self.sort_gen is None:
+                return None
+            try:
+                step = self.sort_gen.take()
+            except Exception as e:
+                self._run_failed(e)
+                return None
+            if step is None:
+                if self.sort_gen.exhausted:
+                    self.sort_gen = None
+                return None
+            self.timeline.append(step)
+        self.position += 1
+        apply_delta(self.array, step[-1])
+        return step
     
-    def next_step(self):
-        """Timer callback for animation"""
-        try:
-            step = next(self.sort_gen)
-            self._handle_step(step)
-        except StopIteration:
-            self.timer.stop()
-            self.sort_gen = None
-    
-    def _parse_input(self) -> Optional[List[int]]:
-        """Parse input field to get array"""
+    def _run_failed(self, error: Exception):
+        """Cancel the run after its generator raised, and report the error"""
+        self.sort_gen.cancel()
+        self.sort_gen = None
+        self._step_timer.stop()
+        # Usually called from the scheduler tick: show the dialog after it returns
+        QTimer.singleShot(0, lambda: QMessageBox.warning(
+            self, "Sorting Failed", f"The sort stopped at step {self.position}: "
+                                    f"{type(error).__name__}: {error}"))
+    
+    def _advance(self) -> bool:
+        """
+        Move one step forward, pulling from the generator at the end of the timeline
+        
+        If the producer has no step ready yet, retry from a timer instead of
+        waiting on the GUI thread.
+        """
+        step = self._pull_step()
+        if step is None:
+            if self.sort_gen is not None:
+                self._step_timer.start()
+            return False
+        self.canvas.set_array(self.array, self._step_highlights(step),
+                              [k for k, _ in step[-1]])
+        self.counter_label.setText(self.counters.summary())
+        self._sync_timeline()
+        return True
+    
+    def _sync_timeline(self):
+        """Update the slider and step label without re-triggering a seek"""
+        total = len(self.timeline) if self.timeline is not None else 0
+        self.slider.blockSignals(True)
+        self.slider.setRange(0, total)
+        self.slider.setValue(self.position)
+        self.slider.blockSignals(False)
+        self.step_label.setText(f"Step {self.position} / {total}")
+    
+    def _start_generator(self, arr: List[int]):
+        """Start a background delta-mode producer and timeline for the selected algorithm"""
+        steps_fn = SORTING_ALGORITHMS.get(self.algo_combo.currentText(), quick_steps)
+        self.close_race()
+        if self.sort_gen is not None:
+            self.sort_gen.cancel()
+        self._step_timer.stop()
+        # Build the timeline first so a bad input fails before any thread starts
+        self.timeline = Timeline(arr)
+        self.array = list(arr)
+        self.sort_gen = StepProducer(steps_fn(arr, delta=True)).start()
+        self.counters = self.sort_gen.counters
+        self.counter_label.setText(self.counters.summary())
+        self.position = 0
+        self._pending.clear()
+        self._changed.clear()
+        self.canvas.set_array(self.array)
+        self._sync_timeline()
+    
+    def _parse_input(self, race: bool = False) -> Optional[List[int]]:
+        """
+        Parse input field to get array
+        
+        Args:
+            race: Input is for a race, so it is not checked against the
+                selected algorithm
+        """
         text = self.input_field.text().strip()
         if not text:
             QMessageBox.warning(self, "No Input", "Please enter numbers")
@@ -185,29 +796,133 @@ class SortingWidget(QWidget):
         
         try:
             arr = [int(x.strip()) for x in text.split(",") if x.strip()]
-            return arr
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter comma-separated integers")
             return None
+        out_of_range = next((x for x in arr if not VALUE_MIN <= x <= VALUE_MAX), None)
+        if out_of_range is not None:
+            QMessageBox.warning(self, "Invalid Input",
+                                f"{out_of_range} is out of range: values must fit in 64 bits "
+                                f"({VALUE_MIN} to {VALUE_MAX})")
+            return None
+        if not race and arr and self.algo_combo.currentText() == "Counting":
+            span, limit = max(arr) - min(arr), counting_span_limit(len(arr))
+            if span > limit:
+                QMessageBox.warning(self, "Invalid Input",
+                                    f"Counting sort needs a value range of at most {limit} "
+                                    f"for {len(arr)} values (got {span}); use a radix sort")
+                return None
+        return arr
     
     def _handle_step(self, step):
         """Handle a sorting step"""
+        apply_delta(self.array, step[-1])
+        self.canvas.set_array(self.array, self._step_highlights(step),
+                              [k for k, _ in step[-1]])
+    
+    @staticmethod
+    def _step_highlights(step) -> List[int]:
+        """Indices to highlight for a step"""
         typ = step[0]
-        arr = step[-1]
         highlights = []
         
         if typ == "compare":
             highlights = [step[1], step[2]]
         elif typ == "swap":
             highlights = [step[1], step[2]]
-        elif typ in ("shift", "key", "insert"):
+        elif typ in ("shift", "key", "insert", "scan", "place"):
             highlights = [step[1]]
         elif typ == "merge":
             highlights = list(range(step[1], step[3] + 1))
-        elif typ == "merged":
+        elif typ in ("merged", "run"):
             highlights = list(range(step[1], step[2] + 1))
         
-        self.canvas.set_array(arr, highlights)
+        return highlights
+    
+    def run_race(self):
+        """Play several algorithms side by side on the same input"""
+        arr = self._parse_input(race=True)
+        if arr is None:
+            return
+        names, precompute = self._choose_race_algorithms(len(arr))
+        if not names:
+            return
+        
+        self.animation.pause()
+        self.race_view.start(names, arr, precompute)
+        self.views.setCurrentIndex(1)
+    
+    def close_race(self):
+        """Stop the race and return to the single canvas"""
+        self.race_view.stop()
+        self.views.setCurrentIndex(0)
+    
+    def _choose_race_algorithms(self, n: int) -> Tuple[List[str], bool]:
+        """Ask which algorithms to race and whether to precompute their traces"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Race")
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Choose the algorithms to race:"))
+        algo_list = QListWidget()
+        for name in SORTING_ALGORITHMS:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if name in RACE_DEFAULT else Qt.Unchecked)
+            algo_list.addItem(item)
+        layout.addWidget(algo_list)
+        precompute = QCheckBox("Precompute traces in worker processes")
+        precompute.setChecked(n >= RACE_PRECOMPUTE_MIN)
+        layout.addWidget(precompute)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        if dialog.exec() != QDialog.Accepted:
+            return [], False
+        names = [algo_list.item(i).text() for i in range(algo_list.count())
+                 if algo_list.item(i).checkState() == Qt.Checked]
+        return names, precompute.isChecked()
+    
+    def export_trace(self):
+        """Record the full trace of the selected algorithm and export it in a worker process"""
+        if self._export is not None:
+            QMessageBox.warning(self, "Export Trace", "An export is already running")
+            return
+        arr = self._parse_input()
+        if arr is None:
+            return
+        
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "trace.csv",
+                                              "CSV Files (*.csv);;NumPy Archive (*.npz)")
+        if not path:
+            return
+        
+        name = self.algo_combo.currentText()
+        if name not in SORTING_ALGORITHMS:
+            name = "Quick"
+        self._export = (self.trace_service.submit_export(name, arr, path), path)
+        self._export_timer.start()
+    
+    def _check_export(self):
+        """Timer callback: report the pending export once its worker is done"""
+        future, path = self._export
+        if not future.done():
+            return
+        self._export_timer.stop()
+        self._export = None
+        try:
+            counts = future.result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self.trace_service.shutdown()
+            QMessageBox.warning(self, "Export Failed",
+                                f"Could not export {path}: {type(e).__name__}: {e}")
+            return
+        QMessageBox.information(self, "Trace Exported",
+                                f"Steps: {counts['steps']}\n"
+                                f"Comparisons: {counts['compare']}\n"
+                                f"Swaps: {counts['swap']}\n"
+                                f"Writes: {counts['write']}")
     
     def show_code(self):
         """Show code for selected algorithm"""
@@ -263,7 +978,74 @@ class SortingWidget(QWidget):
     left = [x for x in arr if x < pivot]
     middle = [x for x in arr if x == pivot]
     right = [x for x in arr if x > pivot]
-    return quick_sort(left) + middle + quick_sort(right)"""
+    return quick_sort(left) + middle + quick_sort(right)""",
+            
+            "Heap": """def heap_sort(arr):
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(arr, i, n)
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        sift_down(arr, 0, end)
+
+def sift_down(arr, root, size):
+    while 2 * root + 1 < size:
+        child = 2 * root + 1
+        if child + 1 < size and arr[child] < arr[child + 1]:
+            child += 1
+        if arr[root] >= arr[child]:
+            return
+        arr[root], arr[child] = arr[child], arr[root]
+        root = child""",
+            
+            "Shell": """def shell_sort(arr, gaps=(701, 301, 132, 57, 23, 10, 4, 1)):
+    n = len(arr)
+    for gap in gaps:
+        for i in range(gap, n):
+            key = arr[i]
+            j = i - gap
+            while j >= 0 and arr[j] > key:
+                arr[j + gap] = arr[j]
+                j -= gap
+            arr[j + gap] = key""",
+            
+            "Tim": """def tim_sort(arr):
+    # 1. Split into natural runs (reverse descending ones)
+    # 2. Extend short runs to minrun with binary insertion sort
+    # 3. Merge runs on a stack while keeping
+    #    len(A) > len(B) + len(C) and len(B) > len(C)
+    arr.sort()  # CPython's list.sort is Timsort""",
+            
+            "Counting": """def counting_sort(arr):
+    lo = min(arr)
+    counts = [0] * (max(arr) - lo + 1)
+    for v in arr:
+        counts[v - lo] += 1
+    k = 0
+    for offset, c in enumerate(counts):
+        for _ in range(c):
+            arr[k] = offset + lo
+            k += 1""",
+            
+            "Radix": """def radix_sort_lsd(arr, base=10):
+    lo = min(arr)
+    exp = 1
+    while (max(arr) - lo) // exp > 0:
+        buckets = [[] for _ in range(base)]
+        for v in arr:
+            buckets[(v - lo) // exp % base].append(v)
+        arr[:] = [v for b in buckets for v in b]
+        exp *= base""",
+            
+            "Bucket": """def bucket_sort(arr):
+    lo, hi = min(arr), max(arr)
+    count = max(1, int(len(arr) ** 0.5))
+    buckets = [[] for _ in range(count)]
+    for v in arr:
+        buckets[(v - lo) * count // (hi - lo + 1)].append(v)
+    arr[:] = [v for b in buckets for v in sorted(b)]"""
         }
         
-        QMessageBox.information(self, f"{algo} Sort Code", codes.get(algo, "Code not available"))
+        # Variants such as "Shell (Knuth)" share their family's code
+        code = codes.get(algo) or codes.get(algo.split(" (")[0], "Code not available")
+        QMessageBox.information(self, f"{algo} Sort Code", code)
@@ -27,6 +27,8 @@ COLORS = {
     'node_highlight': '#FBBF24',
     'node_path': '#10B981',
     'node_border': '#1F2937',
+    'node_red': '#DC2626',
+    'node_black': '#374151',
     
     # Graph colors
     'graph_node': '#34D399',